@@ -0,0 +1,90 @@
+"""
+    File name: benchmark_deletion.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Times the delete pipeline of My Tweet Reviewer GUI against the local stand-in for the Twitter API, on a synthetic
+    archive with every tweet marked for deletion, and writes the results as JSON. No display or network access is
+    needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+import my_tweet_reviewer_GUI as mtr
+from generate_tweetjs import write_tweetjs
+from mock_twitter_server import MockTwitterServer, start_in_thread
+
+USERNAME = "@benchmark"
+SAVED_FILENAME = "my_tweet_review.csv"
+ACCESS_TOKEN = "benchmark-token"
+
+
+# Mark every tweet of a synthetic archive for deletion and delete them through a mock server, then check every tweet
+# was recorded as deleted once the save file is loaded again.
+def run_deletion(tweet_count, max_connections, server_options, seed):
+    write_tweetjs(tweet_count, seed=seed)
+    session = mtr.TweetSession(USERNAME, saved_filename=SAVED_FILENAME)
+    session.load_df()
+    session.set_review_statuses(session.tweets_df.index, "delete")
+    server, api_url, stop_server = start_in_thread(MockTwitterServer(ACCESS_TOKEN, **server_options))
+    try:
+        report = mtr.TweetDeleter(session, ACCESS_TOKEN, api_url, max_connections).run()
+    finally:
+        stop_server()
+        session.purge_deleted_tweets()
+        session.close()
+    loaded_session = mtr.TweetSession(USERNAME, saved_filename=SAVED_FILENAME)
+    loaded_session.load_df()
+    recorded_deleted = len(loaded_session.deleted_tweets_df.index)
+    loaded_session.close()
+    return {"tweets": tweet_count, "max_connections": max_connections, "server": server_options,
+            "deletions_per_second": round((report["deleted"] + report["already_deleted"]) /
+                                          max(report["seconds"], 1e-9), 1),
+            "recorded_deleted": recorded_deleted, "report": report, "server_stats": server.stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the delete pipeline against a local mock server.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="numbers of tweets to delete")
+    parser.add_argument("--connections", type=int, default=mtr.TweetDeleter.MAX_CONNECTIONS,
+                        help="number of connections used by the pipeline")
+    parser.add_argument("--rate-limit", type=int, help="requests allowed by the server in each window")
+    parser.add_argument("--window", type=float, default=1.0, help="seconds in each rate limit window")
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds taken by the server to answer")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of requests failing with 503")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator")
+    parser.add_argument("--label", help="label stored with the results, such as the version being benchmarked")
+    parser.add_argument("--output", help="file to write the JSON results to, instead of standard output")
+    args = parser.parse_args()
+    server_options = {"rate_limit": args.rate_limit, "window_seconds": args.window, "latency": args.latency,
+                      "failure_rate": args.failure_rate, "seed": args.seed}
+    results = {"label": args.label, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "runs": []}
+    working_dir = os.getcwd()
+    for tweet_count in args.sizes:
+        # Each size is run in a folder of its own, as the program reads and writes its files in the current folder.
+        with tempfile.TemporaryDirectory(prefix="mtr_deletion_") as run_dir:
+            os.chdir(run_dir)
+            try:
+                results["runs"].append(run_deletion(tweet_count, args.connections, server_options, args.seed))
+            finally:
+                os.chdir(working_dir)
+        print("Benchmarked deleting {} tweets.".format(tweet_count), file=sys.stderr)
+    results_json = json.dumps(results, indent=2)
+    if args.output is None:
+        print(results_json)
+    else:
+        with open(args.output, mode='w', encoding="UTF-8") as results_file:
+            results_file.write(results_json + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+    File name: generate_tweetjs.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Writes a synthetic Twitter archive of any size, in the same format as the tweet.js file (and tweet-partN.js files)
+    of a downloaded archive, for benchmarking My Tweet Reviewer GUI.
+"""
+
+import argparse
+import datetime
+import json
+import random
+
+# Range of dates the tweets are spread over. Tweet IDs are created from the dates as Twitter does, which only applies
+# to tweets from November 2010 onwards.
+FIRST_TWEET_DATE = datetime.datetime(2011, 1, 1, tzinfo=datetime.timezone.utc)
+LAST_TWEET_DATE = datetime.datetime(2019, 7, 31, tzinfo=datetime.timezone.utc)
+TWITTER_EPOCH_MS = 1288834974657
+TWEETJS_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+# Words, emojis, hashtags and other accounts the text of the tweets is made from. Hashtags are picked with a Zipf
+# distribution, so a few hashtags are in many tweets and most are in only a few, as in a real archive.
+WORDS = ["the", "a", "to", "and", "of", "in", "is", "for", "on", "that", "this", "with", "it", "you", "my", "at", "be",
+         "just", "so", "was", "have", "new", "today", "great", "day", "time", "love", "good", "happy", "birthday",
+         "thanks", "work", "weekend", "coffee", "game", "news", "python", "data", "morning", "night", "week", "really",
+         "think", "people", "what", "about", "can't", "wait", "watching", "reading", "café", "naïve", "über"]
+EMOJIS = ["\U0001F600", "\U0001F602", "\U0001F60D", "\U0001F44D", "\U0001F389", "❤️", "\U0001F525",
+          "\U0001F914", "\U0001F64C", "☀️", "\U0001F1EC\U0001F1E7"]
+HASHTAGS = ["FF", "ThrowbackThursday", "Python", "MondayMotivation", "News", "DataScience", "TBT", "WorldCup",
+            "Coffee", "Weekend"] + ["Topic{}".format(number) for number in range(490)]
+HASHTAG_WEIGHTS = [1 / rank for rank in range(1, len(HASHTAGS) + 1)]
+HASHTAG_COUNT_WEIGHTS = [0.6, 0.25, 0.1, 0.05]
+MENTIONS = ["user{}".format(number) for number in range(200)]
+# Fraction of tweets which are replies or retweets, and which contain emojis.
+REPLY_FRACTION = 0.2
+RETWEET_FRACTION = 0.15
+EMOJI_FRACTION = 0.3
+SOURCES = ['<a href="http://twitter.com/download/android" rel="nofollow">Twitter for Android</a>',
+           '<a href="http://twitter.com/download/iphone" rel="nofollow">Twitter for iPhone</a>',
+           '<a href="https://mobile.twitter.com" rel="nofollow">Twitter Web App</a>']
+
+
+# Create the text of a tweet along with its hashtags and the positions of the hashtags in the text.
+def tweet_text(rng):
+    words = rng.choices(WORDS, k=rng.randint(3, 25))
+    if rng.random() < EMOJI_FRACTION:
+        for _ in range(rng.randint(1, 3)):
+            words.insert(rng.randint(0, len(words)), rng.choice(EMOJIS))
+    roll = rng.random()
+    if roll < REPLY_FRACTION:
+        words.insert(0, "@" + rng.choice(MENTIONS))
+    elif roll < REPLY_FRACTION + RETWEET_FRACTION:
+        words[0:0] = ["RT", "@" + rng.choice(MENTIONS) + ":"]
+    text = " ".join(words)
+    hashtags = []
+    hashtag_count = rng.choices(range(len(HASHTAG_COUNT_WEIGHTS)), weights=HASHTAG_COUNT_WEIGHTS)[0]
+    for hashtag in rng.choices(HASHTAGS, weights=HASHTAG_WEIGHTS, k=hashtag_count):
+        text += " "
+        hashtags.append({"text": hashtag, "indices": [str(len(text)), str(len(text) + len(hashtag) + 1)]})
+        text += "#" + hashtag
+    return text[:280], [hashtag for hashtag in hashtags if int(hashtag["indices"][1]) <= 280]
+
+
+# Create the tweets of an archive, most recent first as in tweet.js, with the fields found in a downloaded archive.
+def generate_tweets(tweet_count, seed=0):
+    rng = random.Random(seed)
+    first_ms = int(FIRST_TWEET_DATE.timestamp() * 1000)
+    last_ms = int(LAST_TWEET_DATE.timestamp() * 1000)
+    for created_ms in sorted((rng.randint(first_ms, last_ms) for _ in range(tweet_count)), reverse=True):
+        tweet_id = str(((created_ms - TWITTER_EPOCH_MS) << 22) | rng.getrandbits(22))
+        text, hashtags = tweet_text(rng)
+        created = datetime.datetime.fromtimestamp(created_ms / 1000, tz=datetime.timezone.utc)
+        yield {"retweeted": False, "source": rng.choice(SOURCES),
+               "entities": {"hashtags": hashtags, "symbols": [], "user_mentions": [], "urls": []},
+               "display_text_range": ["0", str(len(text))], "favorite_count": str(rng.randint(0, 50)),
+               "id_str": tweet_id, "truncated": False, "retweet_count": str(rng.randint(0, 10)), "id": tweet_id,
+               "created_at": created.strftime(TWEETJS_DATE_FORMAT), "favorited": False, "full_text": text,
+               "lang": "en"}
+
+
+# Write the tweets to tweet.js, or split them evenly over tweet.js, tweet-part1.js, tweet-part2.js... as in the archive
+# of a large account. Returns the names of the files written.
+def write_tweetjs(tweet_count, parts=1, seed=0, indent=2):
+    tweets = generate_tweets(tweet_count, seed)
+    tweetjs_filenames = []
+    for part in range(parts):
+        tweetjs_filename = "tweet.js" if part == 0 else "tweet-part{}.js".format(part)
+        part_count = tweet_count // parts + (1 if part < tweet_count % parts else 0)
+        with open(tweetjs_filename, mode='w', encoding="UTF-8") as tweetjs_file:
+            tweetjs_file.write("window.YTD.tweet.part{} = [ ".format(part))
+            for number in range(part_count):
+                if number:
+                    tweetjs_file.write(", ")
+                tweetjs_file.write(json.dumps(next(tweets), indent=indent))
+            tweetjs_file.write(" ]")
+        tweetjs_filenames.append(tweetjs_filename)
+    return tweetjs_filenames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic tweet.js archive in the current folder.")
+    parser.add_argument("tweet_count", type=int, help="number of tweets to write")
+    parser.add_argument("--parts", type=int, default=1, help="number of files to split the archive over")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator")
+    parser.add_argument("--indent", type=int, default=2, help="indent of the JSON, as in a downloaded archive")
+    args = parser.parse_args()
+    for tweetjs_filename in write_tweetjs(args.tweet_count, args.parts, args.seed, args.indent):
+        print(tweetjs_filename)
+
+
+if __name__ == "__main__":
+    main()
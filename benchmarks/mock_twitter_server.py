@@ -0,0 +1,170 @@
+"""
+    File name: mock_twitter_server.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Local stand-in for the tweet deletion endpoint of the Twitter API (DELETE /2/tweets/<id>), for testing and
+    benchmarking the delete pipeline of My Tweet Reviewer GUI offline. It keeps connections open between requests,
+    checks the access token, enforces a rate limit and can add latency and failures.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+
+DELETE_PATH = re.compile(r"/2/tweets/(\d+)$")
+REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 429: "Too Many Requests",
+           503: "Service Unavailable"}
+
+
+class MockTwitterServer:
+    # Stand-in for the deletion endpoint. Allows rate_limit requests in each window of window_seconds, answering the
+    # rest with 429 and a Retry-After header, waits latency seconds before answering each request and fails a fraction
+    # of the requests given by failure_rate with 503. A tweet can only be deleted once, after which it is not found.
+    def __init__(self, access_token="test-token", rate_limit=None, window_seconds=1.0, latency=0.0, failure_rate=0.0,
+                 seed=0):
+        self.access_token = access_token
+        self.rate_limit = rate_limit
+        self.window_seconds = window_seconds
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.deleted_tweet_ids = set()
+        self.window_start = time.monotonic()
+        self.window_requests = 0
+        self.stats = {"requests": 0, "deleted": 0, "not_found": 0, "rate_limited": 0, "failed": 0, "unauthorized": 0,
+                      "connections": 0}
+        self.server = None
+
+    # Start listening for connections, returning the URL the deletion endpoint is at.
+    async def start(self, host="127.0.0.1", port=0):
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return "http://{}:{}/2/tweets/".format(host, port)
+
+    # Stop listening for connections.
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    # Answer the requests sent on a connection until the client closes it.
+    async def handle_connection(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    header_line = await reader.readline()
+                    if not header_line.strip():
+                        break
+                    name, _, value = header_line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                await reader.readexactly(int(headers.get("content-length", 0)))
+                method, target = request_line.decode("latin-1").split()[:2]
+                status, response_headers, body = await self.respond(method, target, headers)
+                writer.write(("HTTP/1.1 {} {}\r\nContent-Type: application/json\r\nContent-Length: {}\r\n{}\r\n"
+                              .format(status, REASONS[status], len(body),
+                                      "".join("{}: {}\r\n".format(name, value)
+                                              for name, value in response_headers.items()))).encode("latin-1") + body)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    # Work out the response to a request, as a status, extra headers and a body.
+    async def respond(self, method, target, headers):
+        self.stats["requests"] += 1
+        now = time.monotonic()
+        if now - self.window_start >= self.window_seconds:
+            self.window_start = now
+            self.window_requests = 0
+        self.window_requests += 1
+        if self.rate_limit is not None and self.window_requests > self.rate_limit:
+            self.stats["rate_limited"] += 1
+            retry_after = max(math.ceil(self.window_start + self.window_seconds - now), 0)
+            return 429, {"Retry-After": retry_after}, self.error_body("Too Many Requests")
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        match = DELETE_PATH.match(target)
+        if method != "DELETE" or match is None:
+            return 400, {}, self.error_body("Unsupported request")
+        if headers.get("authorization") != "Bearer " + self.access_token:
+            self.stats["unauthorized"] += 1
+            return 401, {}, self.error_body("Unauthorized")
+        if self.failure_rate and self.rng.random() < self.failure_rate:
+            self.stats["failed"] += 1
+            return 503, {}, self.error_body("Service Unavailable")
+        tweet_id = match.group(1)
+        if tweet_id in self.deleted_tweet_ids:
+            self.stats["not_found"] += 1
+            return 404, {}, self.error_body("Not Found")
+        self.deleted_tweet_ids.add(tweet_id)
+        self.stats["deleted"] += 1
+        return 200, {}, json.dumps({"data": {"deleted": True}}).encode("UTF-8")
+
+    # Body of an error response.
+    @staticmethod
+    def error_body(title):
+        return json.dumps({"title": title}).encode("UTF-8")
+
+
+# Run a server in an event loop of its own in a background thread, so it can be used by code that runs its own event
+# loop. Returns the server, the URL of the deletion endpoint and a function which stops the server.
+def start_in_thread(server, host="127.0.0.1", port=0):
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    urls = []
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        urls.append(loop.run_until_complete(server.start(host, port)))
+        started.set()
+        loop.run_forever()
+        loop.run_until_complete(server.stop())
+        loop.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    started.wait()
+
+    def stop():
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    return server, urls[0], stop
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Twitter API tweet deletion endpoint.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("--access-token", default="test-token", help="access token requests must be sent with")
+    parser.add_argument("--rate-limit", type=int, help="requests allowed in each window")
+    parser.add_argument("--window", type=float, default=1.0, help="seconds in each rate limit window")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds taken to answer each request")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of requests which fail with 503")
+    args = parser.parse_args()
+    server = MockTwitterServer(args.access_token, args.rate_limit, args.window, args.latency, args.failure_rate)
+    loop = asyncio.new_event_loop()
+    print("Listening at {}".format(loop.run_until_complete(server.start(args.host, args.port))))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.stats))
+        loop.run_until_complete(server.stop())
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+    File name: run_benchmarks.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Times each stage of My Tweet Reviewer GUI, and records the peak memory allocated by it, on synthetic archives of
+    several sizes. The stages are run through TweetSession without opening any windows, so no display is needed, and
+    the results are written as JSON so they can be compared between versions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+import numpy as np
+import pandas as pd
+import my_tweet_reviewer_GUI as mtr
+from generate_tweetjs import HASHTAGS, write_tweetjs
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+USERNAME = "@benchmark"
+SAVED_FILENAME = "my_tweet_review.csv"
+# The most common hashtags are excluded, as a user would exclude tweets about a regular topic.
+EXCLUDED_HASHTAGS = HASHTAGS[:2]
+# Every third tweet reviewed is marked for deletion and the rest are kept.
+DELETE_EVERY = 3
+
+
+# Run a stage, timing it and, if trace_memory is set, recording the peak memory allocated while it runs. The stage
+# returns the number of rows it processed. Memory allocated in worker processes is not traced.
+def measure(stage, trace_memory):
+    if trace_memory:
+        tracemalloc.start()
+    start_time = time.perf_counter()
+    rows = stage()
+    seconds = time.perf_counter() - start_time
+    peak_bytes = None
+    if trace_memory:
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"seconds": round(seconds, 4), "peak_bytes": peak_bytes, "rows": rows}
+
+
+# Step through every tweet awaiting review as the Review Tweets window does, showing each tweet and then updating its
+# review status and the count of tweets awaiting review.
+def review_pass(session):
+    tweet_queue = mtr.TweetQueue(session.tweets_df.index[(session.tweets_df["tweet_review_status"] == "none")
+                                                         .to_numpy()])
+    reviewed = 0
+    row_index = tweet_queue.next()
+    while row_index is not None:
+        session.tweets_df.at[row_index, "tweet_review_status"]
+        session.tweets_df.at[row_index, "tweet_text"]
+        session.set_review_status(row_index, "delete" if reviewed % DELETE_EVERY == 0 else "keep")
+        tweet_queue.mark_finished(row_index)
+        session.status_counts.count(review_status="none")
+        reviewed += 1
+        row_index = tweet_queue.next()
+    return reviewed
+
+
+# Step through every tweet awaiting deletion as the Delete Tweets window does, creating its URL and then marking it as
+# deleted and updating the count of tweets awaiting deletion.
+def delete_pass(session):
+    tweet_queue = mtr.TweetQueue(session.tweets_df.index[((session.tweets_df["tweet_review_status"] == "delete") &
+                                                          ~session.tweets_df["tweet_url_visited"]).to_numpy()])
+    deleted = 0
+    row_index = tweet_queue.next()
+    while row_index is not None:
+        session.tweets_df.at[row_index, "tweet_text"]
+        session.tweet_url(row_index)
+        session.set_deleted(row_index, True)
+        tweet_queue.mark_finished(row_index)
+        session.status_counts.count(review_status="delete", url_visited=False)
+        deleted += 1
+        row_index = tweet_queue.next()
+    return deleted
+
+
+# Run every stage on a synthetic archive of tweet_count tweets, in the current folder.
+def run_stages(tweet_count, parts, seed, trace_memory):
+    stages = {}
+    start_time = time.perf_counter()
+    write_tweetjs(tweet_count, parts, seed)
+    generate_seconds = round(time.perf_counter() - start_time, 4)
+    session = mtr.TweetSession(USERNAME, EXCLUDED_HASHTAGS, SAVED_FILENAME)
+    tweets_columns = {}
+
+    def import_stage():
+        tweets_columns.update(session.import_raw_tweets_data())
+        return len(tweets_columns["tweet_id"])
+
+    def build_stage():
+        tweets_df, hashtags_df = session.create_tweet_df(tweets_columns)
+        return len(tweets_df.index)
+
+    stages["import"] = measure(import_stage, trace_memory)
+    stages["build"] = measure(build_stage, trace_memory)
+    tweets_columns.clear()
+    # The first load imports the archive again, builds the indexes and writes the save file.
+    stages["first_load"] = measure(lambda: len(session.load_df().index), trace_memory)
+
+    def filter_stage():
+        session.set_excluded_hashtags(EXCLUDED_HASHTAGS)
+        return len(session.tweets_df.index) + len(session.excluded_tweets_df.index)
+
+    stages["filter"] = measure(filter_stage, trace_memory)
+    stages["review_pass"] = measure(lambda: review_pass(session), trace_memory)
+    stages["delete_pass"] = measure(lambda: delete_pass(session), trace_memory)
+    stages["purge"] = measure(session.purge_deleted_tweets, trace_memory)
+
+    def save_stage():
+        session.save_df()
+        session.close()
+        return len(session.snapshot_df().index)
+
+    stages["save"] = measure(save_stage, trace_memory)
+    loaded_session = mtr.TweetSession(USERNAME, EXCLUDED_HASHTAGS, SAVED_FILENAME)
+    stages["load"] = measure(lambda: len(loaded_session.load_df().index), trace_memory)
+    loaded_session.close()
+    return {"tweets": tweet_count, "parts": parts, "generate_seconds": generate_seconds,
+            "tweetjs_bytes": sum(os.path.getsize(tweetjs_filename) for tweetjs_filename in session.tweetjs_filenames()),
+            "stages": stages}
+
+
+# Describe the versions the benchmarks were run with.
+def environment():
+    return {"python": platform.python_version(), "pandas": pd.__version__, "numpy": np.__version__,
+            "pyarrow": mtr.pa.__version__ if mtr.pa is not None else None, "platform": platform.platform(),
+            "cpu_count": os.cpu_count()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark My Tweet Reviewer GUI on synthetic archives.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of tweets to run with")
+    parser.add_argument("--parts", type=int, default=1, help="number of files to split each archive over")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="don't trace memory, which slows down the stages being timed")
+    parser.add_argument("--label", help="label stored with the results, such as the version being benchmarked")
+    parser.add_argument("--output", help="file to write the JSON results to, instead of standard output")
+    args = parser.parse_args()
+    results = {"label": args.label, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "environment": environment(),
+               "trace_memory": not args.no_memory, "runs": []}
+    working_dir = os.getcwd()
+    for tweet_count in args.sizes:
+        # Each size is run in a folder of its own, as the program reads and writes its files in the current folder.
+        with tempfile.TemporaryDirectory(prefix="mtr_benchmark_") as run_dir:
+            os.chdir(run_dir)
+            try:
+                results["runs"].append(run_stages(tweet_count, args.parts, args.seed, not args.no_memory))
+            finally:
+                os.chdir(working_dir)
+        print("Benchmarked {} tweets.".format(tweet_count), file=sys.stderr)
+    results_json = json.dumps(results, indent=2)
+    if args.output is None:
+        print(results_json)
+    else:
+        with open(args.output, mode='w', encoding="UTF-8") as results_file:
+            results_file.write(results_json + "\n")
+
+
+if __name__ == "__main__":
+    main()
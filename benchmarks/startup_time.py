@@ -0,0 +1,83 @@
+"""
+    File name: startup_time.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Reports where the time goes when My Tweet Reviewer GUI starts: the time taken to import the program in a fresh
+    interpreter, the modules taking longest to import, which large libraries are imported before the main window can
+    be shown and how long each takes to import when the data is first loaded. No display is needed.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Libraries which are only needed once the data is loaded.
+DATA_LIBRARIES = ["numpy", "pandas", "pyarrow", "asyncio", "concurrent.futures"]
+# Imports the program and then each of the data libraries through it, in the order loading the data does, reporting
+# the time taken by each and the libraries imported by the program itself.
+STARTUP_SCRIPT = """
+import json, sys, time
+start_time = time.perf_counter()
+import my_tweet_reviewer_GUI as mtr
+timings = {"import_program": time.perf_counter() - start_time}
+imported_libraries = [name for name in %r if name in sys.modules]
+for global_name in ["np", "pd", "pa", "asyncio", "futures"]:
+    lazy_module = getattr(mtr, global_name)
+    if isinstance(lazy_module, mtr.LazyModule):
+        start_time = time.perf_counter()
+        lazy_module.import_module()
+        timings["import " + lazy_module.module_name] = time.perf_counter() - start_time
+print(json.dumps({"timings": timings, "imported_with_program": imported_libraries}))
+""" % DATA_LIBRARIES
+
+
+# Run Python in a fresh interpreter, in the folder of the program, returning what it writes to standard output and to
+# standard error.
+def run_python(arguments):
+    completed = subprocess.run([sys.executable] + arguments, cwd=PACKAGE_DIR, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    return completed.stdout, completed.stderr
+
+
+# Import the program with Python's import time report turned on, returning the modules imported directly by the
+# program with the cumulative microseconds taken by each, slowest first.
+def program_imports():
+    _, import_report = run_python(["-X", "importtime", "-c", "import my_tweet_reviewer_GUI"])
+    imports = []
+    for line in import_report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module_name = line[len("import time:"):].split("|")
+        # Keep the program and its own imports, which are indented by one level more than the program.
+        if cumulative.strip().isdigit() and (module_name.strip() == "my_tweet_reviewer_GUI" or
+                                             (module_name.startswith("   ") and not module_name.startswith("    "))):
+            imports.append({"module": module_name.strip(), "microseconds": int(cumulative)})
+    return sorted(imports, key=lambda module_import: module_import["microseconds"], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the startup time of My Tweet Reviewer GUI.")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to time the import in")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to report")
+    parser.add_argument("--output", help="file to write the JSON results to, instead of standard output")
+    args = parser.parse_args()
+    runs = [json.loads(run_python(["-c", STARTUP_SCRIPT])[0]) for _ in range(args.runs)]
+    # The fastest of the runs is reported for each timing, as the others include noise from the rest of the system.
+    timings = {stage: round(min(run["timings"][stage] for run in runs), 4) for stage in runs[0]["timings"]}
+    results = {"python": sys.version.split()[0], "runs": args.runs, "seconds": timings,
+               "imported_with_program": runs[0]["imported_with_program"],
+               "slowest_imports": program_imports()[:args.top]}
+    results_json = json.dumps(results, indent=2)
+    if args.output is None:
+        print(results_json)
+    else:
+        with open(args.output, mode='w', encoding="UTF-8") as results_file:
+            results_file.write(results_json + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,1803 @@
     Python Version: 3.7.3
 """
 
+from collections import Counter, defaultdict
+import functools
+import hashlib
+import importlib
+import importlib.util
+from itertools import chain, compress, repeat
 import json
-import pandas as pd
+import os
+import queue
+import re
+import ssl
 from os import path
 import sys
+import threading
+import time
+import tracemalloc
 import webbrowser
+from urllib.parse import urlsplit
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
+
+
+class LazyModule:
+    # Stand-in for a module which is only imported when one of its attributes is first used, so the main window can be
+    # shown without waiting for large libraries such as pandas to be imported. The data is loaded in the background, so
+    # that is where they are usually imported. Once imported, the module takes the place of the stand-in in the
+    # globals of this module, so later uses go straight to the module.
+    def __init__(self, module_name, global_name):
+        self.module_name = module_name
+        self.global_name = global_name
+        self.module = None
+
+    # Import the module the first time one of its attributes is used.
+    def __getattr__(self, name):
+        return getattr(self.import_module(), name)
+
+    # Import the module, recording how long it took as part of the startup report.
+    def import_module(self):
+        if self.module is None:
+            start_time = time.perf_counter()
+            module = importlib.import_module(self.module_name)
+            if self.module is None:
+                self.module = module
+                globals()[self.global_name] = module
+                if instrumentation.enabled:
+                    instrumentation.record_elapsed("import " + self.module_name, start_time)
+        return self.module
+
+
+asyncio = LazyModule("asyncio", "asyncio")
+futures = LazyModule("concurrent.futures", "futures")
+np = LazyModule("numpy", "np")
+pd = LazyModule("pandas", "pd")
+# The save file is written in the Parquet format if pyarrow is installed, or in NumPy's .npz format if it isn't.
+if importlib.util.find_spec("pyarrow") is not None:
+    pa = LazyModule("pyarrow", "pa")
+    pq = LazyModule("pyarrow.parquet", "pq")
+else:
+    pa = None
+    pq = None
+# Time the module finished being imported, from which the time taken to show the main window is measured.
+MODULE_IMPORTED_TIME = time.perf_counter()
+
+
+class Instrumentation:
+    # Number of recent records kept in memory for the diagnostics window.
+    RECENT_RECORDS = 1000
+
+    # Opt-in recorder of the wall time, row count and peak memory of the slowest stages of the program, such as loading
+    # the data and the handlers of the review and delete windows. Stages are wrapped with instrumented, which only
+    # checks whether recording is turned on until it is. Records are kept for the diagnostics window and appended to a
+    # JSON lines log file.
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.log_filename = None
+        self.records = []
+        self.lock = threading.Lock()
+        # Stages being run by each thread, innermost last, so stages run within other stages are recorded as such.
+        self.local = threading.local()
+        # Thread whose stages are having their memory measured, if any.
+        self.memory_thread = None
+
+    # Start recording, appending the records to a log file if one is given. With trace_memory the peak memory allocated
+    # by each stage is measured with tracemalloc, which slows down the program while it is recording. The peak traced by
+    # tracemalloc is shared by every thread, so memory is only measured for the stages of one thread at a time: stages
+    # started by another thread while they run, such as handlers of the windows while the data loads in the
+    # background, are recorded without their peak memory.
+    def enable(self, log_filename=None, trace_memory=True):
+        self.log_filename = log_filename
+        self.trace_memory = trace_memory
+        self.enabled = True
+
+    # Stop recording.
+    def disable(self):
+        self.enabled = False
+
+    # Decorator recording each call of a function as a stage. The number of rows is found by calling rows with the
+    # first argument of the function, such as the session or window, and the result. By default it is the number of
+    # tweets held by the first argument.
+    def instrumented(self, stage, rows=None):
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                return self.record(stage, rows, function, args, kwargs)
+            return wrapper
+        return decorator
+
+    # Check if the memory of a stage starting in the current thread can be measured, given the stages the thread is
+    # already running. The thread takes over measuring memory when its outermost stage starts, if no other thread is
+    # measuring it.
+    def claim_memory(self, stack):
+        with self.lock:
+            if self.memory_thread is None and not len(stack):
+                self.memory_thread = threading.get_ident()
+            return self.memory_thread == threading.get_ident()
+
+    # Run a function as a stage and record it.
+    def record(self, stage, rows, function, args, kwargs):
+        stack = self.local.__dict__.setdefault("stack", [])
+        trace_memory = self.trace_memory and self.claim_memory(stack)
+        if trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.local.started_tracing = True
+            traced_memory, peak_memory = tracemalloc.get_traced_memory()
+            # Keep the highest memory reached by the enclosing stage before the peak is reset for this one. Without
+            # reset_peak (before Python 3.9) the peaks of stages within other stages include the memory reached before
+            # they started.
+            if len(stack):
+                stack[-1]["peak_memory"] = max(stack[-1]["peak_memory"], peak_memory)
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        else:
+            traced_memory = 0
+        frame = {"stage": stage, "start_memory": traced_memory, "peak_memory": traced_memory}
+        stack.append(frame)
+        started = time.time()
+        start_time = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start_time
+            stack.pop()
+            peak_bytes = None
+            if trace_memory and tracemalloc.is_tracing():
+                frame["peak_memory"] = max(frame["peak_memory"], tracemalloc.get_traced_memory()[1])
+                peak_bytes = frame["peak_memory"] - frame["start_memory"]
+                if len(stack):
+                    stack[-1]["peak_memory"] = max(stack[-1]["peak_memory"], frame["peak_memory"])
+                elif self.local.__dict__.pop("started_tracing", False):
+                    tracemalloc.stop()
+            if trace_memory and not len(stack):
+                with self.lock:
+                    self.memory_thread = None
+        if rows is not None:
+            row_count = rows(args[0] if len(args) else None, result)
+        elif len(args) and getattr(args[0], "tweets_df", None) is not None:
+            row_count = len(args[0].tweets_df.index)
+        else:
+            row_count = None
+        self.add_record({"stage": stage, "started": round(started, 3), "seconds": round(seconds, 6), "rows": row_count,
+                         "peak_bytes": peak_bytes, "depth": len(stack),
+                         "parent": stack[-1]["stage"] if len(stack) else None})
+        return result
+
+    # Record a stage that isn't wrapped with instrumented, which started at start_time (from time.perf_counter) and has
+    # just finished.
+    def record_elapsed(self, stage, start_time):
+        seconds = time.perf_counter() - start_time
+        self.add_record({"stage": stage, "started": round(time.time() - seconds, 3), "seconds": round(seconds, 6),
+                         "rows": None, "peak_bytes": None, "depth": 0, "parent": None})
+
+    # Keep a record for the diagnostics window and append it to the log file.
+    def add_record(self, record):
+        with self.lock:
+            self.records.append(record)
+            del self.records[:-self.RECENT_RECORDS]
+            if self.log_filename is not None:
+                with open(self.log_filename, mode='a', encoding="UTF-8") as log_file:
+                    log_file.write(json.dumps(record) + "\n")
+
+    # Total time, number of calls and largest row count and peak memory of each stage recorded, slowest first.
+    def summary(self):
+        with self.lock:
+            records = list(self.records)
+        stages = {}
+        for record in records:
+            stage = stages.setdefault(record["stage"], {"stage": record["stage"], "calls": 0, "seconds": 0.0,
+                                                        "max_seconds": 0.0, "rows": None, "peak_bytes": None})
+            stage["calls"] += 1
+            stage["seconds"] += record["seconds"]
+            stage["max_seconds"] = max(stage["max_seconds"], record["seconds"])
+            for key in ["rows", "peak_bytes"]:
+                if record[key] is not None:
+                    stage[key] = max(stage[key] or 0, record[key])
+        return sorted(stages.values(), key=lambda stage: stage["seconds"], reverse=True)
+
+
+# Recorder shared by every stage of the program, which is turned off unless main is asked for diagnostics.
+instrumentation = Instrumentation()
+
+
+class HashtagIndex:
+    # Inverted index from each lowercase hashtag to the sorted row labels of the tweets containing it. Built once from
+    # the tweets and long-form hashtags DataFrames so excluding or finding tweets by hashtag never rescans the data.
+    def __init__(self, tweets_df, hashtags_df):
+        # Find the row label of the tweet each hashtag belongs to, ignoring hashtags of tweets not in the DataFrame.
+        tweet_positions = pd.Index(tweets_df["tweet_id"]).get_indexer(hashtags_df["tweet_id"])
+        found = tweet_positions != -1
+        hashtag_rows = tweets_df.index.to_numpy()[tweet_positions[found]]
+        hashtags = hashtags_df["hashtag"].to_numpy()[found]
+        # Group the row labels by hashtag in a single pass.
+        self.postings = {hashtag: np.unique(hashtag_rows[positions]) for hashtag, positions in
+                         pd.Series(hashtag_rows).groupby(hashtags).indices.items()}
+
+    # Row labels of the tweets containing the hashtag.
+    def rows_with(self, hashtag):
+        return self.postings.get(hashtag.lower(), np.empty(0, dtype=np.int64))
+
+    # Row labels of the tweets containing any of the hashtags.
+    def rows_with_any(self, hashtags):
+        posting_lists = [self.rows_with(hashtag) for hashtag in hashtags]
+        if not len(posting_lists):
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(posting_lists))
+
+
+class TextIndex:
+    # Characters making up the words of the tweet text, which is already reduced to ASCII.
+    WORD_PATTERN = re.compile(r"[a-z0-9_]+")
+    # Characters which separate the words of a phrase.
+    WORD_SEPARATOR = r"[^a-z0-9_]+"
+
+    # Inverted index from each lowercase word in the tweet text, and from each pair of words next to each other, to the
+    # sorted row labels of the tweets containing it. The words are kept in a sorted array, with the row labels of all
+    # words in a single array and the offset in that array of each word's row labels, so words starting with a prefix
+    # are found with a binary search and their row labels are next to each other. Pairs of words are kept in the same
+    # way, keyed by the positions of the two words in the array of words. The index is built from a Series of tweet text
+    # indexed by row label, or from the arrays of an index which has been saved.
+    def __init__(self, tweet_texts, words=None, word_offsets=None, word_rows=None, pair_keys=None, pair_offsets=None,
+                 pair_rows=None):
+        self.tweet_texts = tweet_texts
+        if words is None:
+            # Find the words of each tweet, numbering each word by its position in the sorted array of words. The text
+            # is lowered one tweet at a time, so a Series of no tweets needn't hold strings.
+            tweet_words = [self.WORD_PATTERN.findall(tweet_text.lower()) for tweet_text in tweet_texts]
+            word_counts = np.fromiter(map(len, tweet_words), dtype=np.int64, count=len(tweet_words))
+            word_codes, words = pd.factorize(np.array(list(chain.from_iterable(tweet_words)), dtype=object),
+                                             sort=True)
+            words = np.asarray(words, dtype=object)
+            token_rows = np.repeat(tweet_texts.index.to_numpy(), word_counts)
+            _, word_offsets, word_rows = self.group_rows(word_codes, token_rows)
+            # Pair each word with the word after it in the same tweet.
+            same_tweet = token_rows[1:] == token_rows[:-1]
+            pair_keys = (word_codes[:-1].astype(np.int64) * len(words) + word_codes[1:])[same_tweet]
+            pair_keys, pair_offsets, pair_rows = self.group_rows(pair_keys, token_rows[1:][same_tweet])
+        self.words = words
+        self.word_offsets = word_offsets.astype(np.int64)
+        self.word_rows = word_rows.astype(np.int32)
+        self.pair_keys = pair_keys.astype(np.int64)
+        self.pair_offsets = pair_offsets.astype(np.int64)
+        self.pair_rows = pair_rows.astype(np.int32)
+
+    # Sort keys and the row labels they appear in together, dropping repeats of a key within a tweet. Returns the
+    # sorted distinct keys, the row labels of all keys and the offset in the row labels of each key's row labels.
+    @staticmethod
+    def group_rows(keys, rows):
+        order = np.lexsort((rows, keys))
+        keys = keys[order]
+        rows = rows[order]
+        first_in_tweet = np.ones(len(keys), dtype=bool)
+        first_in_tweet[1:] = (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])
+        keys = keys[first_in_tweet]
+        rows = rows[first_in_tweet]
+        distinct_keys, key_starts = np.unique(keys, return_index=True)
+        return distinct_keys, np.append(key_starts, len(keys)), rows
+
+    # Row labels for a key in a sorted array of keys, given the offsets of the row labels of each key.
+    @staticmethod
+    def rows_for_key(keys, offsets, rows, key):
+        key_position = np.searchsorted(keys, key)
+        if key_position == len(keys) or keys[key_position] != key:
+            return np.empty(0, dtype=np.int64)
+        return rows[offsets[key_position]:offsets[key_position + 1]].astype(np.int64)
+
+    # Row labels of the tweets containing the word.
+    def rows_with(self, word):
+        return self.rows_for_key(self.words, self.word_offsets, self.word_rows, word)
+
+    # Row labels of the tweets containing any word starting with the prefix.
+    def rows_with_prefix(self, prefix):
+        first_position = np.searchsorted(self.words, prefix)
+        end_position = np.searchsorted(self.words, prefix + "\x7f")
+        return np.unique(self.word_rows[self.word_offsets[first_position]:self.word_offsets[end_position]]
+                         .astype(np.int64))
+
+    # Row labels of the tweets containing the words of a phrase next to each other. Tweets containing every pair of
+    # words in the phrase are found with the index, so only for phrases of three or more words is the text of those
+    # tweets checked for the whole phrase.
+    def rows_with_phrase(self, phrase_words):
+        if len(phrase_words) == 1:
+            return self.rows_with(phrase_words[0])
+        word_positions = np.searchsorted(self.words, np.array(phrase_words, dtype=object))
+        if (word_positions == len(self.words)).any() or (self.words[word_positions] != phrase_words).any():
+            return np.empty(0, dtype=np.int64)
+        rows = self.rows_with_all([self.rows_for_key(self.pair_keys, self.pair_offsets, self.pair_rows, pair_key)
+                                   for pair_key in word_positions[:-1] * len(self.words) + word_positions[1:]])
+        if len(phrase_words) == 2 or not len(rows):
+            return rows
+        phrase_pattern = re.compile("(?<![a-z0-9_])" + self.WORD_SEPARATOR.join(phrase_words) + "(?![a-z0-9_])")
+        tweet_texts = self.tweet_texts.loc[rows].str.lower()
+        return rows[np.fromiter((phrase_pattern.search(tweet_text) is not None for tweet_text in tweet_texts),
+                                dtype=bool, count=len(rows))]
+
+    # Row labels in all of the sorted arrays of row labels.
+    @staticmethod
+    def rows_with_all(rows_list):
+        if not len(rows_list):
+            return np.empty(0, dtype=np.int64)
+        # Intersect the shortest arrays first, so the intersection stays as small as possible.
+        rows_list = sorted(rows_list, key=len)
+        rows = rows_list[0]
+        for other_rows in rows_list[1:]:
+            rows = np.intersect1d(rows, other_rows, assume_unique=True)
+        return rows
+
+    # Search the tweet text, returning the sorted row labels of the matching tweets. Words in the query must all appear
+    # in a tweet, and groups of words separated by OR are alternatives. A word ending in * matches any word starting
+    # with it, and words in double quotes must appear together as a phrase. Words are matched ignoring case.
+    def search(self, query):
+        clauses = [[]]
+        for phrase, term in re.findall(r'"([^"]*)"|(\S+)', query):
+            if term == "OR":
+                clauses.append([])
+                continue
+            term_words = self.WORD_PATTERN.findall((phrase or term).lower())
+            if not len(term_words):
+                continue
+            if phrase == "" and term.endswith("*") and len(term_words) == 1:
+                clauses[-1].append(self.rows_with_prefix(term_words[0]))
+            else:
+                clauses[-1].append(self.rows_with_phrase(term_words))
+        clause_rows = [self.rows_with_all(clause) for clause in clauses if len(clause)]
+        if not len(clause_rows):
+            return np.empty(0, dtype=np.int64)
+        if len(clause_rows) == 1:
+            return clause_rows[0]
+        return np.unique(np.concatenate(clause_rows))
+
+
+class StatusCounts:
+    # Status columns which together make up the state of a tweet.
+    STATUS_COL_NAMES = ["tweet_review_status", "tweet_url_visited", "tweet_deleted"]
+
+    # Number of tweets in each state, kept overall and broken down by hashtag and by year. The counts are built once
+    # with grouped counts and then changed as each tweet is updated, so they never need the tweets to be rescanned.
+    def __init__(self, tweets_df, hashtags_df):
+        self.hashtags_df = hashtags_df
+        # Hashtags of each tweet, for finding the breakdowns a tweet belongs to when it is updated.
+        hashtags = hashtags_df["hashtag"].to_numpy()
+        self.tweet_hashtags = {tweet_id: hashtags[positions] for tweet_id, positions in
+                               hashtags_df.groupby("tweet_id").indices.items()}
+        self.overall_counts = Counter()
+        self.hashtag_counts = defaultdict(Counter)
+        self.year_counts = defaultdict(Counter)
+        self.add_tweets(tweets_df)
+
+    # Add the tweets in a DataFrame to the counts, or remove them if sign is -1.
+    def add_tweets(self, tweets_df, sign=1):
+        states_df = tweets_df[self.STATUS_COL_NAMES].astype({"tweet_review_status": str})
+        for state, count in states_df.groupby(self.STATUS_COL_NAMES).size().items():
+            self.overall_counts[state] += sign * count
+        years_df = states_df.assign(year=tweets_df["tweet_created"].dt.year)
+        for (year, *state), count in years_df.groupby(["year"] + self.STATUS_COL_NAMES).size().items():
+            self.year_counts[int(year)][tuple(state)] += sign * count
+        # Only the hashtags of the tweets being added are merged with their states, so adding a few tweets doesn't cost
+        # as much as adding all of them.
+        tweet_ids = tweets_df["tweet_id"].to_numpy()
+        hashtag_states_df = self.hashtags_df[self.hashtags_df["tweet_id"].isin(tweet_ids)].merge(
+            states_df.assign(tweet_id=tweet_ids), on="tweet_id")
+        for (hashtag, *state), count in hashtag_states_df.groupby(["hashtag"] + self.STATUS_COL_NAMES).size().items():
+            self.hashtag_counts[hashtag][tuple(state)] += sign * count
+
+    # Remove the tweets in a DataFrame from the counts.
+    def remove_tweets(self, tweets_df):
+        self.add_tweets(tweets_df, sign=-1)
+
+    # Move a single tweet from one state to another.
+    def move_tweet(self, tweet_id, year, old_state, new_state):
+        if old_state == new_state:
+            return
+        counters = [self.overall_counts, self.year_counts[year]]
+        for hashtag in self.tweet_hashtags.get(tweet_id, []):
+            counters.append(self.hashtag_counts[hashtag])
+        for counter in counters:
+            counter[old_state] -= 1
+            counter[new_state] += 1
+
+    # Count the tweets with the given statuses, overall or for one hashtag or year. Statuses which are not given can
+    # have any value.
+    def count(self, review_status=None, url_visited=None, deleted=None, hashtag=None, year=None):
+        if hashtag is not None:
+            counter = self.hashtag_counts.get(hashtag.lower(), Counter())
+        elif year is not None:
+            counter = self.year_counts.get(year, Counter())
+        else:
+            counter = self.overall_counts
+        return sum(count for (state_review_status, state_url_visited, state_deleted), count in counter.items()
+                   if review_status in [None, state_review_status] and url_visited in [None, state_url_visited] and
+                   deleted in [None, state_deleted])
+
+    # Count the tweets with the given statuses for every hashtag.
+    def count_by_hashtag(self, review_status=None, url_visited=None, deleted=None):
+        return {hashtag: self.count(review_status, url_visited, deleted, hashtag=hashtag)
+                for hashtag in self.hashtag_counts}
+
+    # Count the tweets with the given statuses for every year.
+    def count_by_year(self, review_status=None, url_visited=None, deleted=None):
+        return {year: self.count(review_status, url_visited, deleted, year=year) for year in sorted(self.year_counts)}
+
+
+class TweetQueue:
+    # Ordered queue of the row labels of the tweets awaiting review or deletion, computed once when a window opens, with
+    # a cursor for moving forwards and backwards through it. Tweets marked as finished are passed over when moving
+    # forwards, so each step is constant time on average.
+    def __init__(self, pending_rows):
+        self.pending_rows = pending_rows.tolist()
+        self.finished_rows = set()
+        self.position = -1
+
+    # Row label of the tweet at the cursor, or None if the cursor is not on a tweet.
+    def current(self):
+        if 0 <= self.position < len(self.pending_rows):
+            return self.pending_rows[self.position]
+        return None
+
+    # Move the cursor onto the next tweet that has not been finished.
+    def next(self):
+        position = self.position + 1
+        while position < len(self.pending_rows) and self.pending_rows[position] in self.finished_rows:
+            position += 1
+        self.position = min(position, len(self.pending_rows))
+        return self.current()
+
+    # Move the cursor back onto the previous tweet, whether it has been finished or not.
+    def previous(self):
+        if self.position > 0:
+            self.position -= 1
+        return self.current()
+
+    # Check if there is a tweet before the cursor.
+    def has_previous(self):
+        return self.position > 0
+
+    # Mark a tweet as finished so it is passed over by next.
+    def mark_finished(self, row):
+        self.finished_rows.add(row)
+
+
+class TweetSession:
+    # Original tweet.js filename, and the filenames of the parts of an archive which is split over several files.
+    TWEETJS_FILENAME = "tweet.js"
+    TWEETJS_PART_FILENAME = re.compile(r"tweet-part(\d+)\.js")
+    # Format of the tweet dates in tweet.js.
+    TWEETJS_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+    # Fixed layout of the tweet dates, with a 9 wherever there is a digit, and the month names in the dates.
+    TWEETJS_DATE_LAYOUT = "Www Mmm 99 99:99:99 +9999 9999"
+    TWEETJS_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    # Bytes which are only found in the UTF-8 encoding of characters other than ASCII characters.
+    NON_ASCII_BYTES = bytes(range(128, 256))
+    # Number of characters read from tweet.js at a time, and the characters that separate tweets in the file.
+    TWEETJS_CHUNK_SIZE = 1 << 20
+    TWEETJS_SEPARATORS = re.compile(r"[\s,]*")
+    # Number of tweets from tweet.js converted to columns at a time.
+    TWEETJS_BATCH_SIZE = 10000
+    # Number of journal records, or seconds since the last sync, after which the journal is synced to disk, and number
+    # of journal records after which the journal is compacted into the save file.
+    JOURNAL_SYNC_RECORDS = 50
+    JOURNAL_SYNC_SECONDS = 2.0
+    JOURNAL_COMPACT_RECORDS = 5000
+    # Stages of loading the data, with the name shown for each and the range of the overall progress, as a percentage,
+    # which it takes up.
+    LOAD_STAGES = {"read": ("Reading", 0, 10), "parse": ("Parsing", 10, 70), "build": ("Building", 70, 85),
+                   "filter": ("Filtering", 85, 100)}
+    # Categories of the review status column, in the order their codes are stored in the save file. The URL visited
+    # and deleted columns are held as booleans, and shown as "yes" and "no" in the CSV file.
+    REVIEW_STATUS_CATEGORIES = ["none", "keep", "delete"]
+    FLAG_COL_NAMES = ["tweet_url_visited", "tweet_deleted"]
+    # Largest number of tweets updated together which are moved in the status counts one at a time.
+    MOVE_TWEETS_LIMIT = 100
+
+    # Holds the tweet data for a run of the program. A single session is created by main and shared by reference with
+    # every window, so the data is only loaded once and changes made in one window are seen by all of the others.
+    def __init__(self, username, excluded_hashtags=None, saved_filename=None):
+        self.username = username
+        if excluded_hashtags is None:
+            self.excluded_hashtags = []
+        else:
+            self.excluded_hashtags = excluded_hashtags
+        if saved_filename is None:
+            self.saved_filename = "my_tweet_review.csv"
+        else:
+            self.saved_filename = saved_filename
+        # The data is saved in a binary columnar save file named after the CSV file, which can still be exported on
+        # request. Tweets removed from the data after being deleted are exported to a second CSV file.
+        saved_filename_root, saved_filename_ext = path.splitext(self.saved_filename)
+        self.deleted_filename = saved_filename_root + "_deleted" + saved_filename_ext
+        self.npz_snapshot_filename = saved_filename_root + ".npz"
+        # Text index saved next to the save file, so it is only built again when the tweets change.
+        self.text_index_filename = saved_filename_root + ".textindex.npz"
+        # Fingerprint of the tweet.js file the save file was last brought up to date with.
+        self.fingerprint_filename = saved_filename_root + ".tweetjs.json"
+        # Log of the stages recorded when diagnostics are turned on.
+        self.diagnostics_filename = saved_filename_root + ".diagnostics.jsonl"
+        if pa is None:
+            self.snapshot_filename = self.npz_snapshot_filename
+        else:
+            self.snapshot_filename = saved_filename_root + ".parquet"
+        # DataFrames and hashtag index, created when the data is loaded.
+        self.tweets_df = None
+        self.hashtags_df = None
+        self.hashtag_index = None
+        self.text_index = None
+        self.status_counts = None
+        self.excluded_tweets_df = None
+        self.deleted_tweets_df = None
+        # Number of tweets added from a newer tweet.js file when the data was loaded, whether a CSV save file from an
+        # earlier version of the program was converted to the save file and, if so, the number of tweets missing from
+        # the CSV file which were kept aside as deleted.
+        self.new_tweet_count = 0
+        self.converted_csv = False
+        self.converted_deleted_count = 0
+        # Function called with the name of the stage and the overall percentage as the data is loaded.
+        self.load_progress = None
+        # Journal of changes made since the save file was last written. Each change is appended to the journal as it is
+        # made, and the journal is moved aside while it is being folded into the save file.
+        self.journal_filename = saved_filename_root + ".journal"
+        self.compacting_journal_filename = self.journal_filename + ".compacting"
+        self.journal_file = None
+        self.journal_records = 0
+        self.unsynced_records = 0
+        self.last_sync_time = time.monotonic()
+        self.compaction_thread = None
+
+    # Stream the tweets in a tweet.js file one at a time. The file is read in fixed size chunks and each tweet is
+    # decoded from a small rolling buffer, so memory use does not grow with the size of the archive. Only the fields
+    # kept by the program are yielded, as a tuple of date, ID, text and list of hashtags. If given, progress is called
+    # with the fraction of the file read after each chunk.
+    @staticmethod
+    def stream_raw_tweets(tweetjs_filename, chunk_size=TWEETJS_CHUNK_SIZE, progress=None):
+        decoder = json.JSONDecoder()
+        with open(tweetjs_filename, mode='r', encoding="UTF-8") as raw_tweets_data:
+            file_size = max(os.fstat(raw_tweets_data.fileno()).st_size, 1)
+            characters_read = 0
+            # Skip the "window.YTD.tweet.part0 =" prefix. The data needed from tweet.js starts after the first "[".
+            buffer = ""
+            while True:
+                chunk = raw_tweets_data.read(chunk_size)
+                characters_read += len(chunk)
+                if progress is not None:
+                    progress(min(characters_read / file_size, 1.0))
+                if not chunk:
+                    return
+                list_start = chunk.find('[')
+                if list_start != -1:
+                    buffer = chunk[list_start + 1:]
+                    break
+            position = 0
+            end_of_file = False
+            while True:
+                # Move past any whitespace and commas separating the tweets.
+                position = TweetSession.TWEETJS_SEPARATORS.match(buffer, position).end()
+                if position < len(buffer):
+                    # The data needed from tweet.js ends at the last "]".
+                    if buffer[position] == ']':
+                        return
+                    try:
+                        tweet, position = decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        # If there is nothing left to read the file is truncated or malformed.
+                        if end_of_file:
+                            raise
+                    else:
+                        yield (tweet["created_at"], tweet["id_str"], tweet["full_text"],
+                               [hashtag["text"] for hashtag in tweet["entities"]["hashtags"]])
+                        continue
+                elif end_of_file:
+                    return
+                # The next tweet is incomplete, so drop what has already been decoded from the buffer and read
+                # another chunk.
+                chunk = raw_tweets_data.read(chunk_size)
+                characters_read += len(chunk)
+                if progress is not None:
+                    progress(min(characters_read / file_size, 1.0))
+                end_of_file = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+
+    # Find the tweet.js file and any tweet-partN.js files in the same folder as the my_tweet_reviewer program, in part
+    # order.
+    def tweetjs_filenames(self):
+        if path.exists(self.TWEETJS_FILENAME):
+            tweetjs_filenames = [self.TWEETJS_FILENAME]
+        else:
+            tweetjs_filenames = []
+        part_numbers = {}
+        for filename in os.listdir(os.curdir):
+            part_match = self.TWEETJS_PART_FILENAME.fullmatch(filename)
+            if part_match:
+                part_numbers[filename] = int(part_match.group(1))
+        return tweetjs_filenames + sorted(part_numbers, key=part_numbers.get)
+
+    # Import the data from tweet.js, or from every part of an archive split over several files, leaving out any tweets
+    # whose IDs are in known_tweet_ids, a sorted array of IDs. Each part is parsed in its own process and the columns of
+    # the parts are then joined together.
+    @instrumentation.instrumented("import", rows=lambda session, tweets_columns: len(tweets_columns["tweet_id"]))
+    def import_raw_tweets_data(self, known_tweet_ids=None):
+        # Check tweet.js files exist in same folder as my_tweet_reviewer program.
+        tweetjs_filenames = self.tweetjs_filenames()
+        if not len(tweetjs_filenames):
+            raise FileNotFoundError(self.TWEETJS_FILENAME)
+        self.report_load_progress("parse")
+        if len(tweetjs_filenames) == 1:
+            parts_columns = [self.parse_tweetjs_file(tweetjs_filenames[0], known_tweet_ids,
+                                                     lambda fraction: self.report_load_progress("parse", fraction))]
+        else:
+            parts_columns = []
+            with futures.ProcessPoolExecutor(max_workers=min(len(tweetjs_filenames), os.cpu_count() or 1)) as executor:
+                for part_columns in executor.map(self.parse_tweetjs_file, tweetjs_filenames, repeat(known_tweet_ids)):
+                    parts_columns.append(part_columns)
+                    self.report_load_progress("parse", len(parts_columns) / len(tweetjs_filenames))
+        tweets_columns = {}
+        for col_name in ["tweet_created", "tweet_id", "hashtag_count"]:
+            tweets_columns[col_name] = np.concatenate([part_columns[col_name] for part_columns in parts_columns])
+        for col_name in ["tweet_text", "hashtag"]:
+            tweets_columns[col_name] = list(chain.from_iterable(part_columns[col_name]
+                                                                for part_columns in parts_columns))
+        # Return columns of tweets.
+        return tweets_columns
+
+    # Parse a single tweet.js file into columns of tweet dates, IDs, ASCII text, hashtag counts and hashtags, leaving
+    # out any tweets whose IDs are in known_tweet_ids. Runs in a worker process when the archive has several parts.
+    @staticmethod
+    def parse_tweetjs_file(tweetjs_filename, known_tweet_ids=None, progress=None):
+        # For each tweet retrieve just the date of the tweet, tweet ID, tweet text and hashtags, appending each field to
+        # the column buffers of a batch of tweets. Each full batch is converted and added to the columns of the file, so
+        # only one batch of tweets is held in its raw form at a time. Hashtags are stored as a count per tweet plus a
+        # single flat list of hashtag values.
+        tweets_columns = {"tweet_created": [], "tweet_id": [], "tweet_text": [], "hashtag_count": [], "hashtag": []}
+        batch_columns = {col_name: [] for col_name in tweets_columns}
+        for created_at, id_str, full_text, hashtags in TweetSession.stream_raw_tweets(tweetjs_filename,
+                                                                                      progress=progress):
+            batch_columns["tweet_created"].append(created_at)
+            batch_columns["tweet_id"].append(id_str)
+            batch_columns["tweet_text"].append(full_text)
+            batch_columns["hashtag_count"].append(len(hashtags))
+            batch_columns["hashtag"].extend(hashtags)
+            if len(batch_columns["tweet_id"]) == TweetSession.TWEETJS_BATCH_SIZE:
+                TweetSession.add_tweetjs_batch(tweets_columns, batch_columns, known_tweet_ids)
+                batch_columns = {col_name: [] for col_name in tweets_columns}
+        TweetSession.add_tweetjs_batch(tweets_columns, batch_columns, known_tweet_ids)
+        for col_name in ["tweet_created", "tweet_id", "hashtag_count"]:
+            tweets_columns[col_name] = np.concatenate(tweets_columns[col_name])
+        return tweets_columns
+
+    # Convert the column buffers of a batch of tweets and add them to the columns of a tweet.js file, leaving out any
+    # tweets whose IDs are in known_tweet_ids. The dates, IDs and hashtag counts are added as arrays, to be joined once
+    # every batch has been added.
+    @staticmethod
+    def add_tweetjs_batch(tweets_columns, batch_columns, known_tweet_ids=None):
+        tweet_ids = np.array(batch_columns["tweet_id"]).astype(np.int64)
+        hashtag_counts = np.array(batch_columns["hashtag_count"], dtype=np.int64)
+        # Keep only the tweets which are not already known, so the rest of the import scales with the new tweets.
+        if known_tweet_ids is not None:
+            new_mask = ~TweetSession.sorted_ids_contain(known_tweet_ids, tweet_ids)
+            hashtag_mask = np.repeat(new_mask, hashtag_counts)
+            for col_name in ["tweet_created", "tweet_text"]:
+                batch_columns[col_name] = list(compress(batch_columns[col_name], new_mask))
+            batch_columns["hashtag"] = list(compress(batch_columns["hashtag"], hashtag_mask))
+            tweet_ids = tweet_ids[new_mask]
+            hashtag_counts = hashtag_counts[new_mask]
+        # Convert the dates to datetime64 values in UTC.
+        tweets_columns["tweet_created"].append(TweetSession.parse_tweetjs_dates(batch_columns["tweet_created"]))
+        tweets_columns["tweet_id"].append(tweet_ids)
+        # Remove all special characters such as emojis from the text because Tkinter has trouble displaying some of
+        # them. Reduce each tweet into a string of only ASCII characters for simplicity.
+        tweets_columns["tweet_text"].extend(TweetSession.fold_to_ascii(batch_columns["tweet_text"]))
+        tweets_columns["hashtag_count"].append(hashtag_counts)
+        tweets_columns["hashtag"].extend(batch_columns["hashtag"])
+
+    # Reduce strings to only their ASCII characters. The strings are joined with null characters, which don't appear in
+    # tweets, and folded in a single pass by encoding them as UTF-8 and deleting every byte of a multi-byte character.
+    # Should a string contain a null character after all, each string is folded on its own.
+    @staticmethod
+    def fold_to_ascii(strings):
+        if not len(strings):
+            return []
+        folded_strings = "\0".join(strings).encode("UTF-8", errors="ignore").translate(
+            None, TweetSession.NON_ASCII_BYTES).decode("ascii").split("\0")
+        if len(folded_strings) != len(strings):
+            folded_strings = [string.encode("UTF-8", errors="ignore").translate(None, TweetSession.NON_ASCII_BYTES)
+                              .decode("ascii") for string in strings]
+        return folded_strings
+
+    # Convert tweet.js dates to datetime64 values in UTC. The dates have a fixed layout, so the characters of every date
+    # are laid out in a single array and each field is read from its columns of the array. If any date doesn't have the
+    # expected layout, or isn't a real date such as 30 February, the dates are parsed with TWEETJS_DATE_FORMAT instead,
+    # which raises ValueError for dates which aren't valid.
+    @staticmethod
+    def parse_tweetjs_dates(created_ats):
+        date_count = len(created_ats)
+        layout = TweetSession.TWEETJS_DATE_LAYOUT
+        encoded_dates = "".join(created_ats).encode("ascii", errors="replace")
+        if len(encoded_dates) == date_count * len(layout):
+            date_chars = np.frombuffer(encoded_dates, dtype=np.uint8).reshape(date_count, len(layout))
+            layout_chars = np.frombuffer(layout.encode("ascii"), dtype=np.uint8)
+            digit_columns = layout_chars == ord("9")
+            fixed_columns = np.isin(layout_chars, np.frombuffer(b" :", dtype=np.uint8))
+            digits = date_chars[:, digit_columns].astype(np.int64) - ord("0")
+            # Read each number from its digits, in the order they appear in the layout.
+            numbers = {}
+            position = 0
+            for field, digit_count in [("day", 2), ("hour", 2), ("minute", 2), ("second", 2), ("offset_hour", 2),
+                                       ("offset_minute", 2), ("year", 4)]:
+                numbers[field] = digits[:, position:position + digit_count] @ (10 ** np.arange(digit_count - 1, -1, -1))
+                position += digit_count
+            month_keys = date_chars[:, 4:7].astype(np.int64) @ np.array([1 << 16, 1 << 8, 1])
+            month_names = np.frombuffer("".join(TweetSession.TWEETJS_MONTHS).encode("ascii"), dtype=np.uint8)
+            known_month_keys = month_names.reshape(-1, 3).astype(np.int64) @ np.array([1 << 16, 1 << 8, 1])
+            month_positions = np.argsort(known_month_keys)
+            months = month_positions[np.minimum(np.searchsorted(known_month_keys[month_positions], month_keys),
+                                                len(known_month_keys) - 1)]
+            offset_signs = date_chars[:, layout.index("+")]
+            # The number of days in each month is the number of days until the first day of the next month.
+            month_numbers = (numbers["year"] - 1970) * 12 + months
+            first_days = month_numbers.astype("datetime64[M]").astype("datetime64[D]")
+            month_lengths = ((month_numbers + 1).astype("datetime64[M]").astype("datetime64[D]") -
+                             first_days).astype(np.int64)
+            if ((digits >= 0).all() and (digits <= 9).all() and
+                    (date_chars[:, fixed_columns] == layout_chars[fixed_columns]).all() and
+                    (known_month_keys[months] == month_keys).all() and
+                    np.isin(offset_signs, np.frombuffer(b"+-", dtype=np.uint8)).all() and
+                    (numbers["day"] >= 1).all() and (numbers["day"] <= month_lengths).all() and
+                    (numbers["hour"] <= 23).all() and (numbers["minute"] <= 59).all() and
+                    (numbers["second"] <= 60).all()):
+                offset_seconds = ((numbers["offset_hour"] * 3600 + numbers["offset_minute"] * 60) *
+                                  np.where(offset_signs == ord("-"), -1, 1))
+                seconds = ((numbers["day"] - 1) * 86400 + numbers["hour"] * 3600 + numbers["minute"] * 60 +
+                           numbers["second"] - offset_seconds)
+                return (first_days.astype("datetime64[s]") + seconds).astype("datetime64[ns]")
+        return pd.to_datetime(list(created_ats), format=TweetSession.TWEETJS_DATE_FORMAT,
+                              utc=True).tz_convert(None).to_numpy(dtype="datetime64[ns]")
+
+    # Check which values, such as tweet IDs or row labels, are in a sorted array of them, with a binary search for each.
+    @staticmethod
+    def sorted_ids_contain(sorted_ids, tweet_ids):
+        if not len(sorted_ids):
+            return np.zeros(len(tweet_ids), dtype=bool)
+        positions = np.minimum(np.searchsorted(sorted_ids, tweet_ids), len(sorted_ids) - 1)
+        return sorted_ids[positions] == tweet_ids
+
+    # Get the fingerprint of the tweet.js files: the size, modification time and SHA-256 hash of each. A hash is reused
+    # from a previous fingerprint if the size and modification time of the file haven't changed, so a file is only read
+    # if it has.
+    def tweetjs_fingerprint(self, previous_fingerprint=None):
+        fingerprint = {"files": {}}
+        for tweetjs_filename in self.tweetjs_filenames():
+            tweetjs_stat = os.stat(tweetjs_filename)
+            file_fingerprint = {"size": tweetjs_stat.st_size, "mtime_ns": tweetjs_stat.st_mtime_ns}
+            previous_file_fingerprint = (previous_fingerprint or {"files": {}})["files"].get(tweetjs_filename, {})
+            if all(previous_file_fingerprint.get(key) == value for key, value in file_fingerprint.items()):
+                file_fingerprint["sha256"] = previous_file_fingerprint["sha256"]
+            else:
+                tweetjs_hash = hashlib.sha256()
+                with open(tweetjs_filename, mode='rb') as tweetjs_file:
+                    for chunk in iter(lambda: tweetjs_file.read(self.TWEETJS_CHUNK_SIZE), b""):
+                        tweetjs_hash.update(chunk)
+                file_fingerprint["sha256"] = tweetjs_hash.hexdigest()
+            fingerprint["files"][tweetjs_filename] = file_fingerprint
+        return fingerprint
+
+    # Check if the content of the tweet.js files differs between two fingerprints.
+    @staticmethod
+    def tweetjs_changed(previous_fingerprint, fingerprint):
+        if previous_fingerprint is None:
+            return True
+        return ({filename: file_fingerprint["sha256"] for filename, file_fingerprint in
+                 previous_fingerprint["files"].items()} !=
+                {filename: file_fingerprint["sha256"] for filename, file_fingerprint in fingerprint["files"].items()})
+
+    # Read the fingerprint of the tweet.js files the save file was last brought up to date with, if there is one. A
+    # fingerprint of a single tweet.js file, written by an earlier version of the program, is ignored.
+    def read_tweetjs_fingerprint(self):
+        if not path.exists(self.fingerprint_filename):
+            return None
+        with open(self.fingerprint_filename, mode='r', encoding="UTF-8") as fingerprint_file:
+            fingerprint = json.load(fingerprint_file)
+        if "files" not in fingerprint:
+            return None
+        return fingerprint
+
+    # Write the fingerprint of the tweet.js files the save file has been brought up to date with.
+    def write_tweetjs_fingerprint(self, fingerprint):
+        with open(self.fingerprint_filename + ".tmp", mode='w', encoding="UTF-8") as fingerprint_file:
+            json.dump(fingerprint, fingerprint_file)
+        os.replace(self.fingerprint_filename + ".tmp", self.fingerprint_filename)
+
+    # Add the tweets in the tweet.js files which aren't already in a DataFrame of tweets, keeping the state of the
+    # existing tweets. With missing_from_csv the tweets are those left out of a CSV file by an earlier version of the
+    # program, unless they are more recent than any tweet in it, in which case they were posted after the CSV file was
+    # written and are new. The older ones without an excluded hashtag had been deleted, so they are added as deleted
+    # tweets, which can be restored, and counted in converted_deleted_count. Returns the merged tweets and hashtags
+    # DataFrames, most recent first, and the number of new tweets added.
+    def merge_new_tweets(self, tweets_df, hashtags_df, missing_from_csv=False):
+        known_tweet_ids = np.sort(tweets_df["tweet_id"].to_numpy(dtype=np.int64))
+        tweets = self.import_raw_tweets_data(known_tweet_ids)
+        self.report_load_progress("build")
+        new_tweets_df, new_hashtags_df = self.create_tweet_df(tweets)
+        if not len(new_tweets_df.index):
+            return tweets_df, hashtags_df, 0
+        new_tweet_count = len(new_tweets_df.index)
+        if missing_from_csv:
+            missing_mask = np.ones(len(new_tweets_df.index), dtype=bool)
+            if len(tweets_df.index):
+                missing_mask = (new_tweets_df["tweet_created"] <= tweets_df["tweet_created"].max()).to_numpy()
+            excluded_hashtags = [hashtag.lower() for hashtag in self.excluded_hashtags]
+            excluded_tweet_ids = new_hashtags_df.loc[new_hashtags_df["hashtag"].isin(excluded_hashtags), "tweet_id"]
+            deleted_mask = missing_mask & ~new_tweets_df["tweet_id"].isin(excluded_tweet_ids).to_numpy()
+            new_tweets_df.loc[deleted_mask, "tweet_review_status"] = "delete"
+            for col_name in self.FLAG_COL_NAMES:
+                new_tweets_df.loc[deleted_mask, col_name] = True
+            self.converted_deleted_count = int(deleted_mask.sum())
+            new_tweet_count = int((~missing_mask).sum())
+        tweets_df = pd.concat([tweets_df, new_tweets_df]).sort_values(by=["tweet_created"], ascending=False,
+                                                                      kind="stable", ignore_index=True)
+        hashtags_df = pd.concat([hashtags_df, new_hashtags_df], ignore_index=True)
+        return tweets_df, hashtags_df, new_tweet_count
+
+    # Create new DataFrames of tweets and of their hashtags.
+    @staticmethod
+    @instrumentation.instrumented("build", rows=lambda tweets_columns, dfs: len(dfs[0].index))
+    def create_tweet_df(original_tweets_columns):
+        original_tweets_df = pd.DataFrame({"tweet_created": original_tweets_columns["tweet_created"],
+                                           "tweet_id": original_tweets_columns["tweet_id"],
+                                           "tweet_text": pd.Series(original_tweets_columns["tweet_text"], dtype=str)})
+        original_tweets_df["tweet_id"] = original_tweets_df["tweet_id"].astype(np.int64)
+        # Create a long-form DataFrame with one row per hashtag, repeating the tweet ID once for each of the hashtags in
+        # the tweet.
+        hashtags_df = pd.DataFrame({"tweet_id": np.repeat(original_tweets_df["tweet_id"].to_numpy(),
+                                                          original_tweets_columns["hashtag_count"]),
+                                    "hashtag": pd.Series(original_tweets_columns["hashtag"], dtype=str)})
+        # Convert all hashtags to lowercase strings.
+        hashtags_df["hashtag"] = hashtags_df["hashtag"].str.lower()
+        # Mark the dates, which have already been converted to datetime64 values, as being in UTC.
+        original_tweets_df["tweet_created"] = original_tweets_df["tweet_created"].dt.tz_localize("UTC")
+        # Sort DataFrame by date, most recent first. The row labels are renumbered to follow this order.
+        original_tweets_df.sort_values(by=["tweet_created"], ascending=False, inplace=True, ignore_index=True)
+        # Add a categorical tweet_review_status column to the DataFrame with default "none" values. This column will
+        # track the tweets that have been reviewed.
+        original_tweets_df["tweet_review_status"] = pd.Categorical(["none"] * len(original_tweets_df.index),
+                                                                   categories=TweetSession.REVIEW_STATUS_CATEGORIES)
+        # Add a boolean tweet_url_visited column to the DataFrame with default False values. This column will track the
+        # tweets that have been viewed in the browser.
+        original_tweets_df["tweet_url_visited"] = False
+        # Add a boolean tweet_deleted column with default False values. This column will track the tweets that have
+        # been deleted prior to their removal from the data.
+        original_tweets_df["tweet_deleted"] = False
+        # Return original DataFrame containing tweets and DataFrame containing hashtags.
+        return original_tweets_df, hashtags_df
+
+    # Filter tweets DataFrame. Tweets containing any of the excluded hashtags are moved out of tweets_df into
+    # excluded_tweets_df, and tweets whose hashtags are no longer excluded are moved back.
+    @instrumentation.instrumented("filter")
+    def filter_tweets(self):
+        if len(self.excluded_tweets_df.index):
+            all_tweets_df = self.all_tweets_df()
+        else:
+            all_tweets_df = self.tweets_df
+        # Look up the excluded hashtags in the hashtag index and remove the matching rows with a single mask.
+        excluded_rows = self.hashtag_index.rows_with_any(self.excluded_hashtags)
+        excluded_mask = all_tweets_df.index.isin(excluded_rows)
+        self.tweets_df = all_tweets_df[~excluded_mask]
+        self.excluded_tweets_df = all_tweets_df[excluded_mask]
+        # The tweets being counted have changed, so count them again.
+        self.status_counts = StatusCounts(self.tweets_df, self.hashtags_df)
+
+    # Change the excluded hashtags and filter the tweets again without reloading them.
+    def set_excluded_hashtags(self, excluded_hashtags):
+        self.excluded_hashtags = excluded_hashtags
+        self.filter_tweets()
+
+    # Get a DataFrame of all tweets, including those excluded by the filter, most recent first.
+    def all_tweets_df(self):
+        return pd.concat([self.tweets_df, self.excluded_tweets_df]).sort_index()
+
+    # Get a DataFrame of all tweets, including those excluded by the filter and those deleted, most recent first.
+    def snapshot_df(self):
+        return pd.concat([self.tweets_df, self.excluded_tweets_df, self.deleted_tweets_df]).sort_index()
+
+    # Get the URL of a tweet, which is created from its ID when needed rather than being kept with the tweet.
+    def tweet_url(self, row_index):
+        return self.tweet_url_prefix() + str(self.tweets_df.at[row_index, "tweet_id"])
+
+    # Get the start of every tweet URL, up to the tweet ID.
+    def tweet_url_prefix(self):
+        return "https://twitter.com/" + self.username.strip('@') + "/status/"
+
+    # Convert the status columns of a DataFrame to their compact types: a categorical review status and boolean URL
+    # visited and deleted flags. Flags still holding "yes" and "no", as read from a CSV file, are converted.
+    @staticmethod
+    def compact_dtypes(tweets_df):
+        tweets_df["tweet_review_status"] = pd.Categorical(tweets_df["tweet_review_status"],
+                                                          categories=TweetSession.REVIEW_STATUS_CATEGORIES)
+        for col_name in TweetSession.FLAG_COL_NAMES:
+            if tweets_df[col_name].dtype != bool:
+                tweets_df[col_name] = (tweets_df[col_name].astype(str) == "yes").to_numpy()
+        return tweets_df
+
+    # Convert a DataFrame of tweets to the columns of the CSV file, with the URL of each tweet after its text and the
+    # URL visited and deleted flags as "yes" and "no".
+    def tweets_to_csv_columns(self, tweets_df):
+        csv_df = tweets_df.assign(**{col_name: np.where(tweets_df[col_name].to_numpy(), "yes", "no")
+                                     for col_name in self.FLAG_COL_NAMES})
+        csv_df.insert(csv_df.columns.get_loc("tweet_text") + 1, "tweet_url",
+                      self.tweet_url_prefix() + tweets_df["tweet_id"].astype(str))
+        return self.hashtags_to_columns(csv_df, self.hashtags_df)
+
+    # Report the memory used by each column of the tweets, excluded tweets, deleted tweets and hashtags DataFrames, in
+    # bytes, along with the total for each DataFrame and the average per row.
+    def memory_usage_report(self):
+        dfs = {"tweets": self.tweets_df, "excluded": self.excluded_tweets_df, "deleted": self.deleted_tweets_df,
+               "hashtags": self.hashtags_df}
+        report_df = pd.DataFrame({df_name: df.memory_usage(deep=True) for df_name, df in dfs.items()})
+        report_df = report_df.fillna(0).astype(np.int64)
+        report_df.loc["total"] = report_df.sum()
+        report_df.loc["per_row"] = [report_df.at["total", df_name] // max(len(df.index), 1)
+                                    for df_name, df in dfs.items()]
+        return report_df
+
+    # Spread the hashtags of each tweet into hashtag_0, hashtag_1... columns, as used in the CSV file.
+    @staticmethod
+    def hashtags_to_columns(tweets_df, hashtags_df):
+        hashtag_position = hashtags_df.groupby("tweet_id", sort=False).cumcount()
+        hashtag_columns_df = hashtags_df.assign(position=hashtag_position).pivot(index="tweet_id", columns="position",
+                                                                                 values="hashtag")
+        hashtag_columns_df.columns = ["hashtag_{}".format(position) for position in hashtag_columns_df.columns]
+        # Place the hashtag columns after the tweet details and before the status columns.
+        col_names = tweets_df.columns.values.tolist()
+        status_position = col_names.index("tweet_review_status")
+        col_names[status_position:status_position] = hashtag_columns_df.columns.values.tolist()
+        return tweets_df.join(hashtag_columns_df, on="tweet_id")[col_names]
+
+    # Collect the hashtag_0, hashtag_1... columns of a DataFrame loaded from CSV into a long-form hashtags DataFrame.
+    @staticmethod
+    def hashtags_from_columns(tweets_df):
+        hashtag_col_names = [col_name for col_name in tweets_df.columns.values.tolist()
+                             if col_name.startswith("hashtag_")]
+        hashtags_df = tweets_df.melt(id_vars=["tweet_id"], value_vars=hashtag_col_names,
+                                     value_name="hashtag")[["tweet_id", "hashtag"]].dropna().astype({"hashtag": str})
+        return tweets_df.drop(hashtag_col_names, axis=1), hashtags_df.reset_index(drop=True)
+
+    # Get the state of a tweet as used by the status counts.
+    def tweet_state(self, row_index):
+        return (str(self.tweets_df.at[row_index, "tweet_review_status"]),
+                bool(self.tweets_df.at[row_index, "tweet_url_visited"]),
+                bool(self.tweets_df.at[row_index, "tweet_deleted"]))
+
+    # Move a tweet in the status counts after its state has changed.
+    def count_tweet_state(self, row_index, old_state):
+        self.status_counts.move_tweet(self.tweets_df.at[row_index, "tweet_id"],
+                                      self.tweets_df.at[row_index, "tweet_created"].year, old_state,
+                                      self.tweet_state(row_index))
+
+    # Update the review status of a tweet.
+    def set_review_status(self, row_index, review_status):
+        old_state = self.tweet_state(row_index)
+        self.tweets_df.at[row_index, "tweet_review_status"] = review_status
+        self.count_tweet_state(row_index, old_state)
+        self.write_journal({"op": "set", "tweet_id": int(self.tweets_df.at[row_index, "tweet_id"]),
+                            "column": "tweet_review_status", "value": review_status})
+
+    # Update a tweet as having been viewed in the browser, along with whether it has been deleted (True or False).
+    def set_deleted(self, row_index, deleted):
+        old_state = self.tweet_state(row_index)
+        self.tweets_df.at[row_index, "tweet_url_visited"] = True
+        self.tweets_df.at[row_index, "tweet_deleted"] = deleted
+        self.count_tweet_state(row_index, old_state)
+        tweet_id = int(self.tweets_df.at[row_index, "tweet_id"])
+        self.write_journal({"op": "set", "tweet_id": tweet_id, "column": "tweet_url_visited", "value": True})
+        self.write_journal({"op": "set", "tweet_id": tweet_id, "column": "tweet_deleted", "value": deleted})
+
+    # Set the status columns of several tweets, given their row labels, to the values in a dictionary of column names
+    # and values. Up to MOVE_TWEETS_LIMIT tweets are moved in the counts one at a time, and more than that are removed
+    # from the counts and added back as a group.
+    def set_statuses(self, row_indices, values):
+        if len(row_indices) <= self.MOVE_TWEETS_LIMIT:
+            for row_index in row_indices:
+                old_state = self.tweet_state(row_index)
+                for col_name, value in values.items():
+                    self.tweets_df.at[row_index, col_name] = value
+                self.count_tweet_state(row_index, old_state)
+        else:
+            self.status_counts.remove_tweets(self.tweets_df.loc[row_indices])
+            for col_name, value in values.items():
+                self.tweets_df.loc[row_indices, col_name] = value
+            self.status_counts.add_tweets(self.tweets_df.loc[row_indices])
+
+    # Update the review status of several tweets at once, given their row labels. The change is recorded in the journal
+    # as a single record.
+    def set_review_statuses(self, row_indices, review_status):
+        if not len(row_indices):
+            return
+        self.set_statuses(row_indices, {"tweet_review_status": review_status})
+        self.write_journal({"op": "set", "tweet_ids": self.tweets_df.loc[row_indices, "tweet_id"].tolist(),
+                            "column": "tweet_review_status", "value": review_status})
+
+    # Update several tweets at once, given their row labels, as having been deleted (True) or not (False) outside of the
+    # browser. They are marked as visited so they are not shown again in the delete process, and the change is recorded
+    # in the journal as a single record for each column.
+    def set_deleted_statuses(self, row_indices, deleted):
+        if not len(row_indices):
+            return
+        self.set_statuses(row_indices, {"tweet_url_visited": True, "tweet_deleted": deleted})
+        tweet_ids = self.tweets_df.loc[row_indices, "tweet_id"].tolist()
+        self.write_journal({"op": "set", "tweet_ids": tweet_ids, "column": "tweet_url_visited", "value": True})
+        self.write_journal({"op": "set", "tweet_ids": tweet_ids, "column": "tweet_deleted", "value": deleted})
+
+    # Move all tweets marked as deleted out of tweets_df and into deleted_tweets_df with a single mask, so they can be
+    # restored later without importing tweet.js again.
+    @instrumentation.instrumented("purge", rows=lambda session, purged_count: purged_count)
+    def purge_deleted_tweets(self):
+        deleted_mask = self.tweets_df["tweet_deleted"].to_numpy()
+        if deleted_mask.any():
+            self.status_counts.remove_tweets(self.tweets_df[deleted_mask])
+            self.deleted_tweets_df = pd.concat([self.deleted_tweets_df, self.tweets_df[deleted_mask]]).sort_index()
+            self.tweets_df = self.tweets_df[~deleted_mask]
+            self.write_journal({"op": "purge"})
+        return int(deleted_mask.sum())
+
+    # Move all deleted tweets back into tweets_df, marked as not deleted and not yet opened in the browser so they
+    # return to the delete process.
+    def restore_deleted_tweets(self):
+        restored_df = self.deleted_tweets_df.assign(tweet_url_visited=False, tweet_deleted=False)
+        self.tweets_df = pd.concat([self.tweets_df, restored_df]).sort_index()
+        self.deleted_tweets_df = self.deleted_tweets_df.iloc[0:0]
+        # Exclude any of the restored tweets containing excluded hashtags.
+        self.filter_tweets()
+        self.write_journal({"op": "restore"})
+        return len(restored_df.index)
+
+    # Collect the hashtags of the tweets in a DataFrame into a single array in row order, along with the offset in that
+    # array of each tweet's first hashtag.
+    @staticmethod
+    def hashtags_to_offsets(tweets_df, hashtags_df):
+        tweet_positions = pd.Index(tweets_df["tweet_id"]).get_indexer(hashtags_df["tweet_id"])
+        found = tweet_positions != -1
+        tweet_positions = tweet_positions[found]
+        hashtags = hashtags_df["hashtag"].to_numpy()[found][np.argsort(tweet_positions, kind="stable")]
+        hashtag_counts = np.bincount(tweet_positions, minlength=len(tweets_df.index))
+        return np.concatenate([[0], np.cumsum(hashtag_counts)]).astype(np.int64), hashtags
+
+    # Encode strings as one array of UTF-8 bytes, returned with the offsets of the strings in it. The offsets are
+    # stored rather than a separator, as tweets may contain any character.
+    @staticmethod
+    def encode_strings(strings):
+        strings = list(strings)
+        encoded_strings = "".join(strings).encode("UTF-8")
+        string_lengths = [len(string) for string in strings]
+        if len(encoded_strings) != sum(string_lengths):
+            string_lengths = [len(string.encode("UTF-8")) for string in strings]
+        string_offsets = np.concatenate([[0], np.cumsum(string_lengths, dtype=np.int64)]).astype(np.int64)
+        return np.frombuffer(encoded_strings, dtype=np.uint8), string_offsets
+
+    # Decode a number of strings from an array of UTF-8 bytes and the offsets of the strings in it. Save files written
+    # before the offsets were stored separate the strings with null characters instead. Raises ValueError if the
+    # array doesn't hold the number of strings expected.
+    @staticmethod
+    def decode_strings(encoded_strings, count, string_offsets=None):
+        encoded_bytes = encoded_strings.tobytes()
+        if string_offsets is None:
+            strings = encoded_bytes.decode("UTF-8").split("\0") if count else []
+        elif len(string_offsets) != count + 1 or string_offsets[-1] != len(encoded_bytes):
+            strings = None
+        else:
+            string_bounds = string_offsets.tolist()
+            decoded_strings = encoded_bytes.decode("UTF-8")
+            if len(decoded_strings) == len(encoded_bytes):
+                strings = [decoded_strings[start:end] for start, end in zip(string_bounds, string_bounds[1:])]
+            else:
+                strings = [encoded_bytes[start:end].decode("UTF-8")
+                           for start, end in zip(string_bounds, string_bounds[1:])]
+        if strings is None or len(strings) != count:
+            raise ValueError("The save file holds {} strings where {} were expected."
+                             .format(len(string_offsets) - 1 if strings is None else len(strings), count))
+        return strings
+
+    # Add strings to arrays to be saved with numpy, as the encoded strings under the name given and their offsets.
+    @classmethod
+    def add_strings(cls, arrays, name, strings):
+        arrays[name], arrays[name + "_string_offsets"] = cls.encode_strings(strings)
+        return arrays
+
+    # Read strings added by add_strings from arrays loaded with numpy, checking that there are as many as expected.
+    @classmethod
+    def read_strings(cls, arrays, name, count):
+        string_offsets = arrays[name + "_string_offsets"] if name + "_string_offsets" in arrays else None
+        return cls.decode_strings(arrays[name], count, string_offsets)
+
+    # Write all tweets to the save file, with the date stored as datetime64, the ID as int64, the review status as a
+    # categorical, the URL visited and deleted flags as booleans and the hashtags as a list per tweet. The file is
+    # written under a temporary name and then renamed, so an existing save file is never left partly written. Returns
+    # the number of tweets written.
+    @instrumentation.instrumented("write_snapshot", rows=lambda session, snapshot_count: snapshot_count)
+    def write_snapshot(self, snapshot_df, hashtags_df):
+        hashtag_offsets, hashtags = self.hashtags_to_offsets(snapshot_df, hashtags_df)
+        snapshot_df = snapshot_df.reset_index(drop=True)
+        review_status = pd.Categorical(snapshot_df["tweet_review_status"], categories=self.REVIEW_STATUS_CATEGORIES)
+        with open(self.snapshot_filename + ".tmp", mode='wb') as snapshot_file:
+            if self.snapshot_filename.endswith(".parquet"):
+                snapshot_table = pa.Table.from_pandas(snapshot_df[["tweet_created", "tweet_id", "tweet_text"] +
+                                                                  self.FLAG_COL_NAMES]
+                                                      .assign(tweet_review_status=review_status), preserve_index=False)
+                snapshot_table = snapshot_table.append_column(
+                    "tweet_hashtags", pa.ListArray.from_arrays(pa.array(hashtag_offsets.astype(np.int32)),
+                                                               pa.array(hashtags, type=pa.string())))
+                pq.write_table(snapshot_table, snapshot_file)
+            else:
+                snapshot_arrays = {"tweet_created": snapshot_df["tweet_created"].dt.tz_convert(None).to_numpy(
+                                       dtype="datetime64[ns]"),
+                                   "tweet_id": snapshot_df["tweet_id"].to_numpy(dtype=np.int64),
+                                   "tweet_review_status": review_status.codes.astype(np.int8),
+                                   "hashtag_offsets": hashtag_offsets}
+                self.add_strings(snapshot_arrays, "tweet_text", snapshot_df["tweet_text"])
+                self.add_strings(snapshot_arrays, "tweet_review_status_categories", review_status.categories)
+                self.add_strings(snapshot_arrays, "hashtag", hashtags)
+                for col_name in self.FLAG_COL_NAMES:
+                    snapshot_arrays[col_name] = snapshot_df[col_name].to_numpy(dtype=bool)
+                np.savez(snapshot_file, **snapshot_arrays)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(self.snapshot_filename + ".tmp", self.snapshot_filename)
+        return len(snapshot_df.index)
+
+    # Read the tweets and hashtags DataFrames from a save file.
+    def read_snapshot(self, snapshot_filename):
+        if snapshot_filename.endswith(".parquet"):
+            snapshot_table = pq.read_table(snapshot_filename)
+            hashtag_lists = snapshot_table.column("tweet_hashtags").combine_chunks()
+            hashtag_offsets = hashtag_lists.offsets.to_numpy()
+            hashtags = hashtag_lists.flatten().to_numpy(zero_copy_only=False)
+            snapshot_df = snapshot_table.drop_columns(["tweet_hashtags"]).to_pandas()
+        else:
+            with np.load(snapshot_filename, allow_pickle=False) as snapshot_arrays:
+                tweet_count = len(snapshot_arrays["tweet_id"])
+                snapshot_df = pd.DataFrame({
+                    "tweet_created": pd.Series(snapshot_arrays["tweet_created"]).dt.tz_localize("UTC"),
+                    "tweet_id": snapshot_arrays["tweet_id"],
+                    "tweet_text": pd.Series(self.read_strings(snapshot_arrays, "tweet_text", tweet_count), dtype=str)})
+                snapshot_df["tweet_review_status"] = pd.Categorical.from_codes(
+                    snapshot_arrays["tweet_review_status"], categories=self.read_strings(
+                        snapshot_arrays, "tweet_review_status_categories", len(self.REVIEW_STATUS_CATEGORIES)))
+                # Save files written before the flags were booleans hold them as codes of "no" and "yes".
+                for col_name in self.FLAG_COL_NAMES:
+                    if col_name + "_categories" in snapshot_arrays:
+                        snapshot_df[col_name] = pd.Categorical.from_codes(
+                            snapshot_arrays[col_name], categories=self.decode_strings(
+                                snapshot_arrays[col_name + "_categories"], 2))
+                    else:
+                        snapshot_df[col_name] = snapshot_arrays[col_name]
+                hashtag_offsets = snapshot_arrays["hashtag_offsets"]
+                hashtags = self.read_strings(snapshot_arrays, "hashtag", hashtag_offsets[-1])
+        snapshot_df = self.compact_dtypes(snapshot_df[["tweet_created", "tweet_id", "tweet_text"] +
+                                                      StatusCounts.STATUS_COL_NAMES].copy())
+        hashtags_df = pd.DataFrame({"tweet_id": np.repeat(snapshot_df["tweet_id"].to_numpy(),
+                                                          np.diff(hashtag_offsets)),
+                                    "hashtag": pd.Series(hashtags, dtype=str)})
+        return snapshot_df, hashtags_df
+
+    # Load the text index saved next to the save file if it was built from the same tweets, in the same order, as a
+    # DataFrame of all tweets. Otherwise build the text index and save it.
+    def load_text_index(self, tweets_df):
+        tweets_key = hashlib.sha256(tweets_df.index.to_numpy(dtype=np.int64).tobytes() +
+                                    tweets_df["tweet_id"].to_numpy(dtype=np.int64).tobytes()).hexdigest()
+        if path.exists(self.text_index_filename):
+            with np.load(self.text_index_filename, allow_pickle=False) as text_index_arrays:
+                if str(text_index_arrays["tweets_key"]) == tweets_key:
+                    word_offsets = text_index_arrays["word_offsets"]
+                    words = np.array(self.read_strings(text_index_arrays, "words", len(word_offsets) - 1),
+                                     dtype=object)
+                    return TextIndex(tweets_df["tweet_text"], words, word_offsets, text_index_arrays["word_rows"],
+                                     text_index_arrays["pair_keys"], text_index_arrays["pair_offsets"],
+                                     text_index_arrays["pair_rows"])
+        text_index = TextIndex(tweets_df["tweet_text"])
+        with open(self.text_index_filename + ".tmp", mode='wb') as text_index_file:
+            np.savez(text_index_file, **self.add_strings({}, "words", text_index.words),
+                     tweets_key=np.array(tweets_key), word_offsets=text_index.word_offsets,
+                     word_rows=text_index.word_rows, pair_keys=text_index.pair_keys,
+                     pair_offsets=text_index.pair_offsets, pair_rows=text_index.pair_rows)
+        os.replace(self.text_index_filename + ".tmp", self.text_index_filename)
+        return text_index
+
+    # Search the text of the tweets, returning the row labels of the matching tweets which are not excluded or deleted,
+    # most recent first. See TextIndex.search for the form of the query.
+    def search_tweets(self, query):
+        rows = self.text_index.search(query)
+        return rows[self.sorted_ids_contain(self.tweets_df.index.to_numpy(), rows)]
+
+    # Save all tweets to the save file.
+    @instrumentation.instrumented("save")
+    def save_df(self):
+        self.write_snapshot(self.snapshot_df(), self.hashtags_df)
+
+    # Export DataFrame as CSV file, along with the deleted tweets. Tweets excluded by the filter are left out, so the
+    # CSV file holds the tweets being reviewed.
+    @instrumentation.instrumented("export_csv")
+    def save_df_as_csv(self):
+        self.tweets_to_csv_columns(self.tweets_df).to_csv(self.saved_filename, index=None, header=True)
+        if len(self.deleted_tweets_df.index) or path.exists(self.deleted_filename):
+            self.tweets_to_csv_columns(self.deleted_tweets_df).to_csv(self.deleted_filename, index=None, header=True)
+
+    # Append a record of a change to the journal. The record is flushed straight away so it survives the program
+    # crashing, and the journal is synced to disk in batches.
+    def write_journal(self, record):
+        # Changes made while replaying the journal are not written to it again.
+        if self.journal_file is None:
+            return
+        self.journal_file.write(json.dumps(record) + "\n")
+        self.journal_file.flush()
+        self.journal_records += 1
+        self.unsynced_records += 1
+        if (self.unsynced_records >= self.JOURNAL_SYNC_RECORDS or
+                time.monotonic() - self.last_sync_time >= self.JOURNAL_SYNC_SECONDS):
+            self.sync_journal()
+        if self.journal_records >= self.JOURNAL_COMPACT_RECORDS:
+            self.compact_journal()
+
+    # Sync the journal to disk.
+    def sync_journal(self):
+        os.fsync(self.journal_file.fileno())
+        self.unsynced_records = 0
+        self.last_sync_time = time.monotonic()
+
+    # Apply the changes recorded in a journal file to the loaded data, returning the number of records applied.
+    def replay_journal(self, journal_filename):
+        records = []
+        with open(journal_filename, mode='r', encoding="UTF-8") as journal_file:
+            for line in journal_file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A record that was only partly written when the program stopped ends the journal.
+                    break
+        # Consecutive updates are applied together. Purging, restoring and resetting are applied in order between them.
+        set_records = []
+        for record in records:
+            if record["op"] == "set" and "tweet_ids" in record:
+                # An update of several tweets at once.
+                set_records.extend({"tweet_id": tweet_id, "column": record["column"], "value": record["value"]}
+                                   for tweet_id in record["tweet_ids"])
+            elif record["op"] == "set":
+                set_records.append(record)
+            else:
+                self.apply_journal_sets(set_records)
+                set_records = []
+                if record["op"] == "purge":
+                    self.purge_deleted_tweets()
+                elif record["op"] == "restore":
+                    self.restore_deleted_tweets()
+                elif record["op"] == "reset":
+                    self.reset_df()
+        self.apply_journal_sets(set_records)
+        return len(records)
+
+    # Apply a batch of journal updates, keeping only the last value written to each column of each tweet.
+    def apply_journal_sets(self, set_records):
+        if not len(set_records):
+            return
+        records_df = pd.DataFrame(set_records).drop_duplicates(subset=["tweet_id", "column"], keep="last")
+        for tweets_df in [self.tweets_df, self.excluded_tweets_df]:
+            tweet_ids = pd.Index(tweets_df["tweet_id"].astype(np.int64))
+            for col_name, col_records_df in records_df.groupby("column"):
+                tweet_positions = tweet_ids.get_indexer(col_records_df["tweet_id"])
+                found = tweet_positions != -1
+                values = col_records_df["value"].to_numpy()[found]
+                # Journals written before the flags were booleans record them as "yes" and "no".
+                if col_name in self.FLAG_COL_NAMES:
+                    values = pd.Series(values).isin([True, "yes"]).to_numpy()
+                tweets_df.iloc[tweet_positions[found], tweets_df.columns.get_loc(col_name)] = values
+        self.status_counts = StatusCounts(self.tweets_df, self.hashtags_df)
+
+    # Fold the journal into the save file. The journal is moved aside and a copy of the data taken straight away, and
+    # the save file is then written by a background thread so the program doesn't pause.
+    @instrumentation.instrumented("compact_journal")
+    def compact_journal(self):
+        # Only one compaction runs at a time.
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+        self.sync_journal()
+        self.journal_file.close()
+        # Move the journal aside. If a compaction was interrupted before it finished, add the journal to the end of the
+        # journal that was already moved aside.
+        if path.exists(self.compacting_journal_filename):
+            with open(self.journal_filename, mode='r', encoding="UTF-8") as journal_file, \
+                    open(self.compacting_journal_filename, mode='a', encoding="UTF-8") as compacting_journal_file:
+                compacting_journal_file.write(journal_file.read())
+                compacting_journal_file.flush()
+                os.fsync(compacting_journal_file.fileno())
+            os.remove(self.journal_filename)
+        else:
+            os.replace(self.journal_filename, self.compacting_journal_filename)
+        self.journal_file = open(self.journal_filename, mode='a', encoding="UTF-8")
+        self.journal_records = 0
+        self.compaction_thread = threading.Thread(target=self.write_compacted_snapshot,
+                                                  args=(self.snapshot_df(), self.hashtags_df))
+        self.compaction_thread.start()
+
+    # Write the save file from a copy of the data and remove the journal that has been folded into it.
+    def write_compacted_snapshot(self, snapshot_df, hashtags_df):
+        self.write_snapshot(snapshot_df, hashtags_df)
+        os.remove(self.compacting_journal_filename)
+
+    # Compact any outstanding changes into the save file and close the journal, waiting for the save to finish.
+    def close(self):
+        if self.journal_file is None:
+            return
+        if self.journal_records or path.exists(self.compacting_journal_filename):
+            self.compact_journal()
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+        self.journal_file.close()
+        self.journal_file = None
+
+    # Read a CSV save file into tweet and hashtag DataFrames, reading the text and hashtag columns as strings. The URL
+    # of each tweet is dropped as it is created from the ID when needed, and the statuses are converted to their
+    # compact types.
+    def read_saved_csv(self, filename):
+        col_names = pd.read_csv(filename, nrows=0).columns.values.tolist()
+        text_dtypes = {col_name: str for col_name in col_names
+                       if col_name == "tweet_text" or col_name.startswith("hashtag_")}
+        tweets_df = pd.read_csv(filename, header=0, dtype=text_dtypes)
+        tweets_df["tweet_created"] = pd.to_datetime(tweets_df["tweet_created"], utc=True)
+        tweets_df["tweet_id"] = tweets_df["tweet_id"].astype(np.int64)
+        tweets_df = self.compact_dtypes(tweets_df.drop(columns=["tweet_url"], errors="ignore"))
+        return self.hashtags_from_columns(tweets_df)
+
+    # Report the progress of loading the data, as a stage and the fraction of that stage completed.
+    def report_load_progress(self, stage, fraction=0.0):
+        if self.load_progress is not None:
+            stage_name, start_percent, end_percent = self.LOAD_STAGES[stage]
+            self.load_progress(stage_name, int(start_percent + fraction * (end_percent - start_percent)))
+
+    # Load existing or create new tweet and hashtag DataFrames, then index the hashtags and filter the tweets. If given,
+    # progress is called with the name of each stage and the overall percentage as the data is loaded.
+    @instrumentation.instrumented("load")
+    def load_df(self, progress=None):
+        self.load_progress = progress
+        self.report_load_progress("read")
+        # Check if a save file exists, falling back to a .npz save file if pyarrow has been installed since it was
+        # written.
+        snapshot_filenames = [snapshot_filename for snapshot_filename in
+                              [self.snapshot_filename, self.npz_snapshot_filename] if path.exists(snapshot_filename)]
+        tweetjs_fingerprint = None
+        if len(snapshot_filenames):
+            tweets_df, hashtags_df = self.read_snapshot(snapshot_filenames[0])
+            new_save_file = snapshot_filenames[0] != self.snapshot_filename
+            replay_journal = True
+        elif path.exists(self.saved_filename):
+            # Load existing CSV from an earlier version of the program, along with the deleted tweets CSV if there is
+            # one.
+            tweets_df, hashtags_df = self.read_saved_csv(self.saved_filename)
+            if path.exists(self.deleted_filename):
+                deleted_df, deleted_hashtags_df = self.read_saved_csv(self.deleted_filename)
+                tweets_df = pd.concat([tweets_df, deleted_df]).sort_values(by=["tweet_created"], ascending=False,
+                                                                           kind="stable", ignore_index=True)
+                hashtags_df = pd.concat([hashtags_df, deleted_hashtags_df], ignore_index=True)
+            new_save_file = True
+            replay_journal = True
+            self.converted_csv = True
+        else:
+            # Import raw data and create new DataFrames.
+            tweetjs_fingerprint = self.tweetjs_fingerprint()
+            tweets = self.import_raw_tweets_data()
+            self.report_load_progress("build")
+            tweets_df, hashtags_df = self.create_tweet_df(tweets)
+            new_save_file = True
+            replay_journal = False
+        if replay_journal and len(self.tweetjs_filenames()):
+            # If the tweet.js files have changed since the save file was last brought up to date with them, add any new
+            # tweets from them. The save file is written with them straight away, before the journal is applied on top.
+            previous_fingerprint = self.read_tweetjs_fingerprint()
+            tweetjs_fingerprint = self.tweetjs_fingerprint(previous_fingerprint)
+            if self.converted_csv and previous_fingerprint is None:
+                # Earlier versions of the program dropped deleted tweets and tweets with excluded hashtags from the CSV
+                # file for good, so the tweets in tweet.js which are missing from it are not new. They are added as
+                # they would have been kept by this version, so they are not taken for new tweets again later. Tweets
+                # posted after the CSV file was written are added as new tweets.
+                tweets_df, hashtags_df, self.new_tweet_count = self.merge_new_tweets(tweets_df, hashtags_df,
+                                                                                     missing_from_csv=True)
+            elif self.tweetjs_changed(previous_fingerprint, tweetjs_fingerprint):
+                tweets_df, hashtags_df, self.new_tweet_count = self.merge_new_tweets(tweets_df, hashtags_df)
+                if self.new_tweet_count and not new_save_file:
+                    self.write_snapshot(tweets_df, hashtags_df)
+            elif tweetjs_fingerprint == previous_fingerprint:
+                tweetjs_fingerprint = None
+        self.report_load_progress("build")
+        self.hashtags_df = hashtags_df
+        self.hashtag_index = HashtagIndex(tweets_df, hashtags_df)
+        self.text_index = self.load_text_index(tweets_df)
+        self.report_load_progress("filter")
+        # Keep deleted tweets apart from the rest.
+        deleted_mask = tweets_df["tweet_deleted"].to_numpy()
+        self.deleted_tweets_df = tweets_df[deleted_mask]
+        self.tweets_df = tweets_df[~deleted_mask]
+        self.excluded_tweets_df = self.tweets_df.iloc[0:0]
+        self.filter_tweets()
+        # Apply the changes made since the save file was last written, including those from a compaction that didn't
+        # finish. A journal left behind by a save file that no longer exists is discarded.
+        replayed_records = 0
+        journal_filenames = [journal_filename for journal_filename in
+                             [self.compacting_journal_filename, self.journal_filename] if path.exists(journal_filename)]
+        if replay_journal:
+            for journal_filename in journal_filenames:
+                replayed_records += self.replay_journal(journal_filename)
+        if new_save_file:
+            # Write the new save file straight away, so that the journal always has a save file to be applied to. The
+            # journals are only removed once the changes replayed from them are in the new save file.
+            self.save_df()
+            for journal_filename in journal_filenames:
+                os.remove(journal_filename)
+        if tweetjs_fingerprint is not None:
+            self.write_tweetjs_fingerprint(tweetjs_fingerprint)
+        self.journal_file = open(self.journal_filename, mode='a', encoding="UTF-8")
+        # Fold any replayed changes into the save file in the background.
+        if replayed_records and not new_save_file:
+            self.compact_journal()
+        self.report_load_progress("filter", 1.0)
+        self.load_progress = None
+        return self.tweets_df
+
+    # Reset the review status, url visited and deleted columns in the DataFrame.
+    def reset_df(self):
+        for tweets_df in [self.tweets_df, self.excluded_tweets_df]:
+            tweets_df["tweet_review_status"] = pd.Categorical(["none"] * len(tweets_df.index),
+                                                              categories=self.REVIEW_STATUS_CATEGORIES)
+            tweets_df["tweet_url_visited"] = False
+            tweets_df["tweet_deleted"] = False
+        self.status_counts = StatusCounts(self.tweets_df, self.hashtags_df)
+        self.write_journal({"op": "reset"})
+        return self.tweets_df
+
+
+class TweetRules:
+    # Keys a rule may have. Every condition given must hold for a tweet to match the rule.
+    RULE_KEYS = ["name", "status", "include_reviewed", "created_from", "created_before", "hashtags", "text_pattern",
+                 "ignore_case", "reply", "retweet"]
+    # Starts of the text of replies and retweets.
+    REPLY_PREFIX = "@"
+    RETWEET_PREFIX = "RT @"
+
+    # Ordered list of rules, each a dictionary giving the review status to set and the conditions a tweet must meet.
+    # The rules are checked when they are created so a mistake in the rule file is reported before any data is loaded.
+    def __init__(self, rules):
+        self.rules = []
+        for rule_number, rule in enumerate(rules, start=1):
+            rule = dict(rule)
+            rule.setdefault("name", "rule {}".format(rule_number))
+            unknown_keys = sorted(set(rule) - set(self.RULE_KEYS))
+            if len(unknown_keys):
+                raise ValueError("{}: unknown keys {}".format(rule["name"], ", ".join(unknown_keys)))
+            if rule.get("status") not in TweetSession.REVIEW_STATUS_CATEGORIES:
+                raise ValueError("{}: status must be one of {}".format(
+                    rule["name"], ", ".join(TweetSession.REVIEW_STATUS_CATEGORIES)))
+            for key in ["created_from", "created_before"]:
+                if key in rule:
+                    # Tweet dates are held in UTC, which dates without a time zone are taken to be in.
+                    created = pd.Timestamp(rule[key])
+                    rule[key] = created.tz_localize("UTC") if created.tzinfo is None else created.tz_convert("UTC")
+            if "text_pattern" in rule:
+                try:
+                    re.compile(rule["text_pattern"])
+                except re.error as error:
+                    raise ValueError("{}: invalid text_pattern: {}".format(rule["name"], error))
+            self.rules.append(rule)
+
+    # Read the rules from a JSON file holding a list of rules.
+    @classmethod
+    def from_file(cls, rules_filename):
+        with open(rules_filename, mode='r', encoding="UTF-8") as rules_file:
+            return cls(json.load(rules_file))
+
+    # Boolean mask of the tweets in the session's tweets_df matching the conditions of a rule, with each condition
+    # applied to whole columns at once.
+    @classmethod
+    def rule_mask(cls, session, rule):
+        tweets_df = session.tweets_df
+        mask = np.ones(len(tweets_df.index), dtype=bool)
+        if "created_from" in rule:
+            mask &= (tweets_df["tweet_created"] >= rule["created_from"]).to_numpy()
+        if "created_before" in rule:
+            mask &= (tweets_df["tweet_created"] < rule["created_before"]).to_numpy()
+        if "hashtags" in rule:
+            mask &= tweets_df.index.isin(session.hashtag_index.rows_with_any(rule["hashtags"]))
+        tweet_texts = tweets_df["tweet_text"]
+        if "text_pattern" in rule:
+            flags = re.IGNORECASE if rule.get("ignore_case", True) else 0
+            mask &= tweet_texts.str.contains(rule["text_pattern"], flags=flags, regex=True).to_numpy(dtype=bool)
+        for key, prefix in [("reply", cls.REPLY_PREFIX), ("retweet", cls.RETWEET_PREFIX)]:
+            if key in rule:
+                mask &= tweet_texts.str.startswith(prefix).to_numpy(dtype=bool) == bool(rule[key])
+        return mask
+
+    # Set the review status of the tweets matched by the rules. Each tweet takes the status of the first rule it
+    # matches, and by default only tweets still awaiting review are changed. The new statuses are written with one
+    # bulk update per status. Returns a report of the tweets matched and classified by each rule and the time taken.
+    def apply(self, session, dry_run=False):
+        tweets_df = session.tweets_df
+        review_statuses = tweets_df["tweet_review_status"].to_numpy()
+        pending = review_statuses == "none"
+        claimed = np.zeros(len(tweets_df.index), dtype=bool)
+        status_masks = {}
+        report = []
+        for rule in self.rules:
+            start_time = time.perf_counter()
+            mask = self.rule_mask(session, rule)
+            matched = int(mask.sum())
+            if not rule.get("include_reviewed", False):
+                mask &= pending
+            mask &= ~claimed
+            claimed |= mask
+            status = rule["status"]
+            status_masks[status] = status_masks.get(status, np.zeros(len(tweets_df.index), dtype=bool)) | mask
+            report.append({"name": rule["name"], "status": status, "matched": matched,
+                           "classified": int((mask & (review_statuses != status)).sum()),
+                           "seconds": time.perf_counter() - start_time})
+        start_time = time.perf_counter()
+        if not dry_run:
+            for status, mask in status_masks.items():
+                session.set_review_statuses(tweets_df.index[mask & (review_statuses != status)], status)
+        report.append({"name": "write", "status": None, "matched": int(claimed.sum()),
+                       "classified": sum(rule_report["classified"] for rule_report in report),
+                       "seconds": time.perf_counter() - start_time})
+        return report
+
+
+class AsyncHttpClient:
+    # Seconds to wait for the response to a request.
+    REQUEST_TIMEOUT = 30.0
+
+    # Small HTTP/1.1 client built on asyncio streams, for sending many short requests to one server. Connections are
+    # kept open and reused between requests, with no more than max_connections open at once. Must be created inside
+    # the event loop it is used from.
+    def __init__(self, base_url, max_connections):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.base_path = url.path
+        self.ssl_context = ssl.create_default_context() if url.scheme == "https" else None
+        self.connection_slots = asyncio.Semaphore(max_connections)
+        self.idle_connections = []
+        self.connections_opened = 0
+
+    # Send a request with an empty body to a path relative to the base URL, reusing an idle connection if there is one.
+    # Returns the status, the headers with lowercase names and the body of the response. A connection that fails is
+    # closed rather than reused.
+    async def request(self, method, path, headers=None):
+        async with self.connection_slots:
+            if len(self.idle_connections):
+                reader, writer = self.idle_connections.pop()
+            else:
+                self.connections_opened += 1
+                reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl_context)
+            try:
+                status, response_headers, body = await asyncio.wait_for(
+                    self.exchange(reader, writer, method, self.base_path + path, headers or {}), self.REQUEST_TIMEOUT)
+            except BaseException:
+                writer.close()
+                raise
+            if response_headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self.idle_connections.append((reader, writer))
+            return status, response_headers, body
+
+    # Write a request to a connection and read the response to it. Raises ValueError if the response is malformed.
+    async def exchange(self, reader, writer, method, path, headers):
+        request_headers = {"Host": self.host, "Content-Length": "0", "Connection": "keep-alive"}
+        request_headers.update(headers)
+        writer.write("{} {} HTTP/1.1\r\n{}\r\n".format(method, path, "".join(
+            "{}: {}\r\n".format(name, value) for name, value in request_headers.items())).encode("latin-1"))
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by the server")
+        status_parts = status_line.split(None, 2)
+        if len(status_parts) < 2 or not status_parts[0].startswith(b"HTTP/") or not status_parts[1].isdigit():
+            raise ValueError("Malformed status line from the server: {!r}".format(status_line))
+        status = int(status_parts[1])
+        response_headers = {}
+        while True:
+            header_line = await reader.readline()
+            if not header_line.strip():
+                break
+            name, _, value = header_line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            body_chunks = []
+            while True:
+                chunk_size = int((await reader.readline()).split(b";")[0], 16)
+                if not chunk_size:
+                    break
+                body_chunks.append(await reader.readexactly(chunk_size))
+                await reader.readexactly(2)
+            # Skip any trailing headers.
+            while (await reader.readline()).strip():
+                pass
+            body = b"".join(body_chunks)
+        elif "content-length" in response_headers:
+            body = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            # The body runs to the end of the connection, which can't be reused.
+            body = await reader.read()
+            response_headers["connection"] = "close"
+        return status, response_headers, body
+
+    # Close the idle connections.
+    def close(self):
+        for reader, writer in self.idle_connections:
+            writer.close()
+        self.idle_connections = []
+
+
+class TweetDeleter:
+    # Twitter API endpoint for deleting tweets, to which the ID of the tweet is added.
+    API_URL = "https://api.twitter.com/2/tweets/"
+    # Number of connections, and so of deletions in progress at once.
+    MAX_CONNECTIONS = 8
+    # Number of deletions, or seconds since the last checkpoint, after which the deleted tweets are written back to the
+    # session.
+    CHECKPOINT_RECORDS = 100
+    CHECKPOINT_SECONDS = 5.0
+    # Number of attempts made to delete a tweet when the server fails or can't be reached, and the seconds waited
+    # before the second attempt, doubling for each attempt after that up to the maximum.
+    MAX_ATTEMPTS = 5
+    BACKOFF_SECONDS = 1.0
+    MAX_BACKOFF_SECONDS = 60.0
+    # Seconds to wait when rate limited without being told how long to wait.
+    DEFAULT_RETRY_SECONDS = 60.0
+
+    # Deletes the tweets marked for deletion which have not yet been opened in the delete process, through the Twitter
+    # API with a user access token allowed to delete tweets. Deleted tweets are written back to the session in batches,
+    # which are recorded in the journal, so an interrupted run carries on from the last batch when run again. Tweets
+    # which couldn't be deleted are left as they were, to be tried again. If given, progress is called with the number
+    # of tweets finished with and the number to delete after each batch.
+    def __init__(self, session, access_token, api_url=API_URL, max_connections=MAX_CONNECTIONS, progress=None):
+        self.session = session
+        self.access_token = access_token
+        self.api_url = api_url
+        self.max_connections = max_connections
+        self.progress = progress
+        self.report = None
+        # Queue of the row labels of the tweets to delete, along with the number of attempts made to delete each, and
+        # the number of tweets not yet finished with.
+        self.row_queue = None
+        self.unfinished_count = 0
+        self.deleted_rows = []
+        self.last_checkpoint_time = time.monotonic()
+        # Event loop time before which no requests are sent, after being rate limited.
+        self.resume_time = 0.0
+
+    # Get the row labels of tweets awaiting deletion, most recent first.
+    def pending_delete_rows(self):
+        tweets_df = self.session.tweets_df
+        return tweets_df.index[((tweets_df["tweet_review_status"] == "delete") &
+                                ~tweets_df["tweet_url_visited"]).to_numpy()]
+
+    # Delete the tweets and return a report of the outcome.
+    @instrumentation.instrumented("delete_pipeline", rows=lambda deleter, report: report["pending"])
+    def run(self):
+        return asyncio.run(self.delete_tweets())
+
+    # Delete the tweets with a fixed number of workers sharing a queue of the tweets and a pool of connections.
+    async def delete_tweets(self):
+        start_time = time.perf_counter()
+        pending_rows = self.pending_delete_rows()
+        self.report = {"pending": len(pending_rows), "deleted": 0, "already_deleted": 0, "failed": 0, "retries": 0,
+                       "rate_limited": 0, "errors": {}, "connections": 0, "seconds": 0.0}
+        self.unfinished_count = len(pending_rows)
+        self.row_queue = asyncio.Queue()
+        for row_index in pending_rows:
+            self.row_queue.put_nowait((row_index, 0))
+        if not self.unfinished_count:
+            self.stop_workers()
+        client = AsyncHttpClient(self.api_url, self.max_connections)
+        workers = [asyncio.ensure_future(self.delete_worker(client)) for _ in range(self.max_connections)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Stop the other workers if one fails or the run is interrupted, keeping the tweets already deleted.
+            for worker in workers:
+                worker.cancel()
+            client.close()
+            self.checkpoint()
+            self.report["connections"] = client.connections_opened
+            self.report["seconds"] = round(time.perf_counter() - start_time, 3)
+        return self.report
+
+    # Take tweets from the queue and delete them until every tweet has been finished with. A tweet is put back on the
+    # queue to be tried again when rate limited, or after a delay following a failure that may not happen again, so
+    # the worker can carry on with other tweets in the meantime.
+    async def delete_worker(self, client):
+        loop = asyncio.get_event_loop()
+        while True:
+            queued_row = await self.row_queue.get()
+            if queued_row is None:
+                return
+            row_index, attempt = queued_row
+            if self.resume_time > loop.time():
+                await asyncio.sleep(self.resume_time - loop.time())
+            tweet_id = self.session.tweets_df.at[row_index, "tweet_id"]
+            try:
+                status, headers, body = await client.request("DELETE", str(tweet_id),
+                                                             {"Authorization": "Bearer " + self.access_token})
+            except (OSError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                status, headers, body = None, {}, b""
+            if status == 200 and self.deleted_in_response(body):
+                self.report["deleted"] += 1
+                self.deleted_rows.append(row_index)
+                self.finish_row()
+            elif status == 404:
+                # The tweet no longer exists, so it has already been deleted.
+                self.report["already_deleted"] += 1
+                self.deleted_rows.append(row_index)
+                self.finish_row()
+            elif status == 429:
+                # Wait until the rate limit is lifted, pausing every worker, and then try the tweet again.
+                self.report["rate_limited"] += 1
+                self.resume_time = max(self.resume_time, loop.time() + self.retry_seconds(headers))
+                self.row_queue.put_nowait(queued_row)
+            elif status == 401:
+                raise PermissionError("The access token was not accepted by the Twitter API (HTTP 401).")
+            elif (status is None or status >= 500) and attempt + 1 < self.MAX_ATTEMPTS:
+                self.report["retries"] += 1
+                loop.call_later(min(self.BACKOFF_SECONDS * 2 ** attempt, self.MAX_BACKOFF_SECONDS),
+                                self.row_queue.put_nowait, (row_index, attempt + 1))
+            else:
+                self.report["failed"] += 1
+                error = "connection" if status is None else str(status)
+                self.report["errors"][error] = self.report["errors"].get(error, 0) + 1
+                self.finish_row()
+            if (len(self.deleted_rows) >= self.CHECKPOINT_RECORDS or
+                    time.monotonic() - self.last_checkpoint_time >= self.CHECKPOINT_SECONDS):
+                self.checkpoint()
+
+    # Count a tweet as finished with, and stop the workers once every tweet has been.
+    def finish_row(self):
+        self.unfinished_count -= 1
+        if not self.unfinished_count:
+            self.stop_workers()
+
+    # Tell every worker to stop, once it reaches the end of the queue.
+    def stop_workers(self):
+        for _ in range(self.max_connections):
+            self.row_queue.put_nowait(None)
+
+    # Check the body of a successful response confirms the tweet was deleted.
+    @staticmethod
+    def deleted_in_response(body):
+        try:
+            return bool(json.loads(body.decode("UTF-8"))["data"]["deleted"])
+        except (ValueError, KeyError, TypeError):
+            return False
+
+    # Seconds to wait after being rate limited, from the Retry-After header, the time the rate limit is reset or, if
+    # the response gives neither, the default.
+    def retry_seconds(self, headers):
+        try:
+            if "retry-after" in headers:
+                return max(float(headers["retry-after"]), 0.0)
+            if "x-rate-limit-reset" in headers:
+                return max(float(headers["x-rate-limit-reset"]) - time.time(), 0.0)
+        except ValueError:
+            pass
+        return self.DEFAULT_RETRY_SECONDS
+
+    # Write the tweets deleted since the last checkpoint back to the session, which records them in the journal.
+    def checkpoint(self):
+        if len(self.deleted_rows):
+            self.session.set_deleted_statuses(self.deleted_rows, True)
+            self.session.sync_journal()
+            self.deleted_rows = []
+        self.last_checkpoint_time = time.monotonic()
+        if self.progress is not None:
+            self.progress(self.report["deleted"] + self.report["already_deleted"] + self.report["failed"],
+                          self.report["pending"])
 
 
 class MyTweetReviewerBase:
@@ -28,15 +1818,13 @@ class MyTweetReviewerBase:
     WINDOW_FONT_VALUE = "Verdana"
     # Favicon.
     FAVICON = "mtr_favicon.ico"
-    # Original tweet.js filename.
-    TWEETJS_FILENAME = "tweet.js"
 
     # Window dimensions and name.
     window_w = 0
     window_h = 0
     window_name = " "
 
-    def __init__(self, master, username, excluded_hashtags=None, saved_filename=None):
+    def __init__(self, master, session):
         self.root = master
         self.root.title(self.window_name)
         self.root.iconbitmap(self.FAVICON)
@@ -44,16 +1832,13 @@ class MyTweetReviewerBase:
         self.root.resizable(0, 0)
         self.root.configure(background=self.SHADE_TWO)
         self.root.option_add(self.WINDOW_FONT_PATTERN, self.WINDOW_FONT_VALUE)
-        self.username = username
-        if excluded_hashtags is None:
-            self.excluded_hashtags = []
-        else:
-            self.excluded_hashtags = excluded_hashtags
-        if saved_filename is None:
-            self.saved_filename = "my_tweet_review.csv"
-        else:
-            self.saved_filename = saved_filename
-        self.tweets_df = self.load_df()
+        # Session holding the tweet data shared between all windows.
+        self.session = session
+
+    # DataFrame of tweets held by the session.
+    @property
+    def tweets_df(self):
+        return self.session.tweets_df
 
     # Calculate centre of screen and open window centrally.
     @staticmethod
@@ -64,130 +1849,30 @@ class MyTweetReviewerBase:
         window_top_left_y = int((screen_height / 2) - (window_height / 2))
         return "{}x{}+{}+{}".format(window_width, window_height, window_top_left_x, window_top_left_y)
 
-    # Import the data from tweet.js.
-    def import_raw_tweets_data(self):
-        # Check tweet.js file exists in same folder as my_tweet_reviewer program and exit if it isn't found.
-        if not path.exists(self.TWEETJS_FILENAME):
-            self.tweetjs_missing_popup()
-        with open(self.TWEETJS_FILENAME, mode='r', encoding="UTF-8") as raw_tweets_data:
-            data = raw_tweets_data.read()
-            # The data needed from tweet.js is contained within the first "[" and last "]".
-            data = data[data.find('['): data.rfind(']') + 1]
-        tweets_data = json.loads(data)
-        # The tweet data comes as a list of dictionaries, each tweet being a dictionaryo of many key-value pairs.
-        # For each tweet retrieve just the date of the tweet, tweet ID, tweet text and hashtags.
-        tweets_list = []
-        for tweet in tweets_data:
-            # Date and ID.
-            tweet_dict = {"tweet_created": tweet["created_at"], "tweet_id": tweet["id_str"]}
-            # Text. Remove all special characters such as emojis because Tkinter has trouble displaying some of them.
-            # Reduce the tweet into a string of only ASCII characters for simplicity.
-            tweet_dict["tweet_text"] = tweet["full_text"].encode("UTF-8").decode("ascii", errors="ignore")
-            # Hashtags. Add hashtags to dictionary only if the tweet contains them.
-            tweet_hashtags = []
-            for hashtag in tweet["entities"]["hashtags"]:
-                tweet_hashtags.append(hashtag["text"])
-            if len(tweet_hashtags):
-                tweet_dict["tweet_hashtags"] = tweet_hashtags
-            # Create complete tweet URL.
-            tweet_dict["tweet_url"] = "https://twitter.com/" + self.username.strip('@') + "/status/" + tweet["id_str"]
-            # Append tweet dictionary to tweets list.
-            tweets_list.append(tweet_dict)
-        # Return list of tweets.
-        return tweets_list
-
     # Show tweet.js missing popup and exit program.
     @staticmethod
     def tweetjs_missing_popup():
-        tk.messagebox.showerror(title="Missing File", message="The file tweet.js is not present in the same folder as "
-                                                              "this program. Please address this and restart the "
-                                                              "program.")
+        tk.messagebox.showerror(title="Missing File", message="Neither tweet.js nor the tweet-part1.js, "
+                                                              "tweet-part2.js... files of a split archive are present "
+                                                              "in the same folder as this program. Please address this "
+                                                              "and restart the program.")
         sys.exit()
 
-    # Create new DataFrame of tweets.
-    @staticmethod
-    def create_tweet_df(original_tweets_list):
-        original_tweets_df = pd.DataFrame(original_tweets_list, columns=["tweet_created", "tweet_id", "tweet_text",
-                                                                         "tweet_hashtags", "tweet_url"])
-        # Convert created_at column of DataFrame to datetime format.
-        original_tweets_df["tweet_created"] = pd.to_datetime(original_tweets_df["tweet_created"],
-                                                             format='%a %b %d %H:%M:%S %z %Y')
-        # Sort DataFrame by date, most recent first.
-        original_tweets_df.sort_values(by=["tweet_created"], ascending=False, inplace=True)
-        # Extract each hashtag into a column of its own.
-        hashtag_df = original_tweets_df["tweet_hashtags"].apply(pd.Series).add_prefix("hashtag_")
-        original_tweets_df = pd.concat([original_tweets_df, hashtag_df], axis=1)
-        # Drop original hashtags column as it is no longer required.
-        original_tweets_df.drop("tweet_hashtags", axis=1, inplace=True)
-        # Add a tweet_review_status column to the DataFrame with default "none" values. This column will track the
-        # tweets that have been reviewed.
-        original_tweets_df["tweet_review_status"] = "none"
-        # Add a tweet_url_visited column to the DataFrame with default "no" values. This column will track the tweets
-        # that have been viewed in the browser.
-        original_tweets_df["tweet_url_visited"] = "no"
-        # Add a tweet_deleted column with default "no" values. This column will track the tweets that have been deleted
-        # prior to their removal from the data.
-        original_tweets_df["tweet_deleted"] = "no"
-        # Return original DataFrame containing tweets.
-        return original_tweets_df
-
-    # Filter tweets DataFrame.
-    def filter_tweets(self, original_df):
-        # Get a list containing all hashtag column names in the DataFrame.
-        df_col_names = original_df.columns.values.tolist()
-        hashtag_col_names = []
-        for col_name in df_col_names:
-            if "hashtag_" in col_name:
-                hashtag_col_names.append(col_name)
-        # Create a new DataFrame with rows (tweets) removed if they contain any of the hashtags in the excluded hashtags
-        # list.
-        filtered_df = original_df.copy()
-        for hashtag_col_name in hashtag_col_names:
-            # Convert all hashtag columns to lowercase strings.
-            filtered_df[hashtag_col_name] = filtered_df[hashtag_col_name].str.lower()
-            # Remove rows from DataFrame if there are any hashtags in the exclusion list.
-            if len(self.excluded_hashtags):
-                filtered_df = filtered_df[~(filtered_df[hashtag_col_name].isin(self.excluded_hashtags))]
-        # Return the filtered DataFrame.
-        return filtered_df
-
-    # Save DataFrame as CSV file.
-    def save_df_as_csv(self):
-        self.tweets_df.to_csv(self.saved_filename, index=None, header=True)
-
-    # Show save DataFrame popup.
-    def save_df_popup(self):
-        save_decision = tk.messagebox.askyesno(title="Save", message="Would you like to save your progress and quit? "
-                                                                     "This will overwrite any existing save file.")
-        if save_decision == 1:
-            tk.messagebox.showinfo(title="Save Completed", message="Progress was saved successfully.")
-            self.save_df_as_csv()
-        else:
-            tk.messagebox.showinfo(title="Save Cancelled", message="Progress was not saved.")
-
-    # Load existing or create new tweet DataFrame.
-    def load_df(self):
-        # Check if CSV exists.
-        if path.exists(self.saved_filename):
-            # Load existing CSV.
-            tweets_df = pd.read_csv(self.saved_filename, header=0)
-        else:
-            # Import raw data and create new DataFrame.
-            tweets = self.import_raw_tweets_data()
-            tweets_df = self.create_tweet_df(tweets)
-            tweets_df = self.filter_tweets(tweets_df)
-        return tweets_df
+    # Show new tweets added popup.
+    def new_tweets_popup(self):
+        tk.messagebox.showinfo(title="New Tweets", message="{} new tweets have been added from tweet.js."
+                               .format(self.session.new_tweet_count))
 
-    # Reset the review status, url visited and deleted columns in the DataFrame.
-    def reset_df(self):
-        # Ensure tweet_df is up to date by reloading the DataFrame prior to resetting columns (needed as main window is
-        # not refreshed at any point).
-        self.tweets_df = self.load_df()
-        self.tweets_df["tweet_review_status"] = "none"
-        self.tweets_df["tweet_url_visited"] = "no"
-        self.tweets_df["tweet_deleted"] = "no"
-        self.save_df_as_csv()
-        return self.tweets_df
+    # Show CSV save file converted popup, with the number of tweets missing from the CSV file which were kept aside as
+    # deleted.
+    def converted_csv_popup(self):
+        message = ("The data in {} from an earlier version of the program has been converted to {}. The CSV file is no "
+                   "longer updated unless exported."
+                   .format(self.session.saved_filename, self.session.snapshot_filename))
+        if self.session.converted_deleted_count:
+            message += (" {} tweets in tweet.js which were missing from the CSV file have been kept aside as deleted "
+                        "and can be brought back with Restore Deleted.".format(self.session.converted_deleted_count))
+        tk.messagebox.showinfo(title="Save File Converted", message=message)
 
     # Show reset DataFrame popup.
     def reset_df_popup(self):
@@ -198,12 +1883,35 @@ class MyTweetReviewerBase:
                                                                            "tweet_deleted columns in the data?")
             if reset_decision == 1:
                 tk.messagebox.showinfo(title="Reset Completed", message="Columns have been reset.")
-                self.reset_df()
+                self.session.reset_df()
             else:
                 tk.messagebox.showinfo(title="Reset Cancelled", message="Reset cancelled.")
         else:
             tk.messagebox.showinfo(title="No Data", message="There is currently no tweet data.")
 
+    # Show restore deleted tweets popup.
+    def restore_deleted_popup(self):
+        deleted_tweets_df = self.session.deleted_tweets_df
+        # Open popup if there are deleted tweets in the data.
+        if len(deleted_tweets_df.index):
+            restore_decision = tk.messagebox.askyesno(title="Restore Deleted",
+                                                      message="Restore the {} deleted tweets to the data? They will be "
+                                                              "shown again in the delete process."
+                                                      .format(len(deleted_tweets_df.index)))
+            if restore_decision == 1:
+                self.session.restore_deleted_tweets()
+                tk.messagebox.showinfo(title="Restore Completed", message="Deleted tweets have been restored.")
+            else:
+                tk.messagebox.showinfo(title="Restore Cancelled", message="Restore cancelled.")
+        else:
+            tk.messagebox.showinfo(title="No Data", message="There are currently no deleted tweets.")
+
+    # Export the data as a CSV file and show export completed popup.
+    def export_csv_popup(self):
+        self.session.save_df_as_csv()
+        tk.messagebox.showinfo(title="Export Completed", message="The data has been exported to {}."
+                               .format(self.session.saved_filename))
+
     # Count total number of tweets.
     def count_total_tweets(self):
         number_total_tweets = len(self.tweets_df.index)
@@ -213,11 +1921,18 @@ class MyTweetReviewerBase:
 class MyTweetReviewer(MyTweetReviewerBase):
     # Main window dimensions and name.
     window_w = 300
-    window_h = 300
+    window_h = 460
     window_name = "My Tweet Reviewer"
+    # Milliseconds between checks on the progress of loading the data.
+    LOAD_POLL_INTERVAL = 100
+    # Height added to the window for the diagnostics button.
+    DIAGNOSTICS_BUTTON_HEIGHT = 40
 
-    def __init__(self, master, username, excluded_hashtags=None, saved_filename=None):
-        super().__init__(master, username, excluded_hashtags, saved_filename)
+    def __init__(self, master, session):
+        # Make room for the diagnostics button.
+        if instrumentation.enabled:
+            self.window_h += self.DIAGNOSTICS_BUTTON_HEIGHT
+        super().__init__(master, session)
         # Main window text.
         self.greeting_label = tk.Label(self.root, text="Welcome to My Tweet Reviewer", bg=self.SHADE_TWO)
         self.greeting_label.grid(row=0, column=0, padx=15, pady=(20, 0))
@@ -230,24 +1945,106 @@ class MyTweetReviewer(MyTweetReviewerBase):
                                            activebackground=self.SHADE_FOUR, width=14, height=1,
                                            command=self.open_review_window)
         self.review_tweets_btn.grid(row=0, column=0, padx=10, pady=(20, 10))
+        self.batch_review_btn = tk.Button(self.home_buttons_frame, text="Batch Review", bg=self.SHADE_THREE,
+                                          activebackground=self.SHADE_FOUR, width=14, height=1,
+                                          command=self.open_batch_review_window)
+        self.batch_review_btn.grid(row=1, column=0, padx=10, pady=(0, 10))
         self.delete_tweets_btn = tk.Button(self.home_buttons_frame, text="Delete Tweets", bg=self.SHADE_THREE,
                                            activebackground=self.SHADE_FOUR, width=14, height=1,
                                            command=self.open_delete_window)
-        self.delete_tweets_btn.grid(row=1, column=0, padx=10, pady=(0, 10))
+        self.delete_tweets_btn.grid(row=2, column=0, padx=10, pady=(0, 10))
         self.reset_btn = tk.Button(self.home_buttons_frame, text="Reset", bg=self.SHADE_THREE,
                                    activebackground=self.SHADE_FOUR, width=14, height=1, command=self.reset_df_popup)
-        self.reset_btn.grid(row=2, column=0, padx=10, pady=(0, 10))
+        self.reset_btn.grid(row=3, column=0, padx=10, pady=(0, 10))
+        self.restore_btn = tk.Button(self.home_buttons_frame, text="Restore Deleted", bg=self.SHADE_THREE,
+                                     activebackground=self.SHADE_FOUR, width=14, height=1,
+                                     command=self.restore_deleted_popup)
+        self.restore_btn.grid(row=4, column=0, padx=10, pady=(0, 10))
+        self.export_btn = tk.Button(self.home_buttons_frame, text="Export CSV", bg=self.SHADE_THREE,
+                                    activebackground=self.SHADE_FOUR, width=14, height=1,
+                                    command=self.export_csv_popup)
+        self.export_btn.grid(row=5, column=0, padx=10, pady=(0, 10))
         self.quit_btn = tk.Button(self.home_buttons_frame, text="Quit", bg=self.SHADE_THREE,
                                   activebackground=self.SHADE_FOUR, width=14, height=1,
                                   command=self.quit_mytweetreviewer)
-        self.quit_btn.grid(row=3, column=0, padx=10, pady=(0, 10))
+        self.quit_btn.grid(row=6, column=0, padx=10, pady=(0, 10))
+        # Diagnostics are only offered when the program has been started with them turned on.
+        if instrumentation.enabled:
+            self.diagnostics_btn = tk.Button(self.home_buttons_frame, text="Diagnostics", bg=self.SHADE_THREE,
+                                             activebackground=self.SHADE_FOUR, width=14, height=1,
+                                             command=self.open_diagnostics_window)
+            self.diagnostics_btn.grid(row=7, column=0, padx=10, pady=(0, 10))
+        # Progress of loading the data.
+        self.load_status = tk.StringVar()
+        self.load_status.set("Loading...")
+        self.load_status_label = tk.Label(self.root, textvariable=self.load_status, bg=self.SHADE_TWO)
+        self.load_status_label.grid(row=3, column=0, padx=15, pady=(0, 10))
+        # Buttons which need the tweet data are disabled until it has loaded.
+        self.data_buttons = [self.review_tweets_btn, self.batch_review_btn, self.delete_tweets_btn, self.reset_btn,
+                             self.restore_btn, self.export_btn]
+        for data_button in self.data_buttons:
+            data_button["state"] = "disabled"
+        # Load the tweet data into the session shared with the other windows in a background thread, so the window is
+        # shown and stays responsive while it loads. Progress is passed back through a queue which is checked from the
+        # Tk event loop. The thread is started once the window has been drawn, as importing pandas at the start of
+        # loading would otherwise hold up drawing it.
+        self.load_queue = queue.Queue()
+        self.load_thread = threading.Thread(target=self.load_data, daemon=True)
+        self.root.after_idle(self.load_thread.start)
+        self.root.after(self.LOAD_POLL_INTERVAL, self.check_load_progress)
+
+    # Load the tweet data into the session, passing the progress and the outcome back through the queue. Runs in the
+    # background thread.
+    def load_data(self):
+        try:
+            self.session.load_df(progress=lambda stage, percent: self.load_queue.put(("progress", stage, percent)))
+        except Exception as error:
+            self.load_queue.put(("error", error, None))
+        else:
+            self.load_queue.put(("done", None, None))
+
+    # Show the latest progress of loading the data, and enable the buttons once it has loaded. Exits if tweet.js is
+    # needed but missing, or the data could not be loaded.
+    def check_load_progress(self):
+        while True:
+            try:
+                message, value, percent = self.load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if message == "progress":
+                self.load_status.set("{}... {}%".format(value, percent))
+            elif message == "done":
+                self.load_status.set("Ready.")
+                for data_button in self.data_buttons:
+                    data_button["state"] = "normal"
+                if self.session.converted_csv:
+                    self.converted_csv_popup()
+                if self.session.new_tweet_count:
+                    self.new_tweets_popup()
+                return
+            elif isinstance(value, FileNotFoundError):
+                self.tweetjs_missing_popup()
+            else:
+                tk.messagebox.showerror(title="Loading Failed", message="The tweet data could not be loaded: {}"
+                                        .format(value))
+                sys.exit()
+        self.root.after(self.LOAD_POLL_INTERVAL, self.check_load_progress)
 
     # Open review tweets window.
     def open_review_window(self):
         # Open window if there are tweets in the data.
         if len(self.tweets_df.index):
             review_window_root = tk.Toplevel(self.root, background=self.SHADE_TWO)
-            ReviewerReviewWindow(review_window_root, self.username, self.excluded_hashtags, self.saved_filename)
+            ReviewerReviewWindow(review_window_root, self.session)
+        else:
+            tk.messagebox.showinfo(title="No Data", message="There is currently no tweet data.")
+
+    # Open batch review tweets window.
+    def open_batch_review_window(self):
+        # Open window if there are tweets in the data.
+        if len(self.tweets_df.index):
+            batch_review_window_root = tk.Toplevel(self.root, background=self.SHADE_TWO)
+            ReviewerBatchWindow(batch_review_window_root, self.session)
         else:
             tk.messagebox.showinfo(title="No Data", message="There is currently no tweet data.")
 
@@ -256,12 +2053,19 @@ class MyTweetReviewer(MyTweetReviewerBase):
         # Open window if there are tweets in the data.
         if len(self.tweets_df.index):
             delete_window_root = tk.Toplevel(self.root, background=self.SHADE_TWO)
-            ReviewerDeleteWindow(delete_window_root, self.username, self.excluded_hashtags, self.saved_filename)
+            ReviewerDeleteWindow(delete_window_root, self.session)
         else:
             tk.messagebox.showinfo(title="No Data", message="There is currently no tweet data.")
 
+    # Open diagnostics window. It can be opened at any time, including while the data is loading.
+    def open_diagnostics_window(self):
+        diagnostics_window_root = tk.Toplevel(self.root, background=self.SHADE_TWO)
+        ReviewerDiagnosticsWindow(diagnostics_window_root, self.session)
+
     # Exit My Tweet Reviewer.
     def quit_mytweetreviewer(self):
+        # Fold any changes recorded in the journal into the save file before closing.
+        self.session.close()
         self.root.destroy()
 
 
@@ -271,12 +2075,12 @@ class ReviewerReviewWindow(MyTweetReviewerBase):
     window_h = 540
     window_name = "Review Tweets"
 
-    def __init__(self, master, username, excluded_hashtags=None, saved_filename=None):
-        super().__init__(master, username, excluded_hashtags, saved_filename)
+    def __init__(self, master, session):
+        super().__init__(master, session)
         # Ensure user can only interact with review tweets window while it is open but not the main window.
         self.root.grab_set()
-        # Tracker which will become True if at least one tweet is reviewed.
-        self.min_one_reviewed = False
+        # Queue of tweets awaiting review.
+        self.tweet_queue = TweetQueue(self.pending_review_rows())
         # Review window text.
         self.current_index = 0
         self.total_tweets_count = tk.StringVar()
@@ -314,18 +2118,31 @@ class ReviewerReviewWindow(MyTweetReviewerBase):
         self.update_review_btn.grid(row=0, column=3, padx=10, pady=10)
         self.review_buttons_frame = tk.Frame(self.root, background=self.SHADE_TWO)
         self.review_buttons_frame.grid(row=4, column=0)
+        self.previous_review_btn = tk.Button(self.review_buttons_frame, text="Previous Tweet", width=14, height=1,
+                                             bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                             command=self.previous_review_clicked, state="disabled")
+        self.previous_review_btn.grid(row=0, column=0, padx=(10, 0), pady=10)
+        # Skipping moves on in the same way as the next button, but is available before the tweet has been updated.
+        self.skip_review_btn = tk.Button(self.review_buttons_frame, text="Skip Tweet", width=14, height=1,
+                                         bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                         command=self.next_review_clicked, state="disabled")
+        self.skip_review_btn.grid(row=0, column=1, padx=10, pady=10)
         self.next_review_btn = tk.Button(self.review_buttons_frame, text="Next Tweet", width=14, height=1,
                                          bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
                                          command=self.next_review_clicked)
-        self.next_review_btn.grid(row=0, column=0, padx=10, pady=10)
+        self.next_review_btn.grid(row=0, column=2, padx=(0, 10), pady=10)
         self.quit_review_btn = tk.Button(self.review_buttons_frame, text="Quit Reviewing", width=14, height=1,
                                          bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
                                          command=self.quit_review_clicked)
-        self.quit_review_btn.grid(row=1, column=0, padx=10, pady=(0, 10))
+        self.quit_review_btn.grid(row=1, column=1, padx=10, pady=(0, 10))
+
+    # Get the row labels of tweets awaiting review, most recent first.
+    def pending_review_rows(self):
+        return self.tweets_df.index[(self.tweets_df["tweet_review_status"] == "none").to_numpy()]
 
     # Count number of tweets awaiting review.
     def count_awaiting_review(self):
-        awaiting_review = len(self.tweets_df[self.tweets_df["tweet_review_status"] == "none"])
+        awaiting_review = self.session.status_counts.count(review_status="none")
         return "Awaiting Review: {}".format(awaiting_review)
 
     # Enable update button if a review status other than "none" has been selected using the radio buttons.
@@ -336,48 +2153,322 @@ class ReviewerReviewWindow(MyTweetReviewerBase):
             self.update_review_btn["state"] = "normal"
 
     # Update the DataFrame with the selected review status from the radio buttons.
+    @instrumentation.instrumented("update_review")
     def update_review_clicked(self):
-        self.tweets_df.at[self.current_index, "tweet_review_status"] = self.rb_review_status.get()
+        self.session.set_review_status(self.current_index, self.rb_review_status.get())
         # After the update button has been clicked, disable the radio and update buttons to indicate to user that the
         # update has been done. Enable the next button to allow the user to go to the next tweet.
         for rb in self.rb_list:
             rb["state"] = "disabled"
         self.update_review_btn["state"] = "disabled"
+        self.skip_review_btn["state"] = "disabled"
         self.next_review_btn["state"] = "normal"
+        # Remove the tweet from the queue of tweets awaiting review.
+        self.tweet_queue.mark_finished(self.current_index)
         # Update the counter label of tweets awaiting review.
         self.awaiting_review_count.set(self.count_awaiting_review())
-        # Update the tracker to acknowledge at least one tweet has been reviewed, thereby activating the save option
-        # upon quitting.
-        self.min_one_reviewed = True
 
-    # Move onto the next tweet for reviewing.
-    def next_review_clicked(self):
-        # Loop through DataFrame until the next tweet that hasn't been reviewed is found.
-        for row_index, row in self.tweets_df.iterrows():
-            if row["tweet_review_status"] == "none" and row_index >= self.current_index:
-                # Reset the radio buttons.
-                self.rb_review_status.set("none")
-                # Set the tweet text.
-                self.tweet_text.set(row["tweet_text"])
-                # Update the current index with that of current tweet for use in updating DataFrame.
-                self.current_index = row_index
-                # Enable radio buttons and disable the next button until user has selected and updated review status
-                # for the tweet.
-                for rb in self.rb_list:
-                    rb["state"] = "normal"
+    # Show a tweet for reviewing.
+    def show_review_tweet(self, row_index):
+        if row_index is None:
+            # No more tweets to review. Only the previous and quit buttons remain active.
+            self.tweet_text.set("No tweets to review.")
+            for rb in self.rb_list:
+                rb["state"] = "disabled"
+            self.update_review_btn["state"] = "disabled"
+            self.skip_review_btn["state"] = "disabled"
+            self.next_review_btn["state"] = "disabled"
+        else:
+            review_status = self.tweets_df.at[row_index, "tweet_review_status"]
+            # Set the radio buttons to the current review status of the tweet.
+            self.rb_review_status.set(review_status)
+            # Set the tweet text.
+            self.tweet_text.set(self.tweets_df.at[row_index, "tweet_text"])
+            # Update the current index with that of current tweet for use in updating DataFrame.
+            self.current_index = row_index
+            # Enable radio buttons. Unless the tweet has already been reviewed, disable the next button until user has
+            # selected and updated review status for the tweet.
+            for rb in self.rb_list:
+                rb["state"] = "normal"
+            self.update_review_btn_state()
+            self.skip_review_btn["state"] = "normal"
+            if review_status == "none":
                 self.next_review_btn["state"] = "disabled"
-                break
             else:
-                # No more tweets to review. Only the quit button remains active.
-                self.tweet_text.set("No tweets to review.")
-                self.next_review_btn["state"] = "disabled"
+                self.next_review_btn["state"] = "normal"
+        if self.tweet_queue.has_previous():
+            self.previous_review_btn["state"] = "normal"
+        else:
+            self.previous_review_btn["state"] = "disabled"
+
+    # Move onto the next tweet for reviewing.
+    @instrumentation.instrumented("next_review")
+    def next_review_clicked(self):
+        self.show_review_tweet(self.tweet_queue.next())
+
+    # Move back to the previous tweet for reviewing.
+    def previous_review_clicked(self):
+        self.show_review_tweet(self.tweet_queue.previous())
 
     # Exit review window.
     def quit_review_clicked(self):
-        # If at least one tweet has been reviewed, offer the user a chance to save the DataFrame before closing the
-        # review window.
-        if self.min_one_reviewed:
-            self.save_df_popup()
+        # Reviewed tweets have already been recorded in the journal, so there is nothing to save.
+        self.root.destroy()
+
+
+class ReviewerBatchWindow(MyTweetReviewerBase):
+    # Batch review window dimensions and name.
+    window_w = 860
+    window_h = 650
+    window_name = "Batch Review Tweets"
+    # Number of rows shown in the table at a time, the number of characters of each tweet shown and the number of rows
+    # scrolled by each turn of the mouse wheel.
+    VISIBLE_ROWS = 20
+    TEXT_PREVIEW_LENGTH = 110
+    WHEEL_ROWS = 3
+    # Keys which set the review status of the selected tweets.
+    REVIEW_STATUS_KEYS = {"k": "keep", "d": "delete", "n": "none"}
+
+    def __init__(self, master, session):
+        super().__init__(master, session)
+        # Ensure user can only interact with batch review window while it is open but not the main window.
+        self.root.grab_set()
+        # Positions in the DataFrame of the tweets listed in the table, which are all of the tweets unless a search has
+        # been made. Along with them, the position in the list of the first tweet shown in the table, of the cursor and
+        # of the tweet a range selection starts from, and which of the listed tweets are selected.
+        self.listed_positions = np.arange(len(self.tweets_df.index))
+        self.first_position = 0
+        self.cursor_position = 0
+        self.anchor_position = 0
+        self.selected = np.zeros(len(self.listed_positions), dtype=bool)
+        # Batch review window text.
+        self.total_tweets_count = tk.StringVar()
+        self.total_tweets_count.set(self.count_total_tweets())
+        self.total_tweets_label = tk.Label(self.root, textvariable=self.total_tweets_count, bg=self.SHADE_TWO)
+        self.total_tweets_label.grid(row=0, column=0, padx=15, pady=(20, 0))
+        self.awaiting_review_count = tk.StringVar()
+        self.awaiting_review_count.set(self.count_awaiting_review())
+        self.awaiting_review_label = tk.Label(self.root, textvariable=self.awaiting_review_count, bg=self.SHADE_TWO)
+        self.awaiting_review_label.grid(row=1, column=0, padx=15, pady=(10, 0))
+        self.selected_count = tk.StringVar()
+        self.selected_count_label = tk.Label(self.root, textvariable=self.selected_count, bg=self.SHADE_TWO)
+        self.selected_count_label.grid(row=2, column=0, padx=15, pady=10)
+        # Search box. Searching lists only the tweets matching the search in the table.
+        self.search_frame = tk.Frame(self.root, background=self.SHADE_TWO)
+        self.search_frame.grid(row=3, column=0, padx=10, pady=(0, 10))
+        self.search_entry = tk.Entry(self.search_frame, width=60)
+        self.search_entry.grid(row=0, column=0, padx=(0, 10))
+        self.search_entry.bind("<Return>", self.search_clicked)
+        self.search_btn = tk.Button(self.search_frame, text="Search", width=14, height=1, bg=self.SHADE_THREE,
+                                    activebackground=self.SHADE_FOUR, command=self.search_clicked)
+        self.search_btn.grid(row=0, column=1, padx=(0, 10))
+        self.clear_search_btn = tk.Button(self.search_frame, text="Clear Search", width=14, height=1,
+                                          bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                          command=self.clear_search_clicked)
+        self.clear_search_btn.grid(row=0, column=2)
+        # Table of tweets. Only enough rows to fill the table are created, and they are filled in from the DataFrame
+        # with the tweets at the scroll position each time the table is scrolled, so the table stays the same size
+        # however many tweets there are.
+        self.tweets_frame = tk.Frame(self.root, background=self.SHADE_TWO)
+        self.tweets_frame.grid(row=4, column=0, padx=10)
+        self.tweets_table = ttk.Treeview(self.tweets_frame, columns=("created", "status", "text"), show="headings",
+                                         height=self.VISIBLE_ROWS, selectmode="none")
+        self.tweets_table.heading("created", text="Date")
+        self.tweets_table.heading("status", text="Status")
+        self.tweets_table.heading("text", text="Tweet")
+        self.tweets_table.column("created", width=90, stretch=False)
+        self.tweets_table.column("status", width=70, stretch=False)
+        self.tweets_table.column("text", width=640)
+        self.tweets_table.grid(row=0, column=0)
+        self.table_rows = [self.tweets_table.insert("", "end") for _ in range(self.VISIBLE_ROWS)]
+        self.tweets_scrollbar = ttk.Scrollbar(self.tweets_frame, orient="vertical", command=self.scroll_table)
+        self.tweets_scrollbar.grid(row=0, column=1, sticky="ns")
+        # Batch review window buttons.
+        self.batch_buttons_frame = tk.Frame(self.root, background=self.SHADE_TWO)
+        self.batch_buttons_frame.grid(row=5, column=0)
+        self.keep_btn = tk.Button(self.batch_buttons_frame, text="Keep (K)", width=14, height=1, bg=self.SHADE_THREE,
+                                  activebackground=self.SHADE_FOUR, command=lambda: self.set_selected_status("keep"))
+        self.keep_btn.grid(row=0, column=0, padx=(10, 0), pady=10)
+        self.delete_btn = tk.Button(self.batch_buttons_frame, text="Delete (D)", width=14, height=1,
+                                    bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                    command=lambda: self.set_selected_status("delete"))
+        self.delete_btn.grid(row=0, column=1, padx=10, pady=10)
+        self.none_btn = tk.Button(self.batch_buttons_frame, text="None (N)", width=14, height=1, bg=self.SHADE_THREE,
+                                  activebackground=self.SHADE_FOUR, command=lambda: self.set_selected_status("none"))
+        self.none_btn.grid(row=0, column=2, padx=(0, 10), pady=10)
+        self.quit_batch_btn = tk.Button(self.batch_buttons_frame, text="Quit Reviewing", width=14, height=1,
+                                        bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                        command=self.quit_batch_clicked)
+        self.quit_batch_btn.grid(row=1, column=1, padx=10, pady=(0, 10))
+        # Mouse and keyboard controls, which apply while the table has the focus. Clicking selects a tweet, with Ctrl
+        # adding or removing it from the selection and Shift selecting a range. The arrow, page, home and end keys move
+        # the cursor, with Shift selecting a range.
+        self.tweets_table.bind("<Button-1>", self.table_clicked)
+        self.tweets_table.bind("<Control-Button-1>", lambda event: self.table_clicked(event, toggle=True))
+        self.tweets_table.bind("<Shift-Button-1>", lambda event: self.table_clicked(event, extend=True))
+        self.tweets_table.bind("<MouseWheel>", lambda event: self.scroll_rows(-self.WHEEL_ROWS * event.delta // 120))
+        self.tweets_table.bind("<Button-4>", lambda event: self.scroll_rows(-self.WHEEL_ROWS))
+        self.tweets_table.bind("<Button-5>", lambda event: self.scroll_rows(self.WHEEL_ROWS))
+        for key, steps in [("Up", -1), ("Down", 1), ("Prior", -self.VISIBLE_ROWS), ("Next", self.VISIBLE_ROWS)]:
+            self.tweets_table.bind("<{}>".format(key), lambda event, steps=steps: self.move_cursor(steps))
+            self.tweets_table.bind("<Shift-{}>".format(key),
+                                   lambda event, steps=steps: self.move_cursor(steps, extend=True))
+        self.tweets_table.bind("<Home>", lambda event: self.move_cursor(-len(self.selected)))
+        self.tweets_table.bind("<End>", lambda event: self.move_cursor(len(self.selected)))
+        self.tweets_table.bind("<Control-a>", self.select_all)
+        for key, review_status in self.REVIEW_STATUS_KEYS.items():
+            self.tweets_table.bind("<KeyPress-{}>".format(key),
+                                   lambda event, review_status=review_status: self.set_selected_status(review_status))
+        # Start with the first tweet awaiting review selected.
+        self.select_first_pending()
+        self.tweets_table.focus_set()
+
+    # Count number of tweets awaiting review.
+    def count_awaiting_review(self):
+        awaiting_review = self.session.status_counts.count(review_status="none")
+        return "Awaiting Review: {}".format(awaiting_review)
+
+    # List the tweets at positions in the DataFrame in the table, selecting the first of them awaiting review.
+    def list_tweets(self, positions):
+        self.listed_positions = positions
+        self.selected = np.zeros(len(positions), dtype=bool)
+        self.first_position = 0
+        self.select_first_pending()
+
+    # Select the first listed tweet awaiting review, or the first listed tweet if none are.
+    def select_first_pending(self):
+        listed_review_statuses = self.tweets_df["tweet_review_status"].to_numpy()[self.listed_positions]
+        pending_positions = np.flatnonzero(listed_review_statuses == "none")
+        if len(pending_positions):
+            self.select_position(int(pending_positions[0]))
+        else:
+            self.select_position(0)
+
+    # List only the tweets matching the search in the table.
+    def search_clicked(self, event=None):
+        query = self.search_entry.get().strip()
+        if query:
+            # The row labels of the DataFrame are in ascending order, so the position of each matching tweet is found
+            # with a binary search.
+            self.list_tweets(np.searchsorted(self.tweets_df.index.to_numpy(), self.session.search_tweets(query)))
+        else:
+            self.list_tweets(np.arange(len(self.tweets_df.index)))
+        self.tweets_table.focus_set()
+
+    # List all tweets in the table again.
+    def clear_search_clicked(self):
+        self.search_entry.delete(0, "end")
+        self.search_clicked()
+
+    # Fill in the table rows with the tweets at the scroll position, and show which of them are selected.
+    def show_table(self):
+        tweet_count = len(self.selected)
+        visible_df = self.tweets_df.iloc[self.listed_positions[self.first_position:
+                                                               self.first_position + self.VISIBLE_ROWS]]
+        created = visible_df["tweet_created"].dt.strftime("%Y-%m-%d").tolist()
+        review_statuses = visible_df["tweet_review_status"].astype(str).tolist()
+        texts = [" ".join(text.split())[:self.TEXT_PREVIEW_LENGTH] for text in visible_df["tweet_text"]]
+        selected_rows = []
+        for row_number, table_row in enumerate(self.table_rows):
+            if row_number < len(visible_df.index):
+                self.tweets_table.item(table_row, values=(created[row_number], review_statuses[row_number],
+                                                          texts[row_number]))
+                if self.selected[self.first_position + row_number]:
+                    selected_rows.append(table_row)
+            else:
+                self.tweets_table.item(table_row, values=("", "", ""))
+        self.tweets_table.selection_set(selected_rows)
+        if tweet_count:
+            self.tweets_scrollbar.set(self.first_position / tweet_count,
+                                      min(self.first_position + self.VISIBLE_ROWS, tweet_count) / tweet_count)
+        else:
+            self.tweets_scrollbar.set(0, 1)
+        self.selected_count.set("Listed: {}    Selected: {}".format(tweet_count, int(self.selected.sum())))
+
+    # Scroll the table so the first tweet shown is at a position, keeping the table full where possible.
+    def scroll_to(self, position):
+        self.first_position = max(min(position, len(self.selected) - self.VISIBLE_ROWS), 0)
+        self.show_table()
+
+    # Scroll the table by a number of rows.
+    def scroll_rows(self, rows):
+        self.scroll_to(self.first_position + rows)
+
+    # Scroll the table as directed by the scrollbar.
+    def scroll_table(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.selected)))
+        elif unit == "pages":
+            self.scroll_rows(int(amount) * self.VISIBLE_ROWS)
+        else:
+            self.scroll_rows(int(amount))
+
+    # Select the tweet at a position, along with the tweets between it and the anchor if extending the selection, and
+    # scroll the table to show it.
+    def select_position(self, position, extend=False):
+        if not len(self.selected):
+            self.show_table()
+            return
+        position = max(min(position, len(self.selected) - 1), 0)
+        self.selected[:] = False
+        if extend:
+            self.selected[min(self.anchor_position, position):max(self.anchor_position, position) + 1] = True
+        else:
+            self.selected[position] = True
+            self.anchor_position = position
+        self.cursor_position = position
+        if position < self.first_position:
+            self.scroll_to(position)
+        elif position >= self.first_position + self.VISIBLE_ROWS:
+            self.scroll_to(position - self.VISIBLE_ROWS + 1)
+        else:
+            self.show_table()
+
+    # Move the cursor by a number of tweets.
+    def move_cursor(self, steps, extend=False):
+        self.select_position(self.cursor_position + steps, extend)
+        return "break"
+
+    # Select the clicked tweet, or add or remove it from the selection, or select the range up to it.
+    def table_clicked(self, event, toggle=False, extend=False):
+        table_row = self.tweets_table.identify_row(event.y)
+        if table_row:
+            position = self.first_position + self.table_rows.index(table_row)
+            if position < len(self.selected):
+                if toggle:
+                    self.selected[position] = not self.selected[position]
+                    self.cursor_position = position
+                    self.anchor_position = position
+                    self.show_table()
+                else:
+                    self.select_position(position, extend)
+        self.tweets_table.focus_set()
+        return "break"
+
+    # Select every tweet.
+    def select_all(self, event=None):
+        self.selected[:] = True
+        self.show_table()
+        return "break"
+
+    # Set the review status of all of the selected tweets at once, then move the cursor on to the tweet after them.
+    @instrumentation.instrumented("batch_update")
+    def set_selected_status(self, review_status):
+        selected_positions = np.flatnonzero(self.selected)
+        if not len(selected_positions):
+            return "break"
+        self.session.set_review_statuses(self.tweets_df.index[self.listed_positions[selected_positions]],
+                                         review_status)
+        self.awaiting_review_count.set(self.count_awaiting_review())
+        if selected_positions[-1] + 1 < len(self.selected):
+            self.select_position(int(selected_positions[-1]) + 1)
+        else:
+            self.show_table()
+        return "break"
+
+    # Exit batch review window.
+    def quit_batch_clicked(self):
+        # Reviewed tweets have already been recorded in the journal, so there is nothing to save.
         self.root.destroy()
 
 
@@ -387,12 +2478,12 @@ class ReviewerDeleteWindow(MyTweetReviewerBase):
     window_h = 540
     window_name = "Delete Tweets"
 
-    def __init__(self, master, username, excluded_hashtags=None, saved_filename=None):
-        super().__init__(master, username, excluded_hashtags, saved_filename)
+    def __init__(self, master, session):
+        super().__init__(master, session)
         # Ensure user can only interact with delete tweets window while it is open but not the main window.
         self.root.grab_set()
-        # Tracker which will become True if at least one tweet is deleted.
-        self.min_one_deleted = False
+        # Queue of tweets awaiting deletion.
+        self.tweet_queue = TweetQueue(self.pending_delete_rows())
         # Delete window text.
         self.current_index = 0
         self.total_tweets_count = tk.StringVar()
@@ -433,25 +2524,38 @@ class ReviewerDeleteWindow(MyTweetReviewerBase):
         self.update_delete_btn.grid(row=0, column=2, padx=10, pady=10)
         self.delete_buttons_frame = tk.Frame(self.root, background=self.SHADE_TWO)
         self.delete_buttons_frame.grid(row=5, column=0)
+        self.previous_delete_btn = tk.Button(self.delete_buttons_frame, text="Previous Tweet", width=14, height=1,
+                                             bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                             command=self.previous_delete_clicked, state="disabled")
+        self.previous_delete_btn.grid(row=0, column=0, padx=(10, 0), pady=10)
+        # Skipping moves on in the same way as the next button, but is available before the tweet has been updated.
+        self.skip_delete_btn = tk.Button(self.delete_buttons_frame, text="Skip Tweet", width=14, height=1,
+                                         bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                         command=self.next_delete_clicked, state="disabled")
+        self.skip_delete_btn.grid(row=0, column=1, padx=10, pady=10)
         self.next_delete_btn = tk.Button(self.delete_buttons_frame, text="Next Tweet", width=14, height=1,
                                          bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
                                          command=self.next_delete_clicked)
-        self.next_delete_btn.grid(row=0, column=0, padx=10, pady=10)
+        self.next_delete_btn.grid(row=0, column=2, padx=(0, 10), pady=10)
         self.quit_delete_btn = tk.Button(self.delete_buttons_frame, text="Quit Deleting", width=14, height=1,
                                          bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
                                          command=self.quit_delete_clicked)
-        self.quit_delete_btn.grid(row=1, column=0, padx=10, pady=(0, 10))
+        self.quit_delete_btn.grid(row=1, column=1, padx=10, pady=(0, 10))
+
+    # Get the row labels of tweets marked for deletion that haven't been opened in the browser, most recent first.
+    def pending_delete_rows(self):
+        return self.tweets_df.index[((self.tweets_df["tweet_review_status"] == "delete") &
+                                     ~self.tweets_df["tweet_url_visited"]).to_numpy()]
 
     # Count number of tweets awaiting deletion.
     def count_awaiting_deletion(self):
-        awaiting_deletion = len(self.tweets_df[(self.tweets_df["tweet_review_status"] == "delete") &
-                                               (self.tweets_df["tweet_url_visited"] == "no")])
+        awaiting_deletion = self.session.status_counts.count(review_status="delete", url_visited=False)
         return "Awaiting Deletion: {}".format(awaiting_deletion)
 
     # Open tweet to be deleted in the browser.
     def open_delete_clicked(self):
         # Open tweet in browser.
-        tweet_url = self.tweets_df["tweet_url"][self.current_index]
+        tweet_url = self.session.tweet_url(self.current_index)
         webbrowser.open_new_tab(tweet_url)
         # Enable radio and update buttons after tweet is opened in browser.
         for rb in self.rb_list:
@@ -459,69 +2563,214 @@ class ReviewerDeleteWindow(MyTweetReviewerBase):
         self.update_delete_btn["state"] = "normal"
 
     # Update the DataFrame with the selected deleted status from the radio buttons.
+    @instrumentation.instrumented("update_delete")
     def update_delete_clicked(self):
-        # Update the tweet in the DataFrame as having been viewed in the browser. Note this update is not done when
-        # open button itself is clicked because user may quit before choosing a delete status and updating, and the
-        # tweet would not be shown again in delete window as it would have already been viewed.
-        self.tweets_df.at[self.current_index, "tweet_url_visited"] = "yes"
-        # Get result from radio button and update tweet_deleted column
-        if self.rb_delete_status.get() == "yes":
-            self.tweets_df.at[self.current_index, "tweet_deleted"] = "yes"
+        # Update the tweet in the DataFrame as having been viewed in the browser and update the tweet_deleted column
+        # with the result from the radio button. Note this update is not done when open button itself is clicked
+        # because user may quit before choosing a delete status and updating, and the tweet would not be shown again in
+        # delete window as it would have already been viewed.
+        self.session.set_deleted(self.current_index, self.rb_delete_status.get() == "yes")
         # After the update button has been clicked, disable the open in browser, radio and update buttons to indicate
         # to user that the update has been done. Enable the next button to allow the user to go to the next tweet.
         self.open_btn["state"] = "disabled"
         for rb in self.rb_list:
             rb["state"] = "disabled"
         self.update_delete_btn["state"] = "disabled"
+        self.skip_delete_btn["state"] = "disabled"
         self.next_delete_btn["state"] = "normal"
+        # Remove the tweet from the queue of tweets awaiting deletion.
+        self.tweet_queue.mark_finished(self.current_index)
         # Update the counter label of tweets awaiting deletion.
         self.awaiting_deletion_count.set(self.count_awaiting_deletion())
-        # Update the tracker to acknowledge at least one tweet has been deleted, thereby activating the save option
-        # upon quitting.
-        self.min_one_deleted = True
 
-    # Move onto the next tweet for deleting.
-    def next_delete_clicked(self):
-        # Loop through DataFrame until the next tweet that hasn't been deleted is found.
-        for row_index, row in self.tweets_df.iterrows():
-            if row["tweet_review_status"] == "delete" and row["tweet_url_visited"] == "no":
-                # Reset the radio buttons.
+    # Show a tweet for deleting.
+    def show_delete_tweet(self, row_index):
+        # Disable the radio and update buttons until user has opened the tweet to delete in browser.
+        for rb in self.rb_list:
+            rb["state"] = "disabled"
+        self.update_delete_btn["state"] = "disabled"
+        if row_index is None:
+            # No more tweets to open/delete. Only the previous and quit buttons remain active.
+            self.tweet_text.set("No tweets to delete.")
+            self.open_btn["state"] = "disabled"
+            self.skip_delete_btn["state"] = "disabled"
+            self.next_delete_btn["state"] = "disabled"
+        else:
+            # Set the radio buttons to the current deleted status of the tweet.
+            if self.tweets_df.at[row_index, "tweet_deleted"]:
+                self.rb_delete_status.set("yes")
+            else:
                 self.rb_delete_status.set("no")
-                # Set the tweet text.
-                self.tweet_text.set(row["tweet_text"])
-                # Update the current index with that of current tweet for use in updating DataFrame.
-                self.current_index = row_index
-                # Enable the open in browser button.
-                self.open_btn["state"] = "normal"
-                # Disable the update and next buttons until user has opened the tweet to delete in browser.
-                self.update_delete_btn["state"] = "disabled"
+            # Set the tweet text.
+            self.tweet_text.set(self.tweets_df.at[row_index, "tweet_text"])
+            # Update the current index with that of current tweet for use in updating DataFrame.
+            self.current_index = row_index
+            # Enable the open in browser button. Unless the tweet has already been opened, disable the next button
+            # until user has opened the tweet to delete in browser.
+            self.open_btn["state"] = "normal"
+            self.skip_delete_btn["state"] = "normal"
+            if not self.tweets_df.at[row_index, "tweet_url_visited"]:
                 self.next_delete_btn["state"] = "disabled"
-                break
             else:
-                # No more tweets to open/delete. Only the quit button remains active.
-                self.tweet_text.set("No tweets to delete.")
-                self.next_delete_btn["state"] = "disabled"
+                self.next_delete_btn["state"] = "normal"
+        if self.tweet_queue.has_previous():
+            self.previous_delete_btn["state"] = "normal"
+        else:
+            self.previous_delete_btn["state"] = "disabled"
+
+    # Move onto the next tweet for deleting.
+    @instrumentation.instrumented("next_delete")
+    def next_delete_clicked(self):
+        self.show_delete_tweet(self.tweet_queue.next())
+
+    # Move back to the previous tweet for deleting.
+    def previous_delete_clicked(self):
+        self.show_delete_tweet(self.tweet_queue.previous())
 
     # Exit delete window.
+    @instrumentation.instrumented("quit_delete")
     def quit_delete_clicked(self):
-        # Loop through DataFrame and remove all rows of tweets that have been deleted. This is performed when the user
-        # is ready to quit deleting and not when update button is clicked because the user may change mind and need to
-        # reset the DataFrame (the tweets can't be recovered without a new DataFrame/save file being created from
-        # tweet.js).
-        for row_index, row in self.tweets_df.iterrows():
-            if row["tweet_deleted"] == "yes":
-                self.tweets_df.drop(row_index, inplace=True)
-        # If at least one tweet has been deleted, offer the user a chance to save the DataFrame before closing the
-        # delete window.
-        if self.min_one_deleted:
-            self.save_df_popup()
+        # Remove all rows of tweets that have been deleted from the DataFrame in one pass. This is performed when the
+        # user is ready to quit deleting and not when update button is clicked because the user may change mind. The
+        # removed tweets are kept aside and can be brought back using the restore option in the main window.
+        self.session.purge_deleted_tweets()
         self.root.destroy()
 
 
-def main(username, excluded_hashtags=None, saved_filename=None):
+class ReviewerDiagnosticsWindow(MyTweetReviewerBase):
+    # Diagnostics window dimensions and name.
+    window_w = 700
+    window_h = 600
+    window_name = "Diagnostics"
+    # Number of rows shown in each table at a time.
+    SUMMARY_ROWS = 8
+    RECENT_ROWS = 12
+
+    def __init__(self, master, session):
+        super().__init__(master, session)
+        # Diagnostics window text.
+        self.log_label = tk.Label(self.root, text="Log file: {}".format(instrumentation.log_filename),
+                                  bg=self.SHADE_TWO)
+        self.log_label.grid(row=0, column=0, padx=15, pady=(20, 10))
+        # Table of the totals for each stage recorded, slowest first.
+        self.summary_table = ttk.Treeview(self.root, columns=("stage", "calls", "seconds", "max_seconds", "rows",
+                                                              "peak"), show="headings", height=self.SUMMARY_ROWS)
+        # Table of the most recent stages recorded, most recent first, with stages run within other stages indented.
+        self.recent_table = ttk.Treeview(self.root, columns=("stage", "seconds", "rows", "peak"), show="headings",
+                                         height=self.RECENT_ROWS)
+        for table, headings in [(self.summary_table, ["Stage", "Calls", "Total (s)", "Slowest (s)", "Rows",
+                                                      "Peak (MB)"]),
+                                (self.recent_table, ["Stage", "Time (s)", "Rows", "Peak (MB)"])]:
+            for col_name, heading in zip(table["columns"], headings):
+                table.heading(col_name, text=heading)
+                table.column(col_name, width=100 if col_name != "stage" else 160, stretch=False)
+        self.summary_table.grid(row=1, column=0, padx=10)
+        self.recent_table.grid(row=2, column=0, padx=10, pady=(10, 0))
+        # Diagnostics window buttons.
+        self.diagnostics_buttons_frame = tk.Frame(self.root, background=self.SHADE_TWO)
+        self.diagnostics_buttons_frame.grid(row=3, column=0)
+        self.refresh_btn = tk.Button(self.diagnostics_buttons_frame, text="Refresh", width=14, height=1,
+                                     bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                     command=self.show_diagnostics)
+        self.refresh_btn.grid(row=0, column=0, padx=10, pady=10)
+        self.quit_diagnostics_btn = tk.Button(self.diagnostics_buttons_frame, text="Close", width=14, height=1,
+                                              bg=self.SHADE_THREE, activebackground=self.SHADE_FOUR,
+                                              command=self.root.destroy)
+        self.quit_diagnostics_btn.grid(row=0, column=1, padx=10, pady=10)
+        self.show_diagnostics()
+
+    # Format a number of bytes as megabytes, or a blank if it wasn't measured.
+    @staticmethod
+    def format_megabytes(byte_count):
+        if byte_count is None:
+            return ""
+        return "{:.1f}".format(byte_count / (1 << 20))
+
+    # Fill the tables with the stages recorded so far.
+    def show_diagnostics(self):
+        for table in [self.summary_table, self.recent_table]:
+            table.delete(*table.get_children())
+        for stage in instrumentation.summary():
+            self.summary_table.insert("", "end", values=(stage["stage"], stage["calls"],
+                                                         "{:.3f}".format(stage["seconds"]),
+                                                         "{:.3f}".format(stage["max_seconds"]),
+                                                         "" if stage["rows"] is None else stage["rows"],
+                                                         self.format_megabytes(stage["peak_bytes"])))
+        with instrumentation.lock:
+            recent_records = instrumentation.records[::-1]
+        for record in recent_records:
+            self.recent_table.insert("", "end", values=("    " * record["depth"] + record["stage"],
+                                                        "{:.3f}".format(record["seconds"]),
+                                                        "" if record["rows"] is None else record["rows"],
+                                                        self.format_megabytes(record["peak_bytes"])))
+
+
+# Start My Tweet Reviewer. With diagnostics, the time, rows and peak memory of the slowest stages are recorded, shown in
+# the diagnostics window and logged to a file named after the save file.
+def main(username, excluded_hashtags=None, saved_filename=None, diagnostics=False):
     root = tk.Tk()
-    MyTweetReviewer(root, username, excluded_hashtags, saved_filename)
+    session = TweetSession(username, excluded_hashtags, saved_filename)
+    if diagnostics:
+        instrumentation.enable(session.diagnostics_filename)
+    MyTweetReviewer(root, session)
+    if diagnostics:
+        # Record how long it took to show the main window once the module was imported, along with the imports made as
+        # the data loads, as a startup report.
+        root.after_idle(instrumentation.record_elapsed, "show_main_window", MODULE_IMPORTED_TIME)
     root.mainloop()
+    # Make sure the journal has been folded into the save file, including when the main window was closed directly.
+    session.close()
+
+
+# Classify the tweets with the rules in a JSON rule file, without opening any windows. The data is loaded and saved in
+# the same way as by main(), and the tweets matched and classified by each rule are printed along with the time taken.
+# With dry_run the rules are reported on without any review statuses being changed.
+def classify(username, rules_filename, excluded_hashtags=None, saved_filename=None, dry_run=False):
+    tweet_rules = TweetRules.from_file(rules_filename)
+    session = TweetSession(username, excluded_hashtags, saved_filename)
+    start_time = time.perf_counter()
+    session.load_df()
+    print("Loaded {} tweets in {:.2f}s.".format(len(session.tweets_df.index), time.perf_counter() - start_time))
+    if session.converted_csv:
+        print("Converted {} to {}, keeping {} tweets missing from it aside as deleted."
+              .format(session.saved_filename, session.snapshot_filename, session.converted_deleted_count))
+    if session.new_tweet_count:
+        print("{} new tweets added from tweet.js.".format(session.new_tweet_count))
+    try:
+        report = tweet_rules.apply(session, dry_run)
+    finally:
+        session.close()
+    for rule_report in report:
+        if rule_report["status"] is None:
+            print("Classified {classified} of {matched} matched tweets in total, written in {seconds:.3f}s."
+                  .format(**rule_report))
+        else:
+            print("{name}: {matched} matched, {classified} classified as {status} in {seconds:.3f}s."
+                  .format(**rule_report))
+    return report
+
+
+# Delete every tweet marked for deletion through the Twitter API, without opening any windows or the browser, using a
+# user access token allowed to delete tweets. The data is loaded and saved in the same way as by main(), and the deleted
+# tweets are moved out of the data as when quitting the delete window. Progress is printed as the tweets are deleted,
+# and an interrupted run carries on from where it stopped when run again.
+def delete_marked_tweets(username, access_token, excluded_hashtags=None, saved_filename=None,
+                         api_url=TweetDeleter.API_URL, max_connections=TweetDeleter.MAX_CONNECTIONS):
+    session = TweetSession(username, excluded_hashtags, saved_filename)
+    session.load_df()
+    tweet_deleter = TweetDeleter(session, access_token, api_url, max_connections,
+                                 progress=lambda finished, pending: print("Finished with {} of {} tweets."
+                                                                          .format(finished, pending)))
+    try:
+        report = tweet_deleter.run()
+        session.purge_deleted_tweets()
+    finally:
+        session.close()
+    print("Deleted {deleted} tweets ({already_deleted} already deleted) in {seconds:.1f}s, with {failed} failures, "
+          "{retries} retries and {rate_limited} rate limited requests.".format(**report))
+    for error, count in sorted(report["errors"].items()):
+        print("{} failures: {}".format(error, count))
+    return report
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""
+    File name: support.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Archive, helpers and base test case shared by the tests of My Tweet Reviewer GUI.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import my_tweet_reviewer_GUI as mtr
+
+USERNAME = "@test"
+# Tweets of the test archive, most recent first as in tweet.js, as date, ID, text and hashtags.
+TWEETS = [("Sat Jul 27 18:30:00 +0000 2019", 1155000000000000006, "Off to the café \U0001F600 #FF", ["FF"]),
+          ("Fri Jul 26 09:15:00 +0000 2019", 1155000000000000005, "Reading about Python data", ["Python", "Data"]),
+          ("Mon Mar 04 12:00:00 +0000 2019", 1155000000000000004, "Happy birthday to you", []),
+          ("Tue Jan 01 00:00:01 +0000 2019", 1155000000000000003, "@friend Happy new year", ["NewYear"]),
+          ("Wed Dec 12 23:59:59 +0000 2018", 1155000000000000002, "RT @news: Big news today #FF", ["FF"]),
+          ("Thu Nov 01 08:00:00 +0000 2018", 1155000000000000001, "Just a naïve tweet", [])]
+
+
+# Write a tweet.js file from tweets given as date, ID, text and hashtags.
+def write_tweetjs(tweets, tweetjs_filename="tweet.js"):
+    raw_tweets = [{"created_at": created_at, "id_str": str(tweet_id), "full_text": full_text,
+                   "entities": {"hashtags": [{"text": hashtag} for hashtag in hashtags]}}
+                  for created_at, tweet_id, full_text, hashtags in tweets]
+    with open(tweetjs_filename, mode='w', encoding="UTF-8") as tweetjs_file:
+        tweetjs_file.write("window.YTD.tweet.part0 = " + json.dumps(raw_tweets, indent=2))
+
+
+class FolderTestCase(unittest.TestCase):
+    # Run each test in an empty folder of its own, as the program reads and writes its files in the current folder.
+    def setUp(self):
+        self.working_dir = os.getcwd()
+        self.test_dir = tempfile.TemporaryDirectory(prefix="mtr_test_")
+        os.chdir(self.test_dir.name)
+        self.sessions = []
+
+    def tearDown(self):
+        for session in self.sessions:
+            session.close()
+        os.chdir(self.working_dir)
+        self.test_dir.cleanup()
+
+    # Create a session and load the data.
+    def load_session(self, excluded_hashtags=None):
+        session = mtr.TweetSession(USERNAME, excluded_hashtags)
+        self.sessions.append(session)
+        session.load_df()
+        return session
+
+    # Stop using a session without saving it, as if the program had crashed. The journal has already been flushed.
+    @staticmethod
+    def crash(session):
+        session.journal_file.close()
+        session.journal_file = None
+
+    # Row label of a tweet in a session, given its ID.
+    @staticmethod
+    def row_of(tweets_df, tweet_id):
+        return tweets_df.index[tweets_df["tweet_id"] == tweet_id][0]
+
+    # Review status of each tweet held in a session, by tweet ID.
+    @staticmethod
+    def review_statuses(session):
+        tweets_df = session.all_tweets_df()
+        return dict(zip(tweets_df["tweet_id"].tolist(), tweets_df["tweet_review_status"].astype(str).tolist()))
@@ -0,0 +1,89 @@
+"""
+    File name: test_deleter.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of deleting tweets through the Twitter API with My Tweet Reviewer GUI, against the local stand-in for the
+    API in the benchmarks folder.
+"""
+
+import os
+import sys
+import unittest
+
+from support import FolderTestCase, TWEETS, mtr, write_tweetjs
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from mock_twitter_server import MockTwitterServer, start_in_thread
+
+ACCESS_TOKEN = "test-token"
+
+
+# Stand-in for the API which answers every request with a status line that isn't HTTP.
+class MalformedTwitterServer(MockTwitterServer):
+    async def handle_connection(self, reader, writer):
+        self.stats["connections"] += 1
+        await reader.readline()
+        writer.write(b"garbage\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+
+class TestTweetDeleter(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+        self.session = self.load_session()
+        self.session.set_review_statuses(self.session.tweets_df.index, "delete")
+
+    # Delete the tweets marked for deletion through a server, retrying failures after a short time. Returns the report
+    # of the deleter and the statistics of the server.
+    def delete_tweets(self, server, max_attempts=mtr.TweetDeleter.MAX_ATTEMPTS):
+        server, api_url, stop_server = start_in_thread(server)
+        try:
+            deleter = mtr.TweetDeleter(self.session, ACCESS_TOKEN, api_url, max_connections=2)
+            deleter.BACKOFF_SECONDS = 0.01
+            deleter.MAX_ATTEMPTS = max_attempts
+            return deleter.run(), server.stats
+        finally:
+            stop_server()
+
+    # IDs of the tweets recorded as deleted in the session.
+    def deleted_tweet_ids(self):
+        tweets_df = self.session.tweets_df
+        return sorted(tweets_df["tweet_id"][tweets_df["tweet_deleted"]].tolist())
+
+    def test_server_errors_are_retried(self):
+        report, stats = self.delete_tweets(MockTwitterServer(ACCESS_TOKEN, failure_rate=0.5, seed=1))
+        self.assertGreater(stats["failed"], 0)
+        self.assertEqual(report["retries"], stats["failed"])
+        self.assertEqual(report["deleted"], len(TWEETS))
+        self.assertEqual(self.deleted_tweet_ids(), sorted(tweet_id for _, tweet_id, _, _ in TWEETS))
+
+    def test_rate_limit_waits_for_retry_after(self):
+        report, stats = self.delete_tweets(MockTwitterServer(ACCESS_TOKEN, rate_limit=4, window_seconds=0.5))
+        self.assertGreater(report["rate_limited"], 0)
+        self.assertEqual(report["rate_limited"], stats["rate_limited"])
+        # The server asks for a wait of at least a second, which the deleter waits before trying again.
+        self.assertGreaterEqual(report["seconds"], 1.0)
+        self.assertEqual(report["deleted"], len(TWEETS))
+        self.assertEqual(report["failed"], 0)
+
+    def test_failed_deletions_are_not_marked_deleted(self):
+        report, stats = self.delete_tweets(MockTwitterServer(ACCESS_TOKEN, failure_rate=1.0), max_attempts=3)
+        self.assertEqual(report["failed"], len(TWEETS))
+        self.assertEqual(report["errors"], {"503": len(TWEETS)})
+        self.assertEqual(stats["requests"], 3 * len(TWEETS))
+        self.assertEqual(self.deleted_tweet_ids(), [])
+        self.assertEqual(len(self.session.tweets_df.index), len(TWEETS))
+
+    def test_malformed_response_does_not_stop_the_run(self):
+        report, _ = self.delete_tweets(MalformedTwitterServer(ACCESS_TOKEN), max_attempts=2)
+        self.assertEqual(report["failed"], len(TWEETS))
+        self.assertEqual(report["retries"], len(TWEETS))
+        self.assertEqual(self.deleted_tweet_ids(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""
+    File name: test_export_csv.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of exporting the data of My Tweet Reviewer GUI as CSV files.
+"""
+
+import unittest
+
+import pandas as pd
+from support import FolderTestCase, TWEETS, write_tweetjs
+
+
+class TestExportCsv(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+
+    def test_export_leaves_out_excluded_tweets(self):
+        session = self.load_session(["ff"])
+        rows = session.tweets_df.index[session.tweets_df["tweet_id"] == TWEETS[5][1]]
+        session.set_review_statuses(rows, "delete")
+        session.set_deleted_statuses(rows, True)
+        session.purge_deleted_tweets()
+        session.save_df_as_csv()
+        tweets_df = pd.read_csv(session.saved_filename)
+        self.assertEqual(tweets_df["tweet_id"].tolist(), [TWEETS[1][1], TWEETS[2][1], TWEETS[3][1]])
+        self.assertEqual(tweets_df["tweet_deleted"].tolist(), ["no"] * 3)
+        deleted_df = pd.read_csv(session.deleted_filename)
+        self.assertEqual(deleted_df["tweet_id"].tolist(), [TWEETS[5][1]])
+        # The excluded tweets are still in the save file.
+        session.close()
+        self.assertEqual(len(self.load_session().tweets_df.index), len(TWEETS) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
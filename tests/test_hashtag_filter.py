@@ -0,0 +1,60 @@
+"""
+    File name: test_hashtag_filter.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of the hashtag index of My Tweet Reviewer GUI and of excluding tweets by hashtag with it.
+"""
+
+import unittest
+
+import pandas as pd
+from support import FolderTestCase, TWEETS, mtr, write_tweetjs
+
+
+class TestHashtagIndex(unittest.TestCase):
+    def setUp(self):
+        # Tweets with row labels that don't start at zero, as after deleted tweets have been set aside.
+        self.tweets_df = pd.DataFrame({"tweet_id": [11, 12, 13, 14]}, index=[3, 5, 6, 9])
+        self.hashtags_df = pd.DataFrame({"tweet_id": [11, 11, 13, 14, 14, 99],
+                                         "hashtag": ["ff", "python", "ff", "data", "ff", "python"]})
+
+    def test_rows_with_hashtag(self):
+        hashtag_index = mtr.HashtagIndex(self.tweets_df, self.hashtags_df)
+        self.assertEqual(hashtag_index.rows_with("ff").tolist(), [3, 6, 9])
+        # Hashtags are looked up without regard to case, and hashtags of tweets not in the DataFrame are ignored.
+        self.assertEqual(hashtag_index.rows_with("Python").tolist(), [3])
+        self.assertEqual(hashtag_index.rows_with("missing").tolist(), [])
+
+    def test_rows_with_any_hashtag(self):
+        hashtag_index = mtr.HashtagIndex(self.tweets_df, self.hashtags_df)
+        self.assertEqual(hashtag_index.rows_with_any(["python", "DATA"]).tolist(), [3, 9])
+        self.assertEqual(hashtag_index.rows_with_any(["ff", "data"]).tolist(), [3, 6, 9])
+        self.assertEqual(hashtag_index.rows_with_any([]).tolist(), [])
+
+
+class TestExcludedHashtags(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+
+    def test_excluded_hashtags_filter_tweets(self):
+        session = self.load_session(["FF"])
+        self.assertEqual(sorted(session.excluded_tweets_df["tweet_id"].tolist()), [TWEETS[4][1], TWEETS[0][1]])
+        self.assertEqual(len(session.tweets_df.index), len(TWEETS) - 2)
+        self.assertEqual(session.status_counts.count(review_status="none"), len(TWEETS) - 2)
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[1][1]), "keep")
+        # Changing the excluded hashtags moves tweets in and out of the filter, keeping their review status.
+        session.set_excluded_hashtags(["python", "newyear"])
+        self.assertEqual(sorted(session.excluded_tweets_df["tweet_id"].tolist()), [TWEETS[3][1], TWEETS[1][1]])
+        self.assertEqual(self.review_statuses(session)[TWEETS[1][1]], "keep")
+        self.assertEqual(session.status_counts.count(review_status="none"), len(TWEETS) - 2)
+        self.assertEqual(session.status_counts.count(review_status="keep"), 0)
+        session.set_excluded_hashtags([])
+        self.assertEqual(len(session.excluded_tweets_df.index), 0)
+        self.assertEqual(session.tweets_df["tweet_id"].tolist(), [tweet_id for _, tweet_id, _, _ in TWEETS])
+        self.assertEqual(session.status_counts.count(review_status="keep"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
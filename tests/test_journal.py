@@ -0,0 +1,91 @@
+"""
+    File name: test_journal.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of replaying the journal of changes after My Tweet Reviewer GUI stops without saving, including a compaction
+    which didn't finish.
+"""
+
+import os
+import unittest
+
+from support import FolderTestCase, TWEETS, write_tweetjs
+
+
+class TestJournalReplay(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+
+    def test_replay_after_crash(self):
+        session = self.load_session()
+        tweets_df = session.tweets_df
+        session.set_review_status(self.row_of(tweets_df, TWEETS[0][1]), "keep")
+        session.set_review_statuses(tweets_df.index[(tweets_df["tweet_id"] <= TWEETS[4][1]).to_numpy()], "delete")
+        session.set_deleted(self.row_of(tweets_df, TWEETS[5][1]), False)
+        self.crash(session)
+        session = self.load_session()
+        statuses = self.review_statuses(session)
+        self.assertEqual(statuses[TWEETS[0][1]], "keep")
+        self.assertEqual([statuses[tweet_id] for _, tweet_id, _, _ in TWEETS[4:]], ["delete", "delete"])
+        self.assertEqual(session.status_counts.count(review_status="none"), 3)
+        self.assertEqual(session.status_counts.count(review_status="delete", url_visited=False), 1)
+        session.close()
+        # Closing folds the journal into the save file.
+        self.assertEqual(os.path.getsize(session.journal_filename), 0)
+        self.assertEqual(self.review_statuses(self.load_session()), statuses)
+
+    def test_replay_purge_restore_and_reset_in_order(self):
+        session = self.load_session()
+        row_index = self.row_of(session.tweets_df, TWEETS[1][1])
+        session.set_review_status(row_index, "delete")
+        session.set_deleted(row_index, True)
+        session.purge_deleted_tweets()
+        self.crash(session)
+        session = self.load_session()
+        self.assertEqual(session.deleted_tweets_df["tweet_id"].tolist(), [TWEETS[1][1]])
+        self.assertEqual(len(session.tweets_df.index), len(TWEETS) - 1)
+        session.restore_deleted_tweets()
+        session.reset_df()
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[2][1]), "keep")
+        self.crash(session)
+        session = self.load_session()
+        self.assertEqual(len(session.deleted_tweets_df.index), 0)
+        self.assertFalse(session.tweets_df["tweet_deleted"].any())
+        self.assertEqual(self.review_statuses(session),
+                         {tweet_id: "keep" if tweet_id == TWEETS[2][1] else "none" for _, tweet_id, _, _ in TWEETS})
+        session.close()
+
+    def test_replay_interrupted_compaction(self):
+        session = self.load_session()
+        row_index = self.row_of(session.tweets_df, TWEETS[3][1])
+        session.set_review_status(row_index, "keep")
+        # Move the journal aside as compact_journal does, then stop before the save file is written.
+        session.sync_journal()
+        session.journal_file.close()
+        os.replace(session.journal_filename, session.compacting_journal_filename)
+        session.journal_file = open(session.journal_filename, mode='a', encoding="UTF-8")
+        session.set_review_status(row_index, "delete")
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[0][1]), "keep")
+        self.crash(session)
+        session = self.load_session()
+        statuses = self.review_statuses(session)
+        self.assertEqual(statuses[TWEETS[3][1]], "delete")
+        self.assertEqual(statuses[TWEETS[0][1]], "keep")
+        session.close()
+        self.assertFalse(os.path.exists(session.compacting_journal_filename))
+        self.assertEqual(self.review_statuses(self.load_session()), statuses)
+
+    def test_partly_written_record_ends_journal(self):
+        session = self.load_session()
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[0][1]), "keep")
+        session.journal_file.write('{"op": "set", "tweet_id": ')
+        self.crash(session)
+        session = self.load_session()
+        self.assertEqual(self.review_statuses(session)[TWEETS[0][1]], "keep")
+        session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
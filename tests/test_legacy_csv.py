@@ -0,0 +1,94 @@
+"""
+    File name: test_legacy_csv.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of converting a CSV save file from an earlier version of My Tweet Reviewer GUI to the save file.
+"""
+
+import json
+import os
+import unittest
+
+from support import FolderTestCase, TWEETS, write_tweetjs
+
+
+class TestLegacyCsv(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+
+    # Write a CSV save file as an earlier version of the program did, then remove every other file written by the
+    # program. Tweets which were purged, or excluded with a hashtag, are left out of it.
+    def write_legacy_csv(self, purged_tweet_ids, excluded_hashtags=None):
+        session = self.load_session(excluded_hashtags)
+        rows = session.tweets_df.index[session.tweets_df["tweet_id"].isin(purged_tweet_ids).to_numpy()]
+        session.set_review_statuses(rows, "delete")
+        session.set_deleted_statuses(rows, True)
+        session.purge_deleted_tweets()
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[2][1]), "keep")
+        session.close()
+        session.tweets_to_csv_columns(session.tweets_df).to_csv(session.saved_filename, index=None, header=True)
+        for filename in os.listdir(os.curdir):
+            if filename.startswith("my_tweet_review.") and filename != session.saved_filename:
+                os.remove(filename)
+
+    def test_legacy_csv_does_not_bring_back_purged_tweets(self):
+        self.write_legacy_csv([TWEETS[4][1], TWEETS[5][1]], excluded_hashtags=["newyear"])
+        session = self.load_session(["newyear"])
+        self.assertTrue(session.converted_csv)
+        self.assertEqual(session.new_tweet_count, 0)
+        self.assertEqual(session.converted_deleted_count, 2)
+        # The purged tweets are kept aside as deleted, and the excluded tweets are excluded again.
+        self.assertEqual(sorted(session.deleted_tweets_df["tweet_id"].tolist()), [TWEETS[5][1], TWEETS[4][1]])
+        self.assertEqual(session.excluded_tweets_df["tweet_id"].tolist(), [TWEETS[3][1]])
+        self.assertEqual(self.review_statuses(session)[TWEETS[2][1]], "keep")
+        self.assertEqual(session.status_counts.count(review_status="none"), 2)
+        self.assertTrue(os.path.exists(session.snapshot_filename))
+        self.assertTrue(os.path.exists(session.fingerprint_filename))
+        session.close()
+        # Tweets added to tweet.js after the conversion are merged.
+        new_tweet = ("Sun Jul 28 10:00:00 +0000 2019", 1155000000000000007, "A newer tweet", [])
+        write_tweetjs([new_tweet] + TWEETS)
+        session = self.load_session(["newyear"])
+        self.assertFalse(session.converted_csv)
+        self.assertEqual(session.new_tweet_count, 1)
+        self.assertEqual(self.review_statuses(session)[new_tweet[1]], "none")
+        self.assertEqual(session.status_counts.count(review_status="none"), 3)
+        self.assertEqual(len(session.deleted_tweets_df.index), 2)
+        session.close()
+
+    def test_tweets_newer_than_legacy_csv_are_new(self):
+        self.write_legacy_csv([TWEETS[3][1]])
+        # Tweets posted after the CSV file was written are in tweet.js when it is converted.
+        new_tweets = [("Mon Jul 29 10:00:00 +0000 2019", 1155000000000000008, "The newest tweet", []),
+                      ("Sun Jul 28 10:00:00 +0000 2019", 1155000000000000007, "A newer tweet", [])]
+        write_tweetjs(new_tweets + TWEETS)
+        session = self.load_session()
+        self.assertTrue(session.converted_csv)
+        self.assertEqual(session.new_tweet_count, 2)
+        self.assertEqual(session.converted_deleted_count, 1)
+        self.assertEqual(session.deleted_tweets_df["tweet_id"].tolist(), [TWEETS[3][1]])
+        review_statuses = self.review_statuses(session)
+        self.assertEqual([review_statuses[tweet_id] for _, tweet_id, _, _ in new_tweets], ["none", "none"])
+        session.close()
+        session = self.load_session()
+        self.assertEqual(session.new_tweet_count, 0)
+        self.assertEqual(len(session.tweets_df.index), len(TWEETS) + 1)
+        session.close()
+
+    def test_legacy_csv_with_journal(self):
+        self.write_legacy_csv([TWEETS[1][1]])
+        with open("my_tweet_review.journal", mode='w', encoding="UTF-8") as journal_file:
+            journal_file.write(json.dumps({"op": "set", "tweet_id": TWEETS[3][1], "column": "tweet_review_status",
+                                           "value": "delete"}) + "\n")
+        session = self.load_session()
+        self.assertEqual(self.review_statuses(session)[TWEETS[3][1]], "delete")
+        # The journal is only removed once the change is in the new save file.
+        self.assertEqual(os.path.getsize(session.journal_filename), 0)
+        session.close()
+        self.assertEqual(self.review_statuses(self.load_session())[TWEETS[3][1]], "delete")
+
+
+if __name__ == "__main__":
+    unittest.main()
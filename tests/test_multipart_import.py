@@ -0,0 +1,62 @@
+"""
+    File name: test_multipart_import.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of importing a Twitter archive split over several tweet.js files, each parsed in a process of its own, with
+    My Tweet Reviewer GUI.
+"""
+
+import os
+import unittest
+
+import numpy as np
+from support import FolderTestCase, TWEETS, USERNAME, mtr, write_tweetjs
+
+
+class TestMultipartImport(FolderTestCase):
+    # Write the tweets to tweet.js as a single file, import them and then remove the file, returning the columns.
+    def import_single_file(self, tweets):
+        write_tweetjs(tweets)
+        tweets_columns = mtr.TweetSession(USERNAME).import_raw_tweets_data()
+        os.remove("tweet.js")
+        return tweets_columns
+
+    def test_parts_found_in_part_order(self):
+        for tweetjs_filename in ["tweet-part10.js", "tweet-part2.js", "tweet-part1.js", "tweet-part.js", "tweet.js"]:
+            write_tweetjs([], tweetjs_filename)
+        self.assertEqual(mtr.TweetSession(USERNAME).tweetjs_filenames(),
+                         ["tweet.js", "tweet-part1.js", "tweet-part2.js", "tweet-part10.js"])
+
+    def test_parts_import_same_columns_as_single_file(self):
+        expected_columns = self.import_single_file(TWEETS)
+        write_tweetjs(TWEETS[:2])
+        write_tweetjs(TWEETS[2:5], "tweet-part1.js")
+        write_tweetjs(TWEETS[5:], "tweet-part2.js")
+        session = mtr.TweetSession(USERNAME)
+        tweets_columns = session.import_raw_tweets_data()
+        for col_name in ["tweet_created", "tweet_id", "hashtag_count"]:
+            np.testing.assert_array_equal(tweets_columns[col_name], expected_columns[col_name])
+        for col_name in ["tweet_text", "hashtag"]:
+            self.assertEqual(tweets_columns[col_name], expected_columns[col_name])
+        # Tweets already known are left out of every part.
+        known_tweet_ids = np.array(sorted(tweet_id for _, tweet_id, _, _ in TWEETS[1:4]), dtype=np.int64)
+        new_columns = session.import_raw_tweets_data(known_tweet_ids)
+        self.assertEqual(new_columns["tweet_id"].tolist(),
+                         [tweet_id for _, tweet_id, _, _ in TWEETS[:1] + TWEETS[4:]])
+
+    def test_new_part_is_merged(self):
+        write_tweetjs(TWEETS[2:], "tweet-part1.js")
+        session = self.load_session()
+        self.assertEqual(len(session.tweets_df.index), len(TWEETS) - 2)
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[2][1]), "keep")
+        session.close()
+        write_tweetjs(TWEETS[:2], "tweet-part2.js")
+        session = self.load_session()
+        self.assertEqual(session.new_tweet_count, 2)
+        self.assertEqual(session.tweets_df["tweet_id"].tolist(), [tweet_id for _, tweet_id, _, _ in TWEETS])
+        self.assertEqual(self.review_statuses(session)[TWEETS[2][1]], "keep")
+
+
+if __name__ == "__main__":
+    unittest.main()
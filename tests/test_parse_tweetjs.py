@@ -0,0 +1,71 @@
+"""
+    File name: test_parse_tweetjs.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of parsing the tweet.js files of a Twitter archive with My Tweet Reviewer GUI.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from support import FolderTestCase, TWEETS, mtr, write_tweetjs
+
+
+class TestParseTweetjs(FolderTestCase):
+    def test_parse_tweetjs_dates_matches_pandas(self):
+        created_ats = [created_at for created_at, _, _, _ in TWEETS] + ["Sun Feb 29 23:30:00 -0530 2004",
+                                                                          "Mon Oct 10 01:02:03 +1245 2011"]
+        expected = pd.to_datetime(created_ats, format=mtr.TweetSession.TWEETJS_DATE_FORMAT,
+                                  utc=True).tz_convert(None).to_numpy(dtype="datetime64[ns]")
+        np.testing.assert_array_equal(mtr.TweetSession.parse_tweetjs_dates(created_ats), expected)
+
+    def test_parse_tweetjs_dates_falls_back_to_format(self):
+        # A day without a leading zero doesn't have the fixed layout, but is still a valid date.
+        created_ats = ["Mon Jan 7 10:00:00 +0000 2019", "Tue Jan 08 10:00:00 +0100 2019"]
+        np.testing.assert_array_equal(mtr.TweetSession.parse_tweetjs_dates(created_ats),
+                                      np.array(["2019-01-07T10:00:00", "2019-01-08T09:00:00"], dtype="datetime64[ns]"))
+
+    def test_parse_tweetjs_dates_checks_day_of_month(self):
+        # Days past the end of the month have the fixed layout, but must not roll over into the next month.
+        for created_at in ["Sun Feb 30 10:00:00 +0000 2020", "Fri Feb 29 10:00:00 +0000 2019",
+                           "Thu Apr 31 10:00:00 +0000 2019"]:
+            with self.assertRaises(ValueError):
+                mtr.TweetSession.parse_tweetjs_dates(["Tue Jan 08 10:00:00 +0100 2019", created_at])
+        np.testing.assert_array_equal(mtr.TweetSession.parse_tweetjs_dates(["Sat Feb 29 10:00:00 +0000 2020",
+                                                                            "Tue Dec 31 10:00:00 +0000 2019"]),
+                                      np.array(["2020-02-29T10:00:00", "2019-12-31T10:00:00"], dtype="datetime64[ns]"))
+
+    def test_parse_tweetjs_dates_with_no_dates(self):
+        self.assertEqual(len(mtr.TweetSession.parse_tweetjs_dates([])), 0)
+
+    def test_fold_to_ascii(self):
+        self.assertEqual(mtr.TweetSession.fold_to_ascii(["café \U0001F600!", "naïve", "plain", ""]),
+                         ["caf !", "nave", "plain", ""])
+        # A string containing a null character is folded on its own.
+        self.assertEqual(mtr.TweetSession.fold_to_ascii(["a\0b", "über"]), ["a\0b", "ber"])
+        self.assertEqual(mtr.TweetSession.fold_to_ascii([]), [])
+
+    def test_batches_give_same_columns(self):
+        write_tweetjs(TWEETS)
+        tweets_columns = mtr.TweetSession.parse_tweetjs_file("tweet.js")
+        batch_size = mtr.TweetSession.TWEETJS_BATCH_SIZE
+        mtr.TweetSession.TWEETJS_BATCH_SIZE = 4
+        try:
+            batched_columns = mtr.TweetSession.parse_tweetjs_file("tweet.js")
+            known_tweet_ids = np.array(sorted(tweet_id for _, tweet_id, _, _ in TWEETS[1::2]), dtype=np.int64)
+            new_columns = mtr.TweetSession.parse_tweetjs_file("tweet.js", known_tweet_ids)
+        finally:
+            mtr.TweetSession.TWEETJS_BATCH_SIZE = batch_size
+        for col_name in ["tweet_created", "tweet_id", "hashtag_count"]:
+            np.testing.assert_array_equal(batched_columns[col_name], tweets_columns[col_name])
+        for col_name in ["tweet_text", "hashtag"]:
+            self.assertEqual(batched_columns[col_name], tweets_columns[col_name])
+        self.assertEqual(tweets_columns["tweet_text"][0], "Off to the caf  #FF")
+        self.assertEqual(new_columns["tweet_id"].tolist(), [tweet_id for _, tweet_id, _, _ in TWEETS[0::2]])
+        self.assertEqual(new_columns["hashtag"], ["FF", "FF"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+    File name: test_rules.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of classifying tweets with a rule file in My Tweet Reviewer GUI.
+"""
+
+import contextlib
+import io
+import json
+import unittest
+
+from support import FolderTestCase, TWEETS, USERNAME, mtr, write_tweetjs
+
+RULES = [{"name": "keep projects", "status": "keep", "hashtags": ["Python"]},
+         {"name": "old retweets", "status": "delete", "retweet": True, "created_before": "2019-01-01"},
+         {"name": "replies", "status": "delete", "reply": True},
+         {"name": "birthdays", "status": "keep", "text_pattern": "happy\\s+birthday"},
+         {"status": "delete", "text_pattern": "HAPPY"}]
+
+
+class TestTweetRules(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+
+    def test_invalid_rules(self):
+        for rule in [{"status": "keep", "colour": "blue"}, {"status": "maybe"}, {"hashtags": ["ff"]},
+                     {"status": "keep", "text_pattern": "("}, {"status": "keep", "created_from": "not a date"}]:
+            with self.assertRaises(ValueError):
+                mtr.TweetRules([rule])
+
+    def test_first_matching_rule_sets_status(self):
+        session = self.load_session()
+        report = mtr.TweetRules(RULES).apply(session)
+        self.assertEqual([(rule_report["name"], rule_report["matched"], rule_report["classified"])
+                          for rule_report in report],
+                         [("keep projects", 1, 1), ("old retweets", 1, 1), ("replies", 1, 1), ("birthdays", 1, 1),
+                          ("rule 5", 2, 0), ("write", 4, 4)])
+        self.assertEqual(self.review_statuses(session),
+                         {TWEETS[0][1]: "none", TWEETS[1][1]: "keep", TWEETS[2][1]: "keep", TWEETS[3][1]: "delete",
+                          TWEETS[4][1]: "delete", TWEETS[5][1]: "none"})
+        self.assertEqual(session.status_counts.count(review_status="delete"), 2)
+        session.close()
+        self.assertEqual(self.review_statuses(self.load_session())[TWEETS[3][1]], "delete")
+
+    def test_reviewed_tweets_only_changed_when_included(self):
+        session = self.load_session()
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[0][1]), "keep")
+        rule = {"status": "delete", "hashtags": ["ff"], "created_from": "2018-12-12T23:00:00-01:00"}
+        report = mtr.TweetRules([rule]).apply(session)
+        self.assertEqual((report[0]["matched"], report[0]["classified"]), (1, 0))
+        self.assertEqual(self.review_statuses(session)[TWEETS[0][1]], "keep")
+        report = mtr.TweetRules([dict(rule, include_reviewed=True)]).apply(session)
+        self.assertEqual((report[0]["matched"], report[0]["classified"]), (1, 1))
+        self.assertEqual(self.review_statuses(session)[TWEETS[0][1]], "delete")
+        self.assertEqual(self.review_statuses(session)[TWEETS[4][1]], "none")
+
+    def test_dry_run_changes_nothing(self):
+        session = self.load_session()
+        report = mtr.TweetRules(RULES).apply(session, dry_run=True)
+        self.assertEqual(report[-1]["classified"], 4)
+        self.assertEqual(set(self.review_statuses(session).values()), {"none"})
+        self.assertEqual(session.journal_records, 0)
+
+    def test_classify_with_rule_file(self):
+        with open("rules.json", mode='w', encoding="UTF-8") as rules_file:
+            json.dump(RULES, rules_file)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            mtr.classify(USERNAME, "rules.json", excluded_hashtags=["newyear"])
+        self.assertIn("replies: 0 matched, 0 classified as delete", output.getvalue())
+        self.assertIn("Classified 3 of 3 matched tweets in total", output.getvalue())
+        review_statuses = self.review_statuses(self.load_session(["newyear"]))
+        self.assertEqual(review_statuses[TWEETS[3][1]], "none")
+        self.assertEqual(review_statuses[TWEETS[4][1]], "delete")
+
+
+if __name__ == "__main__":
+    unittest.main()
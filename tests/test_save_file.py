@@ -0,0 +1,76 @@
+"""
+    File name: test_save_file.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of writing and reading the save file of My Tweet Reviewer GUI, in both the .parquet and the .npz format.
+"""
+
+import os
+import unittest
+
+import numpy as np
+from support import FolderTestCase, TWEETS, USERNAME, mtr, write_tweetjs
+
+
+class TestSaveFile(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+
+    # Create a session saving to a .npz save file, whether or not pyarrow is installed, and load the data.
+    def load_npz_session(self):
+        session = mtr.TweetSession(USERNAME)
+        self.sessions.append(session)
+        session.snapshot_filename = session.npz_snapshot_filename
+        session.load_df()
+        return session
+
+    def test_npz_save_file_keeps_null_characters(self):
+        null_tweet = ("Sun Jul 28 10:00:00 +0000 2019", 1155000000000000007, "Before\0after \0", ["Null\0tag"])
+        write_tweetjs([null_tweet] + TWEETS)
+        session = self.load_npz_session()
+        tweet_texts = session.all_tweets_df()["tweet_text"].tolist()
+        hashtags = session.hashtags_df["hashtag"].tolist()
+        session.close()
+        snapshot_df, hashtags_df = session.read_snapshot(session.npz_snapshot_filename)
+        self.assertEqual(snapshot_df["tweet_text"].tolist(), tweet_texts)
+        self.assertEqual(tweet_texts[0], null_tweet[2])
+        self.assertEqual(hashtags_df["hashtag"].tolist(), hashtags)
+        session = self.load_session()
+        self.assertEqual(session.all_tweets_df()["tweet_text"].tolist()[0], null_tweet[2])
+        self.assertEqual(session.search_tweets("after").tolist(), [self.row_of(session.tweets_df, null_tweet[1])])
+
+    def test_decode_strings_checks_count(self):
+        encoded_strings, string_offsets = mtr.TweetSession.encode_strings(["a\0b", "", "naïve"])
+        self.assertEqual(mtr.TweetSession.decode_strings(encoded_strings, 3, string_offsets), ["a\0b", "", "naïve"])
+        with self.assertRaises(ValueError):
+            mtr.TweetSession.decode_strings(encoded_strings, 4, string_offsets)
+        with self.assertRaises(ValueError):
+            mtr.TweetSession.decode_strings(np.frombuffer(b"a\0b", dtype=np.uint8), 1)
+
+    @unittest.skipIf(mtr.pa is None, "pyarrow is not installed")
+    def test_npz_save_file_converted_to_parquet(self):
+        session = self.load_npz_session()
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[0][1]), "keep")
+        self.crash(session)
+        session = self.load_session()
+        self.assertTrue(session.snapshot_filename.endswith(".parquet"))
+        self.assertTrue(os.path.exists(session.snapshot_filename))
+        self.assertEqual(self.review_statuses(session)[TWEETS[0][1]], "keep")
+        session.close()
+        self.assertEqual(self.review_statuses(self.load_session())[TWEETS[0][1]], "keep")
+
+    def test_archive_with_no_tweets(self):
+        write_tweetjs([])
+        session = self.load_session()
+        self.assertEqual(len(session.tweets_df.index), 0)
+        self.assertEqual(session.search_tweets("anything").tolist(), [])
+        session.close()
+        session = self.load_session()
+        self.assertEqual(len(session.tweets_df.index), 0)
+        session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
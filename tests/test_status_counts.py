@@ -0,0 +1,54 @@
+"""
+    File name: test_status_counts.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of the counts of tweets in each state kept by My Tweet Reviewer GUI as tweets are updated.
+"""
+
+import unittest
+
+from support import FolderTestCase, TWEETS, mtr, write_tweetjs
+
+
+class TestStatusCounts(FolderTestCase):
+    def setUp(self):
+        super().setUp()
+        write_tweetjs(TWEETS)
+
+    def test_counts_by_status_hashtag_and_year(self):
+        session = self.load_session()
+        status_counts = session.status_counts
+        self.assertEqual(status_counts.count(), len(TWEETS))
+        self.assertEqual(status_counts.count(review_status="none", hashtag="FF"), 2)
+        self.assertEqual(status_counts.count_by_year(), {2018: 2, 2019: 4})
+        self.assertEqual(status_counts.count_by_hashtag(), {"ff": 2, "python": 1, "data": 1, "newyear": 1})
+        session.set_review_status(self.row_of(session.tweets_df, TWEETS[0][1]), "delete")
+        self.assertEqual(status_counts.count(review_status="delete", hashtag="ff"), 1)
+        self.assertEqual(status_counts.count(review_status="delete", year=2019), 1)
+        self.assertEqual(status_counts.count(review_status="none", url_visited=False), len(TWEETS) - 1)
+        self.assertEqual(status_counts.count(deleted=True), 0)
+
+    def test_batch_updates_keep_counts(self):
+        session = self.load_session()
+        move_tweets_limit = session.MOVE_TWEETS_LIMIT
+        session.set_review_statuses(session.tweets_df.index[:2], "keep")
+        session.MOVE_TWEETS_LIMIT = 1
+        session.set_review_statuses(session.tweets_df.index[1:4], "delete")
+        session.set_deleted_statuses(session.tweets_df.index[3:4], True)
+        session.MOVE_TWEETS_LIMIT = move_tweets_limit
+        session.set_deleted_statuses(session.tweets_df.index[1:2], True)
+        status_counts = mtr.StatusCounts(session.tweets_df, session.hashtags_df)
+        for hashtag in [None, "ff", "python", "newyear"]:
+            for review_status in session.REVIEW_STATUS_CATEGORIES:
+                self.assertEqual(session.status_counts.count(review_status=review_status, hashtag=hashtag),
+                                 status_counts.count(review_status=review_status, hashtag=hashtag))
+            self.assertEqual(session.status_counts.count(deleted=True, hashtag=hashtag),
+                             status_counts.count(deleted=True, hashtag=hashtag))
+        self.assertEqual(session.status_counts.count_by_year(review_status="delete"),
+                         status_counts.count_by_year(review_status="delete"))
+        session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
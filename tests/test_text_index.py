@@ -0,0 +1,69 @@
+"""
+    File name: test_text_index.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of searching the text of the tweets with the text index of My Tweet Reviewer GUI.
+"""
+
+import os
+import unittest
+
+import pandas as pd
+from support import FolderTestCase, TWEETS, mtr, write_tweetjs
+
+
+class TestTextIndex(unittest.TestCase):
+    def setUp(self):
+        self.text_index = mtr.TextIndex(pd.Series(["The quick brown fox", "Quick thinking", "brown bread and jam",
+                                                   "A fox, brown and quick", ""], index=[10, 11, 12, 13, 14]))
+
+    def search(self, query):
+        return self.text_index.search(query).tolist()
+
+    def test_words(self):
+        self.assertEqual(self.search("quick"), [10, 11, 13])
+        self.assertEqual(self.search("FOX brown"), [10, 13])
+        self.assertEqual(self.search("missing"), [])
+
+    def test_prefix(self):
+        self.assertEqual(self.search("qui*"), [10, 11, 13])
+        self.assertEqual(self.search("br*"), [10, 12, 13])
+
+    def test_phrases(self):
+        self.assertEqual(self.search('"brown fox"'), [10])
+        self.assertEqual(self.search('"brown quick"'), [])
+        self.assertEqual(self.search('"quick brown fox"'), [10])
+        self.assertEqual(self.search('"fox brown"'), [13])
+
+    def test_or(self):
+        self.assertEqual(self.search("thinking OR jam"), [11, 12])
+        self.assertEqual(self.search("OR"), [])
+
+    def test_no_tweets(self):
+        text_index = mtr.TextIndex(pd.Series([], dtype=float))
+        self.assertEqual(text_index.search("anything").tolist(), [])
+        self.assertEqual(text_index.search('"any thing" any*').tolist(), [])
+
+
+class TestSearchTweets(FolderTestCase):
+    def test_search_tweets_leaves_out_excluded_and_deleted_tweets(self):
+        write_tweetjs(TWEETS)
+        session = self.load_session(["ff"])
+        self.assertTrue(os.path.exists(session.text_index_filename))
+        rows = session.tweets_df.index[session.tweets_df["tweet_id"] == TWEETS[3][1]]
+        session.set_review_statuses(rows, "delete")
+        session.set_deleted_statuses(rows, True)
+        session.purge_deleted_tweets()
+        self.assertEqual(session.search_tweets("happy").tolist(), [self.row_of(session.tweets_df, TWEETS[2][1])])
+        self.assertEqual(session.search_tweets("news").tolist(), [])
+        session.close()
+        # The saved text index is used again, and finds the same tweets.
+        session = self.load_session(["ff"])
+        self.assertEqual(session.search_tweets("happy").tolist(), [self.row_of(session.tweets_df, TWEETS[2][1])])
+        self.assertEqual(session.search_tweets("data OR caf*").tolist(),
+                         [self.row_of(session.tweets_df, TWEETS[1][1])])
+
+
+if __name__ == "__main__":
+    unittest.main()
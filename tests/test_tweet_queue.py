@@ -0,0 +1,50 @@
+"""
+    File name: test_tweet_queue.py
+    Date created: 17/10/2026
+    Python Version: 3.7.3
+
+    Tests of the queue of tweets stepped through by the review and delete windows of My Tweet Reviewer GUI.
+"""
+
+import unittest
+
+import pandas as pd
+from support import mtr
+
+
+class TestTweetQueue(unittest.TestCase):
+    def setUp(self):
+        self.tweet_queue = mtr.TweetQueue(pd.Index([4, 7, 8, 12]))
+
+    def test_next_steps_through_rows_in_order(self):
+        self.assertIsNone(self.tweet_queue.current())
+        self.assertFalse(self.tweet_queue.has_previous())
+        self.assertEqual([self.tweet_queue.next() for _ in range(4)], [4, 7, 8, 12])
+        self.assertTrue(self.tweet_queue.has_previous())
+        # Moving past the end leaves the cursor off the queue.
+        self.assertIsNone(self.tweet_queue.next())
+        self.assertIsNone(self.tweet_queue.next())
+        self.assertEqual(self.tweet_queue.previous(), 12)
+
+    def test_next_passes_over_finished_rows(self):
+        self.tweet_queue.mark_finished(7)
+        self.tweet_queue.mark_finished(8)
+        self.assertEqual(self.tweet_queue.next(), 4)
+        self.assertEqual(self.tweet_queue.next(), 12)
+        # Moving back visits the finished rows, so a decision can be changed.
+        self.assertEqual(self.tweet_queue.previous(), 8)
+        self.assertEqual(self.tweet_queue.previous(), 7)
+        self.assertEqual(self.tweet_queue.previous(), 4)
+        self.assertFalse(self.tweet_queue.has_previous())
+        self.assertEqual(self.tweet_queue.previous(), 4)
+        self.assertEqual(self.tweet_queue.next(), 12)
+
+    def test_empty_queue(self):
+        tweet_queue = mtr.TweetQueue(pd.Index([], dtype="int64"))
+        self.assertIsNone(tweet_queue.next())
+        self.assertIsNone(tweet_queue.previous())
+        self.assertFalse(tweet_queue.has_previous())
+
+
+if __name__ == "__main__":
+    unittest.main()